@@ -22,15 +22,29 @@ def unpublish_topics_for_resource(resource):
     Args:
         resource(LearningResource): The resource that was unpublished
     """
+    unpublish_topics_for_resources([resource.id])
+
+
+def unpublish_topics_for_resources(resource_ids):
+    """
+    Unpublish channels for topics that are used exclusively by the resources
+
+    Args:
+        resource_ids(list of int): The ids of the resources that were unpublished
+    """
     other_published = LearningResource.objects.filter(
         published=True,
-    ).exclude(id=resource.id)
+    ).exclude(id__in=resource_ids)
 
-    channels = Channel.objects.filter(
-        topic_detail__topic__in=resource.topics.all(),
-        channel_type=ChannelType.topic.name,  # Redundant, but left for clarity
-        published=True,
-    ).exclude(topic_detail__topic__learningresource__in=other_published)
+    channels = (
+        Channel.objects.filter(
+            topic_detail__topic__learningresource__in=resource_ids,
+            channel_type=ChannelType.topic.name,  # Redundant, but left for clarity
+            published=True,
+        )
+        .exclude(topic_detail__topic__learningresource__in=other_published)
+        .distinct()
+    )
 
     for channel in channels:
         channel.published = False
@@ -176,6 +190,25 @@ class ChannelPlugin:
             channel.published = True
             channel.save()
 
+    @hookimpl
+    def bulk_resources_upserted(self, resource_ids, resource_type, percolate_ids):  # noqa: ARG002
+        """
+        Publish channels for the resources' topics
+        """
+        channels = Channel.objects.filter(
+            topic_detail__topic__learningresource__in=resource_ids, published=False
+        ).distinct()
+        for channel in channels:
+            channel.published = True
+            channel.save()
+
+    @hookimpl
+    def bulk_resources_unpublished(self, resource_ids, resource_type):  # noqa: ARG002
+        """
+        Unpublish channels for the resources' topics
+        """
+        unpublish_topics_for_resources(resource_ids)
+
     @hookimpl
     def resource_before_delete(self, resource):
         """
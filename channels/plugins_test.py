@@ -225,3 +225,60 @@ def test_resource_upserted():
     assert channel1.published is True
     assert channel2.published is True
     assert channel3.published is False
+
+
+@pytest.mark.django_db
+def test_bulk_resources_upserted():
+    """
+    Test that channels are published when multiple resources are created or updated
+    """
+    channel1 = ChannelFactory.create(is_topic=True, published=False)
+    channel2 = ChannelFactory.create(is_topic=True, published=False)
+    channel3 = ChannelFactory.create(is_topic=True, published=False)
+
+    resources = [
+        LearningResourceFactory.create(topics=[channel1.topic_detail.topic]),
+        LearningResourceFactory.create(topics=[channel2.topic_detail.topic]),
+    ]
+    ChannelPlugin().bulk_resources_upserted(
+        [resource.id for resource in resources], "course", []
+    )
+
+    channel1.refresh_from_db()
+    channel2.refresh_from_db()
+    channel3.refresh_from_db()
+
+    assert channel1.published is True
+    assert channel2.published is True
+    assert channel3.published is False
+
+
+@pytest.mark.django_db
+def test_bulk_resources_unpublished():
+    """
+    Test that topic channels are unpublished when multiple resources are unpublished
+    and no published resources remain for them
+    """
+    channel1 = ChannelFactory.create(is_topic=True)
+    channel2 = ChannelFactory.create(is_topic=True)
+    channel3 = ChannelFactory.create(is_topic=True)
+    topic1, topic2, topic3 = (
+        channel.topic_detail.topic for channel in (channel1, channel2, channel3)
+    )
+    resources = [
+        LearningResourceFactory.create(topics=[topic1, topic2], published=False),
+        LearningResourceFactory.create(topics=[topic1], published=False),
+    ]
+    LearningResourceFactory.create(topics=[topic2])
+    LearningResourceFactory.create(topics=[topic3], published=False)
+
+    ChannelPlugin().bulk_resources_unpublished(
+        [resource.id for resource in resources], "course"
+    )
+
+    channel1.refresh_from_db()
+    channel2.refresh_from_db()
+    channel3.refresh_from_db()
+    assert channel1.published is False
+    assert channel2.published is True
+    assert channel3.published is True
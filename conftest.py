@@ -28,4 +28,7 @@ def _use_dummy_redis_cache_backend(settings):
     new_cache_settings["redis"] = {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
     }
+    new_cache_settings["extracted_text"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
     settings.CACHES = new_cache_settings
@@ -3413,6 +3413,31 @@ export interface PaginatedVideoResourceList {
    */
   results: Array<VideoResource>
 }
+/**
+ * * `offset` - offset * `cursor` - cursor
+ * @export
+ * @enum {string}
+ */
+
+export const PaginationEnumDescriptions = {
+  offset: "offset",
+  cursor: "cursor",
+} as const
+
+export const PaginationEnum = {
+  /**
+   * offset
+   */
+  Offset: "offset",
+  /**
+   * cursor
+   */
+  Cursor: "cursor",
+} as const
+
+export type PaginationEnum =
+  (typeof PaginationEnum)[keyof typeof PaginationEnum]
+
 /**
  * Serializer for LearningResourceInstructor model
  * @export
@@ -3724,6 +3749,18 @@ export interface PercolateQuerySubscriptionRequestRequest {
    * @memberof PercolateQuerySubscriptionRequestRequest
    */
   limit?: number
+  /**
+   *
+   * @type {PaginationEnum}
+   * @memberof PercolateQuerySubscriptionRequestRequest
+   */
+  pagination?: PaginationEnum
+  /**
+   * The cursor of the page to return, from the next url of a search using cursor pagination
+   * @type {string}
+   * @memberof PercolateQuerySubscriptionRequestRequest
+   */
+  cursor?: string
   /**
    * The organization that offers the learning resource               * `mitx` - MITx * `ocw` - MIT OpenCourseWare * `bootcamps` - Bootcamps * `xpro` - MIT xPRO * `mitpe` - MIT Professional Education * `see` - MIT Sloan Executive Education
    * @type {Array<OfferedByEnum>}
@@ -7451,12 +7488,14 @@ export const ContentFileSearchApiAxiosParamCreator = function (
      * @summary Search
      * @param {Array<ContentFileSearchRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {Array<string>} [content_feature_type] The feature type of the content file. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
      * @param {Array<number>} [id] The id value for the content file
      * @param {number} [limit] Number of results to return per page
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<ContentFileSearchRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {ContentFileSearchRetrievePaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<ContentFileSearchRetrievePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {string} [q] The search text
      * @param {Array<number>} [resource_id] The id value of the parent learning resource for the content file
@@ -7469,12 +7508,14 @@ export const ContentFileSearchApiAxiosParamCreator = function (
     contentFileSearchRetrieve: async (
       aggregations?: Array<ContentFileSearchRetrieveAggregationsEnum>,
       content_feature_type?: Array<string>,
+      cursor?: string,
       dev_mode?: boolean | null,
       id?: Array<number>,
       limit?: number,
       ocw_topic?: Array<string>,
       offered_by?: Array<ContentFileSearchRetrieveOfferedByEnum>,
       offset?: number,
+      pagination?: ContentFileSearchRetrievePaginationEnum,
       platform?: Array<ContentFileSearchRetrievePlatformEnum>,
       q?: string,
       resource_id?: Array<number>,
@@ -7507,6 +7548,10 @@ export const ContentFileSearchApiAxiosParamCreator = function (
         localVarQueryParameter["content_feature_type"] = content_feature_type
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (dev_mode !== undefined) {
         localVarQueryParameter["dev_mode"] = dev_mode
       }
@@ -7531,6 +7576,10 @@ export const ContentFileSearchApiAxiosParamCreator = function (
         localVarQueryParameter["offset"] = offset
       }
 
+      if (pagination !== undefined) {
+        localVarQueryParameter["pagination"] = pagination
+      }
+
       if (platform) {
         localVarQueryParameter["platform"] = platform
       }
@@ -7585,12 +7634,14 @@ export const ContentFileSearchApiFp = function (configuration?: Configuration) {
      * @summary Search
      * @param {Array<ContentFileSearchRetrieveAggregationsEnum>} [aggregations] Show resource counts by category
      * @param {Array<string>} [content_feature_type] The feature type of the content file. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
      * @param {Array<number>} [id] The id value for the content file
      * @param {number} [limit] Number of results to return per page
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<ContentFileSearchRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {ContentFileSearchRetrievePaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<ContentFileSearchRetrievePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {string} [q] The search text
      * @param {Array<number>} [resource_id] The id value of the parent learning resource for the content file
@@ -7603,12 +7654,14 @@ export const ContentFileSearchApiFp = function (configuration?: Configuration) {
     async contentFileSearchRetrieve(
       aggregations?: Array<ContentFileSearchRetrieveAggregationsEnum>,
       content_feature_type?: Array<string>,
+      cursor?: string,
       dev_mode?: boolean | null,
       id?: Array<number>,
       limit?: number,
       ocw_topic?: Array<string>,
       offered_by?: Array<ContentFileSearchRetrieveOfferedByEnum>,
       offset?: number,
+      pagination?: ContentFileSearchRetrievePaginationEnum,
       platform?: Array<ContentFileSearchRetrievePlatformEnum>,
       q?: string,
       resource_id?: Array<number>,
@@ -7626,12 +7679,14 @@ export const ContentFileSearchApiFp = function (configuration?: Configuration) {
         await localVarAxiosParamCreator.contentFileSearchRetrieve(
           aggregations,
           content_feature_type,
+          cursor,
           dev_mode,
           id,
           limit,
           ocw_topic,
           offered_by,
           offset,
+          pagination,
           platform,
           q,
           resource_id,
@@ -7682,12 +7737,14 @@ export const ContentFileSearchApiFactory = function (
         .contentFileSearchRetrieve(
           requestParameters.aggregations,
           requestParameters.content_feature_type,
+          requestParameters.cursor,
           requestParameters.dev_mode,
           requestParameters.id,
           requestParameters.limit,
           requestParameters.ocw_topic,
           requestParameters.offered_by,
           requestParameters.offset,
+          requestParameters.pagination,
           requestParameters.platform,
           requestParameters.q,
           requestParameters.resource_id,
@@ -7721,6 +7778,13 @@ export interface ContentFileSearchApiContentFileSearchRetrieveRequest {
    */
   readonly content_feature_type?: Array<string>
 
+  /**
+   * The cursor of the page to return, from the next url of a search using cursor pagination
+   * @type {string}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly cursor?: string
+
   /**
    * If true return raw open search results with score explanations
    * @type {boolean}
@@ -7763,6 +7827,13 @@ export interface ContentFileSearchApiContentFileSearchRetrieveRequest {
    */
   readonly offset?: number
 
+  /**
+   * How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
+   * @type {'offset' | 'cursor'}
+   * @memberof ContentFileSearchApiContentFileSearchRetrieve
+   */
+  readonly pagination?: ContentFileSearchRetrievePaginationEnum
+
   /**
    * The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
    * @type {Array<'edx' | 'ocw' | 'oll' | 'mitxonline' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl' | 'whu' | 'susskind' | 'globalalumni' | 'simplilearn' | 'emeritus' | 'podcast' | 'youtube'>}
@@ -7829,12 +7900,14 @@ export class ContentFileSearchApi extends BaseAPI {
       .contentFileSearchRetrieve(
         requestParameters.aggregations,
         requestParameters.content_feature_type,
+        requestParameters.cursor,
         requestParameters.dev_mode,
         requestParameters.id,
         requestParameters.limit,
         requestParameters.ocw_topic,
         requestParameters.offered_by,
         requestParameters.offset,
+        requestParameters.pagination,
         requestParameters.platform,
         requestParameters.q,
         requestParameters.resource_id,
@@ -7874,6 +7947,15 @@ export type ContentFileSearchRetrieveOfferedByEnum =
 /**
  * @export
  */
+export const ContentFileSearchRetrievePaginationEnum = {
+  Offset: "offset",
+  Cursor: "cursor",
+} as const
+export type ContentFileSearchRetrievePaginationEnum =
+  (typeof ContentFileSearchRetrievePaginationEnum)[keyof typeof ContentFileSearchRetrievePaginationEnum]
+/**
+ * @export
+ */
 export const ContentFileSearchRetrievePlatformEnum = {
   Edx: "edx",
   Ocw: "ocw",
@@ -12893,6 +12975,7 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesSearchRetrieveCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesSearchRetrieveDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesSearchRetrieveDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -12905,6 +12988,7 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesSearchRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesSearchRetrievePaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesSearchRetrievePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -12924,6 +13008,7 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
       certification_type?: Array<LearningResourcesSearchRetrieveCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesSearchRetrieveDeliveryEnum>,
       department?: Array<LearningResourcesSearchRetrieveDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -12936,6 +13021,7 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesSearchRetrieveOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesSearchRetrievePaginationEnum,
       platform?: Array<LearningResourcesSearchRetrievePlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -12985,6 +13071,10 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (delivery) {
         localVarQueryParameter["delivery"] = delivery
       }
@@ -13034,6 +13124,10 @@ export const LearningResourcesSearchApiAxiosParamCreator = function (
         localVarQueryParameter["offset"] = offset
       }
 
+      if (pagination !== undefined) {
+        localVarQueryParameter["pagination"] = pagination
+      }
+
       if (platform) {
         localVarQueryParameter["platform"] = platform
       }
@@ -13109,6 +13203,7 @@ export const LearningResourcesSearchApiFp = function (
      * @param {Array<LearningResourcesSearchRetrieveCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesSearchRetrieveDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesSearchRetrieveDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -13121,6 +13216,7 @@ export const LearningResourcesSearchApiFp = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesSearchRetrieveOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesSearchRetrievePaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesSearchRetrievePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -13140,6 +13236,7 @@ export const LearningResourcesSearchApiFp = function (
       certification_type?: Array<LearningResourcesSearchRetrieveCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesSearchRetrieveDeliveryEnum>,
       department?: Array<LearningResourcesSearchRetrieveDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -13152,6 +13249,7 @@ export const LearningResourcesSearchApiFp = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesSearchRetrieveOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesSearchRetrievePaginationEnum,
       platform?: Array<LearningResourcesSearchRetrievePlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -13176,6 +13274,7 @@ export const LearningResourcesSearchApiFp = function (
           certification_type,
           content_file_score_weight,
           course_feature,
+          cursor,
           delivery,
           department,
           dev_mode,
@@ -13188,6 +13287,7 @@ export const LearningResourcesSearchApiFp = function (
           ocw_topic,
           offered_by,
           offset,
+          pagination,
           platform,
           professional,
           q,
@@ -13245,6 +13345,7 @@ export const LearningResourcesSearchApiFactory = function (
           requestParameters.certification_type,
           requestParameters.content_file_score_weight,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.delivery,
           requestParameters.department,
           requestParameters.dev_mode,
@@ -13257,6 +13358,7 @@ export const LearningResourcesSearchApiFactory = function (
           requestParameters.ocw_topic,
           requestParameters.offered_by,
           requestParameters.offset,
+          requestParameters.pagination,
           requestParameters.platform,
           requestParameters.professional,
           requestParameters.q,
@@ -13315,6 +13417,13 @@ export interface LearningResourcesSearchApiLearningResourcesSearchRetrieveReques
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * The cursor of the page to return, from the next url of a search using cursor pagination
+   * @type {string}
+   * @memberof LearningResourcesSearchApiLearningResourcesSearchRetrieve
+   */
+  readonly cursor?: string
+
   /**
    * The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
    * @type {Array<'online' | 'hybrid' | 'in_person' | 'offline'>}
@@ -13399,6 +13508,13 @@ export interface LearningResourcesSearchApiLearningResourcesSearchRetrieveReques
    */
   readonly offset?: number
 
+  /**
+   * How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
+   * @type {'offset' | 'cursor'}
+   * @memberof LearningResourcesSearchApiLearningResourcesSearchRetrieve
+   */
+  readonly pagination?: LearningResourcesSearchRetrievePaginationEnum
+
   /**
    * The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
    * @type {Array<'edx' | 'ocw' | 'oll' | 'mitxonline' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl' | 'whu' | 'susskind' | 'globalalumni' | 'simplilearn' | 'emeritus' | 'podcast' | 'youtube'>}
@@ -13496,6 +13612,7 @@ export class LearningResourcesSearchApi extends BaseAPI {
         requestParameters.certification_type,
         requestParameters.content_file_score_weight,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.delivery,
         requestParameters.department,
         requestParameters.dev_mode,
@@ -13508,6 +13625,7 @@ export class LearningResourcesSearchApi extends BaseAPI {
         requestParameters.ocw_topic,
         requestParameters.offered_by,
         requestParameters.offset,
+        requestParameters.pagination,
         requestParameters.platform,
         requestParameters.professional,
         requestParameters.q,
@@ -13640,6 +13758,15 @@ export type LearningResourcesSearchRetrieveOfferedByEnum =
 /**
  * @export
  */
+export const LearningResourcesSearchRetrievePaginationEnum = {
+  Offset: "offset",
+  Cursor: "cursor",
+} as const
+export type LearningResourcesSearchRetrievePaginationEnum =
+  (typeof LearningResourcesSearchRetrievePaginationEnum)[keyof typeof LearningResourcesSearchRetrievePaginationEnum]
+/**
+ * @export
+ */
 export const LearningResourcesSearchRetrievePlatformEnum = {
   Edx: "edx",
   Ocw: "ocw",
@@ -13735,6 +13862,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionCheckListCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesUserSubscriptionCheckListDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -13747,6 +13875,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesUserSubscriptionCheckListOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesUserSubscriptionCheckListPaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesUserSubscriptionCheckListPlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -13767,6 +13896,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       certification_type?: Array<LearningResourcesUserSubscriptionCheckListCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesUserSubscriptionCheckListDeliveryEnum>,
       department?: Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -13779,6 +13909,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesUserSubscriptionCheckListOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesUserSubscriptionCheckListPaginationEnum,
       platform?: Array<LearningResourcesUserSubscriptionCheckListPlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -13829,6 +13960,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (delivery) {
         localVarQueryParameter["delivery"] = delivery
       }
@@ -13878,6 +14013,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["offset"] = offset
       }
 
+      if (pagination !== undefined) {
+        localVarQueryParameter["pagination"] = pagination
+      }
+
       if (platform) {
         localVarQueryParameter["platform"] = platform
       }
@@ -13944,6 +14083,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionListCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesUserSubscriptionListDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesUserSubscriptionListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -13956,6 +14096,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesUserSubscriptionListOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesUserSubscriptionListPaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesUserSubscriptionListPlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -13975,6 +14116,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       certification_type?: Array<LearningResourcesUserSubscriptionListCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesUserSubscriptionListDeliveryEnum>,
       department?: Array<LearningResourcesUserSubscriptionListDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -13987,6 +14129,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesUserSubscriptionListOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesUserSubscriptionListPaginationEnum,
       platform?: Array<LearningResourcesUserSubscriptionListPlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -14036,6 +14179,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (delivery) {
         localVarQueryParameter["delivery"] = delivery
       }
@@ -14085,6 +14232,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["offset"] = offset
       }
 
+      if (pagination !== undefined) {
+        localVarQueryParameter["pagination"] = pagination
+      }
+
       if (platform) {
         localVarQueryParameter["platform"] = platform
       }
@@ -14147,6 +14298,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -14159,6 +14311,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreatePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -14180,6 +14333,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       certification_type?: Array<LearningResourcesUserSubscriptionSubscribeCreateCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesUserSubscriptionSubscribeCreateDeliveryEnum>,
       department?: Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -14192,6 +14346,7 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesUserSubscriptionSubscribeCreateOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum,
       platform?: Array<LearningResourcesUserSubscriptionSubscribeCreatePlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -14243,6 +14398,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["course_feature"] = course_feature
       }
 
+      if (cursor !== undefined) {
+        localVarQueryParameter["cursor"] = cursor
+      }
+
       if (delivery) {
         localVarQueryParameter["delivery"] = delivery
       }
@@ -14292,6 +14451,10 @@ export const LearningResourcesUserSubscriptionApiAxiosParamCreator = function (
         localVarQueryParameter["offset"] = offset
       }
 
+      if (pagination !== undefined) {
+        localVarQueryParameter["pagination"] = pagination
+      }
+
       if (platform) {
         localVarQueryParameter["platform"] = platform
       }
@@ -14429,6 +14592,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionCheckListCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesUserSubscriptionCheckListDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -14441,6 +14605,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesUserSubscriptionCheckListOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesUserSubscriptionCheckListPaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesUserSubscriptionCheckListPlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -14461,6 +14626,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       certification_type?: Array<LearningResourcesUserSubscriptionCheckListCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesUserSubscriptionCheckListDeliveryEnum>,
       department?: Array<LearningResourcesUserSubscriptionCheckListDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -14473,6 +14639,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesUserSubscriptionCheckListOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesUserSubscriptionCheckListPaginationEnum,
       platform?: Array<LearningResourcesUserSubscriptionCheckListPlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -14498,6 +14665,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           certification_type,
           content_file_score_weight,
           course_feature,
+          cursor,
           delivery,
           department,
           dev_mode,
@@ -14510,6 +14678,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           ocw_topic,
           offered_by,
           offset,
+          pagination,
           platform,
           professional,
           q,
@@ -14544,6 +14713,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionListCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesUserSubscriptionListDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesUserSubscriptionListDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -14556,6 +14726,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesUserSubscriptionListOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesUserSubscriptionListPaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesUserSubscriptionListPlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -14575,6 +14746,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       certification_type?: Array<LearningResourcesUserSubscriptionListCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesUserSubscriptionListDeliveryEnum>,
       department?: Array<LearningResourcesUserSubscriptionListDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -14587,6 +14759,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesUserSubscriptionListOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesUserSubscriptionListPaginationEnum,
       platform?: Array<LearningResourcesUserSubscriptionListPlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -14611,6 +14784,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           certification_type,
           content_file_score_weight,
           course_feature,
+          cursor,
           delivery,
           department,
           dev_mode,
@@ -14623,6 +14797,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           ocw_topic,
           offered_by,
           offset,
+          pagination,
           platform,
           professional,
           q,
@@ -14656,6 +14831,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateCertificationTypeEnum>} [certification_type] The type of certificate               * &#x60;micromasters&#x60; - Micromasters Credential * &#x60;professional&#x60; - Professional Certificate * &#x60;completion&#x60; - Certificate of Completion * &#x60;none&#x60; - No Certificate
      * @param {number | null} [content_file_score_weight] Score weight for content file data.  1 is the default. 0 means content files are ignored
      * @param {Array<string>} [course_feature] The course feature. Possible options are at api/v1/course_features/
+     * @param {string} [cursor] The cursor of the page to return, from the next url of a search using cursor pagination
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateDeliveryEnum>} [delivery] The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>} [department] The department that offers the learning resource               * &#x60;1&#x60; - Civil and Environmental Engineering * &#x60;2&#x60; - Mechanical Engineering * &#x60;3&#x60; - Materials Science and Engineering * &#x60;4&#x60; - Architecture * &#x60;5&#x60; - Chemistry * &#x60;6&#x60; - Electrical Engineering and Computer Science * &#x60;7&#x60; - Biology * &#x60;8&#x60; - Physics * &#x60;9&#x60; - Brain and Cognitive Sciences * &#x60;10&#x60; - Chemical Engineering * &#x60;11&#x60; - Urban Studies and Planning * &#x60;12&#x60; - Earth, Atmospheric, and Planetary Sciences * &#x60;14&#x60; - Economics * &#x60;15&#x60; - Management * &#x60;16&#x60; - Aeronautics and Astronautics * &#x60;17&#x60; - Political Science * &#x60;18&#x60; - Mathematics * &#x60;20&#x60; - Biological Engineering * &#x60;21A&#x60; - Anthropology * &#x60;21G&#x60; - Global Languages * &#x60;21H&#x60; - History * &#x60;21L&#x60; - Literature * &#x60;21M&#x60; - Music and Theater Arts * &#x60;22&#x60; - Nuclear Science and Engineering * &#x60;24&#x60; - Linguistics and Philosophy * &#x60;CC&#x60; - Concourse * &#x60;CMS-W&#x60; - Comparative Media Studies/Writing * &#x60;EC&#x60; - Edgerton Center * &#x60;ES&#x60; - Experimental Study Group * &#x60;ESD&#x60; - Engineering Systems Division * &#x60;HST&#x60; - Medical Engineering and Science * &#x60;IDS&#x60; - Data, Systems, and Society * &#x60;MAS&#x60; - Media Arts and Sciences * &#x60;PE&#x60; - Athletics, Physical Education and Recreation * &#x60;SP&#x60; - Special Programs * &#x60;STS&#x60; - Science, Technology, and Society * &#x60;WGS&#x60; - Women\&#39;s and Gender Studies
      * @param {boolean | null} [dev_mode] If true return raw open search results with score explanations
@@ -14668,6 +14844,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
      * @param {Array<string>} [ocw_topic] The ocw topic name.
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreateOfferedByEnum>} [offered_by] The organization that offers the learning resource               * &#x60;mitx&#x60; - MITx * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education
      * @param {number} [offset] The initial index from which to return the results
+     * @param {LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum} [pagination] How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
      * @param {Array<LearningResourcesUserSubscriptionSubscribeCreatePlatformEnum>} [platform] The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
      * @param {boolean | null} [professional]
      * @param {string} [q] The search text
@@ -14689,6 +14866,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       certification_type?: Array<LearningResourcesUserSubscriptionSubscribeCreateCertificationTypeEnum>,
       content_file_score_weight?: number | null,
       course_feature?: Array<string>,
+      cursor?: string,
       delivery?: Array<LearningResourcesUserSubscriptionSubscribeCreateDeliveryEnum>,
       department?: Array<LearningResourcesUserSubscriptionSubscribeCreateDepartmentEnum>,
       dev_mode?: boolean | null,
@@ -14701,6 +14879,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
       ocw_topic?: Array<string>,
       offered_by?: Array<LearningResourcesUserSubscriptionSubscribeCreateOfferedByEnum>,
       offset?: number,
+      pagination?: LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum,
       platform?: Array<LearningResourcesUserSubscriptionSubscribeCreatePlatformEnum>,
       professional?: boolean | null,
       q?: string,
@@ -14724,6 +14903,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           certification_type,
           content_file_score_weight,
           course_feature,
+          cursor,
           delivery,
           department,
           dev_mode,
@@ -14736,6 +14916,7 @@ export const LearningResourcesUserSubscriptionApiFp = function (
           ocw_topic,
           offered_by,
           offset,
+          pagination,
           platform,
           professional,
           q,
@@ -14826,6 +15007,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.certification_type,
           requestParameters.content_file_score_weight,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.delivery,
           requestParameters.department,
           requestParameters.dev_mode,
@@ -14838,6 +15020,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.ocw_topic,
           requestParameters.offered_by,
           requestParameters.offset,
+          requestParameters.pagination,
           requestParameters.platform,
           requestParameters.professional,
           requestParameters.q,
@@ -14871,6 +15054,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.certification_type,
           requestParameters.content_file_score_weight,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.delivery,
           requestParameters.department,
           requestParameters.dev_mode,
@@ -14883,6 +15067,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.ocw_topic,
           requestParameters.offered_by,
           requestParameters.offset,
+          requestParameters.pagination,
           requestParameters.platform,
           requestParameters.professional,
           requestParameters.q,
@@ -14915,6 +15100,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.certification_type,
           requestParameters.content_file_score_weight,
           requestParameters.course_feature,
+          requestParameters.cursor,
           requestParameters.delivery,
           requestParameters.department,
           requestParameters.dev_mode,
@@ -14927,6 +15113,7 @@ export const LearningResourcesUserSubscriptionApiFactory = function (
           requestParameters.ocw_topic,
           requestParameters.offered_by,
           requestParameters.offset,
+          requestParameters.pagination,
           requestParameters.platform,
           requestParameters.professional,
           requestParameters.q,
@@ -15005,6 +15192,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * The cursor of the page to return, from the next url of a search using cursor pagination
+   * @type {string}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionCheckList
+   */
+  readonly cursor?: string
+
   /**
    * The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
    * @type {Array<'online' | 'hybrid' | 'in_person' | 'offline'>}
@@ -15089,6 +15283,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly offset?: number
 
+  /**
+   * How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
+   * @type {'offset' | 'cursor'}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionCheckList
+   */
+  readonly pagination?: LearningResourcesUserSubscriptionCheckListPaginationEnum
+
   /**
    * The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
    * @type {Array<'edx' | 'ocw' | 'oll' | 'mitxonline' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl' | 'whu' | 'susskind' | 'globalalumni' | 'simplilearn' | 'emeritus' | 'podcast' | 'youtube'>}
@@ -15208,6 +15409,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * The cursor of the page to return, from the next url of a search using cursor pagination
+   * @type {string}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionList
+   */
+  readonly cursor?: string
+
   /**
    * The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
    * @type {Array<'online' | 'hybrid' | 'in_person' | 'offline'>}
@@ -15292,6 +15500,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly offset?: number
 
+  /**
+   * How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
+   * @type {'offset' | 'cursor'}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionList
+   */
+  readonly pagination?: LearningResourcesUserSubscriptionListPaginationEnum
+
   /**
    * The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
    * @type {Array<'edx' | 'ocw' | 'oll' | 'mitxonline' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl' | 'whu' | 'susskind' | 'globalalumni' | 'simplilearn' | 'emeritus' | 'podcast' | 'youtube'>}
@@ -15404,6 +15619,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly course_feature?: Array<string>
 
+  /**
+   * The cursor of the page to return, from the next url of a search using cursor pagination
+   * @type {string}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionSubscribeCreate
+   */
+  readonly cursor?: string
+
   /**
    * The delivery options in which the learning resource is offered               * &#x60;online&#x60; - Online * &#x60;hybrid&#x60; - Hybrid * &#x60;in_person&#x60; - In person * &#x60;offline&#x60; - Offline
    * @type {Array<'online' | 'hybrid' | 'in_person' | 'offline'>}
@@ -15488,6 +15710,13 @@ export interface LearningResourcesUserSubscriptionApiLearningResourcesUserSubscr
    */
   readonly offset?: number
 
+  /**
+   * How to page through the results. Cursor pagination ignores offset and returns the next page in the next url, which is cheaper for deep pages  * &#x60;offset&#x60; - offset * &#x60;cursor&#x60; - cursor
+   * @type {'offset' | 'cursor'}
+   * @memberof LearningResourcesUserSubscriptionApiLearningResourcesUserSubscriptionSubscribeCreate
+   */
+  readonly pagination?: LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum
+
   /**
    * The platform on which the learning resource is offered               * &#x60;edx&#x60; - edX * &#x60;ocw&#x60; - MIT OpenCourseWare * &#x60;oll&#x60; - Open Learning Library * &#x60;mitxonline&#x60; - MITx Online * &#x60;bootcamps&#x60; - Bootcamps * &#x60;xpro&#x60; - MIT xPRO * &#x60;csail&#x60; - CSAIL * &#x60;mitpe&#x60; - MIT Professional Education * &#x60;see&#x60; - MIT Sloan Executive Education * &#x60;scc&#x60; - Schwarzman College of Computing * &#x60;ctl&#x60; - Center for Transportation &amp; Logistics * &#x60;whu&#x60; - WHU * &#x60;susskind&#x60; - Susskind * &#x60;globalalumni&#x60; - Global Alumni * &#x60;simplilearn&#x60; - Simplilearn * &#x60;emeritus&#x60; - Emeritus * &#x60;podcast&#x60; - Podcast * &#x60;youtube&#x60; - YouTube
    * @type {Array<'edx' | 'ocw' | 'oll' | 'mitxonline' | 'bootcamps' | 'xpro' | 'csail' | 'mitpe' | 'see' | 'scc' | 'ctl' | 'whu' | 'susskind' | 'globalalumni' | 'simplilearn' | 'emeritus' | 'podcast' | 'youtube'>}
@@ -15613,6 +15842,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.certification_type,
         requestParameters.content_file_score_weight,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.delivery,
         requestParameters.department,
         requestParameters.dev_mode,
@@ -15625,6 +15855,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.ocw_topic,
         requestParameters.offered_by,
         requestParameters.offset,
+        requestParameters.pagination,
         requestParameters.platform,
         requestParameters.professional,
         requestParameters.q,
@@ -15660,6 +15891,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.certification_type,
         requestParameters.content_file_score_weight,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.delivery,
         requestParameters.department,
         requestParameters.dev_mode,
@@ -15672,6 +15904,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.ocw_topic,
         requestParameters.offered_by,
         requestParameters.offset,
+        requestParameters.pagination,
         requestParameters.platform,
         requestParameters.professional,
         requestParameters.q,
@@ -15706,6 +15939,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.certification_type,
         requestParameters.content_file_score_weight,
         requestParameters.course_feature,
+        requestParameters.cursor,
         requestParameters.delivery,
         requestParameters.department,
         requestParameters.dev_mode,
@@ -15718,6 +15952,7 @@ export class LearningResourcesUserSubscriptionApi extends BaseAPI {
         requestParameters.ocw_topic,
         requestParameters.offered_by,
         requestParameters.offset,
+        requestParameters.pagination,
         requestParameters.platform,
         requestParameters.professional,
         requestParameters.q,
@@ -15872,6 +16107,15 @@ export type LearningResourcesUserSubscriptionCheckListOfferedByEnum =
 /**
  * @export
  */
+export const LearningResourcesUserSubscriptionCheckListPaginationEnum = {
+  Offset: "offset",
+  Cursor: "cursor",
+} as const
+export type LearningResourcesUserSubscriptionCheckListPaginationEnum =
+  (typeof LearningResourcesUserSubscriptionCheckListPaginationEnum)[keyof typeof LearningResourcesUserSubscriptionCheckListPaginationEnum]
+/**
+ * @export
+ */
 export const LearningResourcesUserSubscriptionCheckListPlatformEnum = {
   Edx: "edx",
   Ocw: "ocw",
@@ -16075,6 +16319,15 @@ export type LearningResourcesUserSubscriptionListOfferedByEnum =
 /**
  * @export
  */
+export const LearningResourcesUserSubscriptionListPaginationEnum = {
+  Offset: "offset",
+  Cursor: "cursor",
+} as const
+export type LearningResourcesUserSubscriptionListPaginationEnum =
+  (typeof LearningResourcesUserSubscriptionListPaginationEnum)[keyof typeof LearningResourcesUserSubscriptionListPaginationEnum]
+/**
+ * @export
+ */
 export const LearningResourcesUserSubscriptionListPlatformEnum = {
   Edx: "edx",
   Ocw: "ocw",
@@ -16271,6 +16524,15 @@ export type LearningResourcesUserSubscriptionSubscribeCreateOfferedByEnum =
 /**
  * @export
  */
+export const LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum = {
+  Offset: "offset",
+  Cursor: "cursor",
+} as const
+export type LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum =
+  (typeof LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum)[keyof typeof LearningResourcesUserSubscriptionSubscribeCreatePaginationEnum]
+/**
+ * @export
+ */
 export const LearningResourcesUserSubscriptionSubscribeCreatePlatformEnum = {
   Edx: "edx",
   Ocw: "ocw",
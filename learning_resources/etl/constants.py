@@ -30,8 +30,14 @@ LearningResourceRunLoaderConfig = namedtuple(  # noqa: PYI024
 
 CourseLoaderConfig = namedtuple(  # noqa: PYI024
     "CourseLoaderConfig",
-    ["prune", "offered_by", "runs", "fetch_only"],
-    defaults=[True, OfferedByLoaderConfig(), LearningResourceRunLoaderConfig(), False],
+    ["prune", "offered_by", "runs", "fetch_only", "bulk"],
+    defaults=[
+        True,
+        OfferedByLoaderConfig(),
+        LearningResourceRunLoaderConfig(),
+        False,
+        False,
+    ],
 )
 
 ProgramLoaderConfig = namedtuple(  # noqa: PYI024
@@ -2,9 +2,8 @@
 
 import logging
 import re
-from pathlib import Path
+from contextlib import closing
 from tarfile import ReadError
-from tempfile import TemporaryDirectory
 
 from learning_resources.etl.constants import ETLSource
 from learning_resources.etl.loaders import load_content_files
@@ -141,23 +140,24 @@ def sync_edx_course_files(
         ):
             log.info("Skipping %s, not the next / most recent run", run.run_id)
             continue
-        with TemporaryDirectory() as export_tempdir:
-            course_tarpath = Path(export_tempdir, key.split("/")[-1])
-            log.info("course tarpath for run %s is %s", run.run_id, course_tarpath)
-            bucket.download_file(key, course_tarpath)
-            try:
-                checksum = calc_checksum(course_tarpath)
-            except ReadError:
-                log.exception("Error reading tar file %s, skipping", course_tarpath)
-                continue
-            if run.checksum == checksum:
-                log.info("Checksums match for %s, skipping load", key)
-                # Ensure any content files for other runs in the course are deindexed
-                content_files_loaded_actions(run=run, deindex_only=True)
-                continue
-            try:
-                load_content_files(run, transform_content_files(course_tarpath, run))
-                run.checksum = checksum
-                run.save()
-            except:  # noqa: E722
-                log.exception("Error ingesting OLX content data for %s", key)
+        # The archive is streamed from S3 instead of being downloaded to disk,
+        # once for the checksum and again only if its content files are loaded
+        log.info("Streaming course archive %s for run %s", key, run.run_id)
+        try:
+            with closing(bucket.Object(key).get()["Body"]) as body:
+                checksum = calc_checksum(body)
+        except ReadError:
+            log.exception("Error reading tar file %s, skipping", key)
+            continue
+        if run.checksum == checksum:
+            log.info("Checksums match for %s, skipping load", key)
+            # Ensure any content files for other runs in the course are deindexed
+            content_files_loaded_actions(run=run, deindex_only=True)
+            continue
+        try:
+            with closing(bucket.Object(key).get()["Body"]) as body:
+                load_content_files(run, transform_content_files(body, run))
+            run.checksum = checksum
+            run.save()
+        except:  # noqa: E722
+            log.exception("Error ingesting OLX content data for %s", key)
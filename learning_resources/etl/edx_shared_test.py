@@ -97,6 +97,8 @@ def test_sync_edx_course_files(  # noqa: PLR0913
                 )
     sync_edx_course_files(source, [course.id for course in courses], keys, s3_prefix)
     assert mock_transform.call_count == (2 if published else 0)
+    # The archives are streamed from S3, not downloaded to disk first
+    assert all(hasattr(call.args[0], "read") for call in mock_transform.call_args_list)
     assert mock_load_content_files.call_count == (2 if published else 0)
     if published:
         for course in courses:
@@ -265,7 +267,7 @@ def test_sync_edx_course_files_error(
     )
     sync_edx_course_files(platform, [run.learning_resource.id], [key])
     assert mock_transform.call_count == 1
-    assert str(mock_transform.call_args[0][0]).endswith(f"{run.run_id}.tar.gz") is True
+    assert hasattr(mock_transform.call_args[0][0], "read")
     mock_load_content_files.assert_called_once_with(run, fake_data)
     assert mock_log.call_args[0][0].startswith("Error ingesting OLX content data for ")
 
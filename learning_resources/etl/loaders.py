@@ -1,9 +1,16 @@
 """learning_resources data loaders"""
 
 import logging
+import operator
+from collections import defaultdict
+from datetime import UTC, datetime
+from functools import reduce
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
 from learning_resources.constants import (
     LearningResourceDelivery,
@@ -21,6 +28,14 @@ from learning_resources.etl.constants import (
     ResourceNextRunConfig,
 )
 from learning_resources.etl.exceptions import ExtractException
+from learning_resources.etl.reference_data import (
+    get_department,
+    get_offeror,
+    get_or_create_content_tag,
+    get_platform,
+    get_topic_by_name,
+    get_topics_by_id,
+)
 from learning_resources.etl.utils import most_common_topics
 from learning_resources.models import (
     ContentFile,
@@ -34,7 +49,6 @@ from learning_resources.models import (
     LearningResourcePlatform,
     LearningResourceRelationship,
     LearningResourceRun,
-    LearningResourceTopic,
     Podcast,
     PodcastEpisode,
     Program,
@@ -44,16 +58,19 @@ from learning_resources.models import (
 )
 from learning_resources.utils import (
     add_parent_topics_to_learning_resource,
+    bulk_resource_runs_unpublished_actions,
     bulk_resources_unpublished_actions,
+    bulk_resources_upserted_actions,
+    bulk_similar_topics_action,
     content_files_loaded_actions,
     load_course_blocklist,
     load_course_duplicates,
     resource_delete_actions,
-    resource_run_unpublished_actions,
     resource_unpublished_actions,
     resource_upserted_actions,
     similar_topics_action,
 )
+from main.utils import chunks
 
 log = logging.getLogger()
 
@@ -74,6 +91,37 @@ def update_index(learning_resource, newly_created):
         resource_upserted_actions(learning_resource, percolate=newly_created)
 
 
+def bulk_unpublish_resources(resource_ids: list[int], resource_type: str):
+    """
+    Unpublish resources with a single query and remove them from the search
+    index together
+
+    Args:
+        resource_ids (list of int): the ids of the resources to unpublish
+        resource_type (str): the type of the resources
+    """
+    if resource_ids:
+        LearningResource.objects.filter(id__in=resource_ids).update(
+            published=False, updated_on=timezone.now()
+        )
+        bulk_resources_unpublished_actions(resource_ids, resource_type)
+
+
+def bulk_unpublish_runs(run_ids: list[int]):
+    """
+    Unpublish runs with a single query and remove their content files from the
+    search index together
+
+    Args:
+        run_ids (list of int): the ids of the runs to unpublish
+    """
+    if run_ids:
+        LearningResourceRun.objects.filter(id__in=run_ids).update(
+            published=False, updated_on=timezone.now()
+        )
+        bulk_resource_runs_unpublished_actions(run_ids)
+
+
 def load_topics(resource, topics_data):
     """
     Load the topics for a resource into the database.
@@ -85,9 +133,7 @@ def load_topics(resource, topics_data):
         topics = []
 
         for topic_data in topics_data:
-            topic = LearningResourceTopic.objects.filter(
-                name=topic_data["name"]
-            ).first()
+            topic = get_topic_by_name(topic_data["name"])
             topics.append(topic) if topic else log.warning(
                 "Skipped adding topic %s to resource %s", topic_data["name"], resource
             )
@@ -107,9 +153,7 @@ def load_departments(
 
     if department_data:
         for department_id in department_data:
-            department = LearningResourceDepartment.objects.get(
-                department_id=department_id
-            )
+            department = get_department(department_id)
             departments.append(department)
 
     resource.departments.set(departments)
@@ -155,25 +199,33 @@ def load_run_dependent_values(
     )
 
 
+def _get_instructor_full_name(prof: dict) -> str:
+    """Get the full name instructors are matched on"""
+    return (
+        prof.get("full_name", "")
+        or f"{prof.get('first_name') or ''} {prof.get('last_name') or ''}"
+    ).strip()
+
+
+def _get_instructor_defaults(prof: dict) -> dict:
+    """Get the instructor fields to update"""
+    valid_attributes = ["first_name", "last_name"]
+    return {
+        key: value for key, value in prof.items() if value and key in valid_attributes
+    }
+
+
 def load_instructors(
     run: LearningResourceRun, instructors_data: list[dict]
 ) -> list[LearningResourceInstructor]:
     """Load the instructors for a resource run into the database"""
     instructors = []
-    valid_attributes = ["first_name", "last_name"]
     for prof in instructors_data:
-        full_name = (
-            prof.get("full_name", "")
-            or f"{prof.get('first_name') or ''} {prof.get('last_name') or ''}"
-        ).strip()
+        full_name = _get_instructor_full_name(prof)
         if full_name:
             instructor, _ = LearningResourceInstructor.objects.update_or_create(
                 full_name=full_name,
-                defaults={
-                    key: value
-                    for key, value in prof.items()
-                    if value and key in valid_attributes
-                },
+                defaults=_get_instructor_defaults(prof),
             )
             instructors.append(instructor)
 
@@ -214,8 +266,7 @@ def load_offered_by(
     if offered_by_data is None:
         resource.offered_by = None
     else:
-        offered_by = LearningResourceOfferor.objects.filter(**offered_by_data).first()
-        resource.offered_by = offered_by
+        resource.offered_by = get_offeror(offered_by_data)
     resource.save()
     return resource.offered_by
 
@@ -226,15 +277,25 @@ def load_content_tags(
 ) -> list[LearningResourceContentTag]:
     """Load the content tags for a resource into the database"""
     if content_tags_data is not None:
-        tags = []
-        for content_tag in content_tags_data:
-            tag, _ = LearningResourceContentTag.objects.get_or_create(name=content_tag)
-            tags.append(tag)
+        tags = [
+            get_or_create_content_tag(content_tag) for content_tag in content_tags_data
+        ]
         learning_resources_obj.content_tags.set(tags)
         learning_resources_obj.save()
     return learning_resources_obj.content_tags.all()
 
 
+def _get_run_prices(
+    learning_resource: LearningResource, run_data: dict, status: str
+) -> list:
+    """Get the prices of a run"""
+    if status == RunStatus.archived.value or learning_resource.certification is False:
+        # Archived runs or runs of resources w/out certificates should not have prices
+        return []
+    # Make sure any prices are unique and sorted in ascending order
+    return sorted(set(run_data.get("prices", [])), key=lambda x: float(x))
+
+
 def load_run(
     learning_resource: LearningResource, run_data: dict
 ) -> LearningResourceRun:
@@ -253,14 +314,7 @@ def load_run(
     status = run_data.pop("status", None)
     instructors_data = run_data.pop("instructors", [])
 
-    if status == RunStatus.archived.value or learning_resource.certification is False:
-        # Archived runs or runs of resources w/out certificates should not have prices
-        run_data["prices"] = []
-    else:
-        # Make sure any prices are unique and sorted in ascending order
-        run_data["prices"] = sorted(
-            set(run_data.get("prices", [])), key=lambda x: float(x)
-        )
+    run_data["prices"] = _get_run_prices(learning_resource, run_data, status)
 
     with transaction.atomic():
         (
@@ -322,7 +376,7 @@ def upsert_course_or_program(
         ),
         None,
     )
-    platform = LearningResourcePlatform.objects.filter(code=platform_name).first()
+    platform = get_platform(platform_name)
     if not platform:
         log.exception(
             "Platform %s is null or not in database: %s",
@@ -437,12 +491,15 @@ def load_course(
             # from a program (config.prune=False).
             # The course ETL should be the ultimate source of truth for
             # courses and their runs.
-            for run in learning_resource.runs.exclude(
-                run_id__in=run_ids_to_update_or_create
-            ).filter(published=True):
-                run.published = False
-                run.save()
-                resource_run_unpublished_actions(run)
+            bulk_unpublish_runs(
+                list(
+                    learning_resource.runs.exclude(
+                        run_id__in=run_ids_to_update_or_create
+                    )
+                    .filter(published=True)
+                    .values_list("id", flat=True)
+                )
+            )
 
         load_run_dependent_values(learning_resource)
         load_topics(learning_resource, topics_data)
@@ -476,23 +533,465 @@ def load_courses(
 
     courses_list = list(courses_data or [])
 
-    courses = [
-        course
-        for course in [
-            load_course(course, blocklist, duplicates, config=config)
-            for course in courses_list
+    if config.bulk and not config.fetch_only:
+        courses = bulk_load_courses(courses_list, blocklist, duplicates, config=config)
+    else:
+        courses = [
+            course
+            for course in [
+                load_course(course, blocklist, duplicates, config=config)
+                for course in courses_list
+            ]
+            if course is not None
         ]
-        if course is not None
-    ]
 
     if courses and config.prune:
-        for learning_resource in LearningResource.objects.filter(
-            etl_source=etl_source, resource_type=LearningResourceType.course.name
-        ).exclude(id__in=[learning_resource.id for learning_resource in courses]):
-            learning_resource.published = False
-            learning_resource.save()
-            resource_unpublished_actions(learning_resource)
+        bulk_unpublish_resources(
+            list(
+                LearningResource.objects.filter(
+                    etl_source=etl_source,
+                    resource_type=LearningResourceType.course.name,
+                    published=True,
+                )
+                .exclude(id__in=[learning_resource.id for learning_resource in courses])
+                .values_list("id", flat=True)
+            ),
+            LearningResourceType.course.name,
+        )
+
+    return courses
+
+
+def _get_image_key(image_data: dict) -> tuple:
+    """Get the fields load_image matches an image on"""
+    return (image_data.get("url"), image_data.get("description"), image_data.get("alt"))
+
+
+def _bulk_get_or_create_images(images_data: list[dict]) -> dict:
+    """
+    Get or create the images for a list of image data, like load_image does
+    one image at a time
+
+    Returns:
+        dict: LearningResourceImage objects by image key
+    """
+    keys = {_get_image_key(image_data) for image_data in images_data if image_data}
+    if not keys:
+        return {}
+    images = {}
+    for image in LearningResourceImage.objects.filter(
+        url__in={url for url, _, _ in keys}
+    ).order_by("id"):
+        images.setdefault((image.url, image.description, image.alt), image)
+    for image in LearningResourceImage.objects.bulk_create(
+        [
+            LearningResourceImage(url=url, description=description, alt=alt)
+            for url, description, alt in keys
+            if (url, description, alt) not in images
+        ]
+    ):
+        images[(image.url, image.description, image.alt)] = image
+    return images
+
+
+def _bulk_upsert_instructors(instructors_data: list[dict]) -> dict:
+    """
+    Create or update instructors by full name, like load_instructors does one
+    instructor at a time
+
+    Returns:
+        dict: LearningResourceInstructor objects by full name
+    """
+    instructor_values = {}
+    for prof in instructors_data:
+        full_name = _get_instructor_full_name(prof)
+        if full_name:
+            instructor_values.setdefault(full_name, {}).update(
+                _get_instructor_defaults(prof)
+            )
+    if not instructor_values:
+        return {}
+    existing = LearningResourceInstructor.objects.in_bulk(
+        instructor_values, field_name="full_name"
+    )
+    LearningResourceInstructor.objects.bulk_create(
+        [
+            LearningResourceInstructor(
+                full_name=full_name,
+                **{
+                    "first_name": getattr(existing.get(full_name), "first_name", None),
+                    "last_name": getattr(existing.get(full_name), "last_name", None),
+                    **values,
+                },
+            )
+            for full_name, values in instructor_values.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["full_name"],
+        update_fields=["first_name", "last_name", "updated_on"],
+    )
+    return LearningResourceInstructor.objects.in_bulk(
+        instructor_values, field_name="full_name"
+    )
+
+
+def _bulk_set_many_to_many(relation, related_ids_by_id: dict):
+    """
+    Set a many-to-many relation of many objects with one delete and one insert
+
+    Args:
+        relation (ManyToManyDescriptor): the relation, e.g. LearningResource.topics
+        related_ids_by_id (dict): the related object ids of each object, by id
+    """
+    through = relation.through
+    field_name = relation.field.m2m_field_name()
+    related_field_name = relation.field.m2m_reverse_field_name()
+    through.objects.filter(**{f"{field_name}_id__in": list(related_ids_by_id)}).delete()
+    through.objects.bulk_create(
+        [
+            through(**{f"{field_name}_id": object_id, f"{related_field_name}_id": rid})
+            for object_id, related_ids in related_ids_by_id.items()
+            for rid in dict.fromkeys(related_ids)
+        ]
+    )
+
+
+def _set_run_dependent_values(resource: LearningResource, runs: list, now):
+    """
+    Assign next_start_date, availability, prices and location to a resource
+    from its runs, like load_run_dependent_values does from the database
+    """
+    published_runs = [run for run in runs if run.published]
+    next_upcoming_run = min(
+        (run for run in published_runs if run.start_date and run.start_date > now),
+        key=lambda run: run.start_date,
+        default=None,
+    )
+    resource.next_start_date = (
+        next_upcoming_run.start_date if next_upcoming_run else None
+    )
+    # Like the database, sort runs without a start date before the others when
+    # sorting by descending start date
+    best_run = next_upcoming_run or max(
+        published_runs,
+        key=lambda run: (
+            run.start_date is None,
+            run.start_date or datetime.min.replace(tzinfo=UTC),
+        ),
+        default=None,
+    )
+    if best_run:
+        resource.availability = best_run.availability
+        resource.prices = (
+            best_run.prices if resource.certification and best_run.prices else []
+        )
+        resource.location = best_run.location
+
 
+def _bulk_load_course_chunk(  # noqa: C901, PLR0912, PLR0915
+    courses_data: list[dict], blocklist: list[str], config: CourseLoaderConfig
+) -> list[LearningResource]:
+    """
+    Load a chunk of courses with a fixed number of queries. Every course must
+    have a distinct readable_id and platform and be matched on readable_id.
+    """
+    now = timezone.now()
+    course_type = LearningResourceType.course.name
+    platforms = LearningResourcePlatform.objects.in_bulk(
+        {resource_data["platform"] for resource_data in courses_data}
+    )
+
+    records = {}
+    for resource_data in courses_data:
+        record = {
+            "topics": resource_data.pop("topics", None),
+            "offered_by": resource_data.pop("offered_by", None),
+            "image": resource_data.pop("image", None),
+            "course": resource_data.pop("course", None),
+            "departments": resource_data.pop("departments", []),
+            "content_tags": resource_data.pop("content_tags", []),
+            "runs": resource_data.pop("runs", []),
+        }
+        resource_data.setdefault("delivery", [LearningResourceDelivery.online.name])
+        resource_data.pop("unique_field", None)
+        platform_name = resource_data.pop("platform")
+        readable_id = resource_data.pop("readable_id")
+        if platform_name not in platforms:
+            log.exception(
+                "Platform %s is null or not in database: %s",
+                platform_name,
+                readable_id,
+            )
+            continue
+        if readable_id in blocklist or not record["runs"]:
+            resource_data["published"] = False
+        record["fields"] = tuple(resource_data)
+        record["resource"] = LearningResource(
+            platform_id=platform_name,
+            readable_id=readable_id,
+            resource_type=course_type,
+            **resource_data,
+        )
+        records[(platform_name, readable_id)] = record
+    if not records:
+        return []
+
+    # Match exact (platform, readable_id) pairs, the same readable_id can belong
+    # to a different course on another platform in the chunk
+    resources_query = LearningResource.objects.filter(
+        reduce(
+            operator.or_,
+            (
+                Q(platform_id=platform_name, readable_id=readable_id)
+                for platform_name, readable_id in records
+            ),
+        ),
+        resource_type=course_type,
+    )
+    existing_keys = set(resources_query.values_list("platform", "readable_id"))
+    runs_data = [run_data for record in records.values() for run_data in record["runs"]]
+    images = _bulk_get_or_create_images(
+        [record["image"] for record in records.values()]
+        + [run_data.get("image") for run_data in runs_data]
+    )
+    instructors = _bulk_upsert_instructors(
+        [prof for run_data in runs_data for prof in run_data.get("instructors", [])]
+    )
+    topics = get_topics_by_id()
+    topics_by_name = {}
+    for topic in topics.values():
+        topics_by_name.setdefault(topic.name, topic)
+    department_ids = {
+        department_id
+        for record in records.values()
+        for department_id in record["departments"] or []
+    }
+    departments = LearningResourceDepartment.objects.in_bulk(department_ids)
+    if department_ids - set(departments):
+        msg = f"Departments not found: {sorted(department_ids - set(departments))}"
+        raise LearningResourceDepartment.DoesNotExist(msg)
+    tag_names = {
+        name for record in records.values() for name in record["content_tags"] or []
+    }
+    LearningResourceContentTag.objects.bulk_create(
+        [LearningResourceContentTag(name=name) for name in tag_names],
+        ignore_conflicts=True,
+    )
+    tags = LearningResourceContentTag.objects.in_bulk(tag_names, field_name="name")
+    offerors = {}
+
+    with transaction.atomic():
+        resources_by_fields = defaultdict(list)
+        for record in records.values():
+            resources_by_fields[record["fields"]].append(record["resource"])
+        for fields, resources in resources_by_fields.items():
+            LearningResource.objects.bulk_create(
+                resources,
+                update_conflicts=True,
+                unique_fields=["platform", "readable_id", "resource_type"],
+                update_fields=[*fields, "updated_on"],
+            )
+        for resource in resources_query.select_for_update():
+            records[(resource.platform_id, resource.readable_id)]["resource"] = resource
+
+        Course.objects.bulk_create(
+            [
+                Course(learning_resource=record["resource"], **(record["course"] or {}))
+                for record in records.values()
+            ],
+            ignore_conflicts=True,
+        )
+
+        runs = {
+            (run.learning_resource_id, run.run_id): run
+            for run in LearningResourceRun.objects.filter(
+                learning_resource__in=[
+                    record["resource"] for record in records.values()
+                ]
+            )
+        }
+        loaded_runs = {}
+        run_fields = set()
+        run_instructor_names = {}
+        for record in records.values():
+            resource = record["resource"]
+            for run_data in record["runs"]:
+                run_id = run_data.pop("run_id")
+                image_data = run_data.pop("image", None)
+                status = run_data.pop("status", None)
+                instructors_data = run_data.pop("instructors", [])
+                run_data["prices"] = _get_run_prices(resource, run_data, status)
+                run = runs.setdefault(
+                    (resource.id, run_id),
+                    LearningResourceRun(learning_resource=resource, run_id=run_id),
+                )
+                for field, value in run_data.items():
+                    setattr(run, field, value)
+                run_fields.update(run_data)
+                run.image = images[_get_image_key(image_data)] if image_data else None
+                run.updated_on = now
+                loaded_runs[(resource.id, run_id)] = run
+                run_instructor_names[(resource.id, run_id)] = [
+                    _get_instructor_full_name(prof) for prof in instructors_data
+                ]
+        LearningResourceRun.objects.bulk_create(
+            [run for run in loaded_runs.values() if run.pk is None]
+        )
+        LearningResourceRun.objects.bulk_update(
+            [run for run in loaded_runs.values() if run.pk is not None],
+            fields=[*run_fields, "image", "updated_on"],
+        )
+        _bulk_set_many_to_many(
+            LearningResourceRun.instructors,
+            {
+                loaded_runs[key].id: [
+                    instructors[full_name].id for full_name in full_names if full_name
+                ]
+                for key, full_names in run_instructor_names.items()
+            },
+        )
+
+        if config.prune:
+            # mark runs no longer included here as unpublished
+            unpublished_runs = [
+                run
+                for key, run in runs.items()
+                if key not in loaded_runs and run.published
+            ]
+            for run in unpublished_runs:
+                run.published = False
+            bulk_unpublish_runs([run.id for run in unpublished_runs])
+
+        runs_by_resource = defaultdict(list)
+        for run in runs.values():
+            runs_by_resource[run.learning_resource_id].append(run)
+        topic_ids = {}
+        for record in records.values():
+            resource = record["resource"]
+            _set_run_dependent_values(resource, runs_by_resource[resource.id], now)
+            if record["topics"] is not None:
+                topic_ids[resource.id] = []
+                for topic_data in record["topics"]:
+                    topic = topics_by_name.get(topic_data["name"])
+                    if not topic:
+                        log.warning(
+                            "Skipped adding topic %s to resource %s",
+                            topic_data["name"],
+                            resource,
+                        )
+                    # Add the topic and its parents
+                    while topic and topic.id not in topic_ids[resource.id]:
+                        topic_ids[resource.id].append(topic.id)
+                        topic = topics.get(topic.parent_id)
+            if record["offered_by"] is None:
+                resource.offered_by = None
+            else:
+                offered_by_key = tuple(sorted(record["offered_by"].items()))
+                if offered_by_key not in offerors:
+                    offerors[offered_by_key] = get_offeror(record["offered_by"])
+                resource.offered_by = offerors[offered_by_key]
+            resource.image = (
+                images[_get_image_key(record["image"])] if record["image"] else None
+            )
+            resource.updated_on = now
+        LearningResource.objects.bulk_update(
+            [record["resource"] for record in records.values()],
+            fields=[
+                "next_start_date",
+                "availability",
+                "prices",
+                "location",
+                "image",
+                "offered_by",
+                "updated_on",
+            ],
+        )
+        _bulk_set_many_to_many(LearningResource.topics, topic_ids)
+        _bulk_set_many_to_many(
+            LearningResource.departments,
+            {
+                record["resource"].id: record["departments"] or []
+                for record in records.values()
+            },
+        )
+        _bulk_set_many_to_many(
+            LearningResource.content_tags,
+            {
+                record["resource"].id: [
+                    tags[name].id for name in record["content_tags"]
+                ]
+                for record in records.values()
+                if record["content_tags"] is not None
+            },
+        )
+
+    upserted_ids = []
+    percolate_ids = []
+    for key, record in records.items():
+        resource = record["resource"]
+        if resource.published:
+            upserted_ids.append(resource.id)
+            if key not in existing_keys:
+                percolate_ids.append(resource.id)
+        elif key in existing_keys:
+            resource_unpublished_actions(resource)
+    if upserted_ids:
+        bulk_resources_upserted_actions(upserted_ids, course_type, percolate_ids)
+    return [record["resource"] for record in records.values()]
+
+
+def bulk_load_courses(
+    courses_data: list[dict],
+    blocklist: list[str],
+    duplicates: list[dict],
+    *,
+    config=CourseLoaderConfig(),
+) -> list[LearningResource]:
+    """
+    Load courses in chunks of ETL_BULK_LOAD_CHUNK_SIZE, with a fixed number of
+    queries per chunk instead of dozens per course. Courses that have duplicates,
+    are matched on a field other than readable_id or appear more than once in a
+    chunk are loaded one at a time by load_course.
+
+    Args:
+        courses_data (list of dict):
+            a list of course data values
+        blocklist (list of str):
+            list of course ids not to load
+        duplicates (list of dict):
+            list of duplicate course data
+        config (CourseLoaderConfig):
+            configuration on how to load the courses
+
+    Returns:
+        A list of course LearningResources
+    """
+    duplicate_ids = {
+        course_id
+        for record in duplicates
+        for course_id in record["duplicate_course_ids"]
+    }
+    courses = []
+    for chunk in chunks(courses_data, chunk_size=settings.ETL_BULK_LOAD_CHUNK_SIZE):
+        bulk_courses_data = []
+        single_courses_data = []
+        keys = set()
+        for course_data in chunk:
+            key = (course_data.get("platform"), course_data.get("readable_id"))
+            if (
+                course_data.get("unique_field", READABLE_ID_FIELD) != READABLE_ID_FIELD
+                or key[1] in duplicate_ids
+                or key in keys
+            ):
+                single_courses_data.append(course_data)
+            else:
+                keys.add(key)
+                bulk_courses_data.append(course_data)
+        courses.extend(_bulk_load_course_chunk(bulk_courses_data, blocklist, config))
+        for course_data in single_courses_data:
+            course = load_course(course_data, blocklist, duplicates, config=config)
+            if course is not None:
+                courses.append(course)
     return courses
 
 
@@ -552,11 +1051,9 @@ def load_program(
 
         if config.prune:
             # mark runs no longer included here as unpublished
-            for run in learning_resource.runs.exclude(
+            learning_resource.runs.exclude(
                 run_id__in=run_ids_to_update_or_create
-            ).filter(published=True):
-                run.published = False
-                run.save()
+            ).filter(published=True).update(published=False, updated_on=timezone.now())
 
         load_run_dependent_values(learning_resource)
 
@@ -594,18 +1091,24 @@ def load_programs(
         for program_data in programs_data
     ]
     if programs and config.prune:
-        for learning_resource in LearningResource.objects.filter(
-            etl_source=etl_source, resource_type=LearningResourceType.program.name
-        ).exclude(
-            id__in=[
-                learning_resource.id
-                for learning_resource in programs
-                if learning_resource is not None
-            ]
-        ):
-            learning_resource.published = False
-            learning_resource.save()
-            resource_unpublished_actions(learning_resource)
+        bulk_unpublish_resources(
+            list(
+                LearningResource.objects.filter(
+                    etl_source=etl_source,
+                    resource_type=LearningResourceType.program.name,
+                    published=True,
+                )
+                .exclude(
+                    id__in=[
+                        learning_resource.id
+                        for learning_resource in programs
+                        if learning_resource is not None
+                    ]
+                )
+                .values_list("id", flat=True)
+            ),
+            LearningResourceType.program.name,
+        )
     return [program for program in programs if program is not None]
 
 
@@ -637,6 +1140,74 @@ def load_content_file(
         )
 
 
+def bulk_load_content_files(
+    course_run: LearningResourceRun, content_files_data: list[dict]
+) -> list[int]:
+    """
+    Sync course run files/pages to the database with one bulk upsert per set of
+    fields. Files are matched on key, a key appearing more than once is loaded
+    from its last occurrence.
+
+    Args:
+        course_run (LearningResourceRun): a LearningResourceRun for a Course
+        content_files_data (list of dict): File metadata as JSON
+
+    Returns:
+        list of int: the ids of the objects that were created or updated
+    """
+    content_files = {}
+    for content_file_data in content_files_data:
+        data = {**content_file_data}
+        content_file_tags = data.pop("content_tags", [])
+        data.pop("run", None)
+        content_files[data["key"]] = (data, content_file_tags)
+
+    tag_names = {
+        name
+        for _, content_file_tags in content_files.values()
+        for name in content_file_tags or []
+    }
+    LearningResourceContentTag.objects.bulk_create(
+        [LearningResourceContentTag(name=name) for name in tag_names],
+        ignore_conflicts=True,
+    )
+    tags = LearningResourceContentTag.objects.in_bulk(tag_names, field_name="name")
+
+    with transaction.atomic():
+        content_files_by_fields = defaultdict(list)
+        for data, _ in content_files.values():
+            content_files_by_fields[tuple(data)].append(
+                ContentFile(run=course_run, **data)
+            )
+        for fields, objects in content_files_by_fields.items():
+            ContentFile.objects.bulk_create(
+                objects,
+                update_conflicts=True,
+                unique_fields=["key", "run"],
+                update_fields=[
+                    *(field for field in fields if field != "key"),
+                    "updated_on",
+                ],
+            )
+        content_file_ids = dict(
+            ContentFile.objects.filter(
+                run=course_run, key__in=list(content_files)
+            ).values_list("key", "id")
+        )
+        _bulk_set_many_to_many(
+            ContentFile.content_tags,
+            {
+                content_file_ids[key]: [tags[name].id for name in content_file_tags]
+                for key, (_, content_file_tags) in content_files.items()
+                if content_file_tags is not None
+            },
+        )
+    return [
+        content_file_ids[content_file_data["key"]]
+        for content_file_data in content_files_data
+    ]
+
+
 def calculate_completeness(
     run: LearningResourceRun, content_tags: list[list[str]] | None = None
 ):
@@ -715,9 +1286,34 @@ def load_content_files(
     if course_run.learning_resource.resource_type == LearningResourceType.course.name:
         content_files_ids = []
         content_tags = []
-        for content_file in content_files_data:
-            content_tags.append(content_file.get("content_tags", []))
-            content_files_ids.append(load_content_file(course_run, content_file))
+        for chunk in chunks(
+            content_files_data, chunk_size=settings.ETL_BULK_LOAD_CHUNK_SIZE
+        ):
+            content_tags.extend(
+                content_file.get("content_tags", []) for content_file in chunk
+            )
+            # Files without a key can't be matched by the bulk upsert
+            keyed_chunk = [
+                content_file for content_file in chunk if content_file.get("key")
+            ]
+            try:
+                content_files_ids.extend(
+                    bulk_load_content_files(course_run, keyed_chunk)
+                )
+            except:  # noqa: E722
+                log.exception(
+                    "ERROR bulk syncing course files for run %d, syncing one at a time",
+                    course_run.id,
+                )
+                content_files_ids.extend(
+                    load_content_file(course_run, content_file)
+                    for content_file in keyed_chunk
+                )
+            content_files_ids.extend(
+                load_content_file(course_run, content_file)
+                for content_file in chunk
+                if not content_file.get("key")
+            )
         if calc_completeness:
             calculate_completeness(course_run, content_tags=content_tags)
         content_files_loaded_actions(run=course_run, deindex_only=False)
@@ -879,12 +1475,16 @@ def load_podcasts(podcasts_data: list[dict]) -> list[LearningResource]:
     return podcast_resources
 
 
-def load_video(video_data: dict) -> LearningResource:
+def load_video(
+    video_data: dict, *, similar_topics: list[dict] | None = None
+) -> LearningResource:
     """
     Load a video into the database
 
     Args:
         video_data (dict): the video data
+        similar_topics (list of dict): topics already looked up for the video,
+            used instead of looking them up again if it has no topics
 
     Returns:
         LearningResource: the created or updated video resource
@@ -911,7 +1511,11 @@ def load_video(video_data: dict) -> LearningResource:
         )
         load_image(learning_resource, image_data)
         if not topics_data:
-            topics_data = similar_topics_action(learning_resource)
+            topics_data = (
+                similar_topics_action(learning_resource)
+                if similar_topics is None
+                else similar_topics
+            )
         load_topics(learning_resource, topics_data)
         load_offered_by(learning_resource, offered_by_data)
 
@@ -931,8 +1535,34 @@ def load_videos(videos_data: iter) -> list[LearningResource]:
         list of Video:
             the list of loaded videos
     """
+    videos_data = list(videos_data)
+    # Look up topics for all videos without any in one go rather than one by one
+    untagged_indexes = [
+        index
+        for index, video_data in enumerate(videos_data)
+        if not video_data.get("topics")
+    ]
+    similar_topics = [None] * len(videos_data)
+    if untagged_indexes:
+        for index, topics_data in zip(
+            untagged_indexes,
+            bulk_similar_topics_action(
+                [
+                    LearningResource(
+                        title=videos_data[index].get("title"),
+                        description=videos_data[index].get("description"),
+                        full_description=videos_data[index].get("full_description"),
+                    )
+                    for index in untagged_indexes
+                ]
+            ),
+        ):
+            similar_topics[index] = topics_data
 
-    return [load_video(video_data) for video_data in videos_data]
+    return [
+        load_video(video_data, similar_topics=topics_data)
+        for video_data, topics_data in zip(videos_data, similar_topics)
+    ]
 
 
 def load_playlist(video_channel: VideoChannel, playlist_data: dict) -> LearningResource:
@@ -26,6 +26,9 @@ from learning_resources.etl.constants import (
 )
 from learning_resources.etl.exceptions import ExtractException
 from learning_resources.etl.loaders import (
+    bulk_load_content_files,
+    bulk_load_courses,
+    bulk_unpublish_runs,
     calculate_completeness,
     load_content_file,
     load_content_files,
@@ -132,6 +135,9 @@ def mock_upsert_tasks(mocker):
         batch_deindex_resources=mocker.patch(
             "learning_resources_search.tasks.bulk_deindex_learning_resources"
         ),
+        batch_deindex_runs=mocker.patch(
+            "learning_resources_search.tasks.bulk_deindex_run_content_files"
+        ),
     )
 
 
@@ -832,6 +838,301 @@ def test_load_courses(mocker, mock_blocklist, mock_duplicates, prune):
     assert course_to_unpublish.learning_resource.published is not prune
 
 
+def test_load_courses_prune_unpublishes_together(mocker):
+    """Courses no longer in the source should be unpublished with a single call"""
+    mock_unpublished_actions = mocker.patch(
+        "learning_resources.etl.loaders.bulk_resources_unpublished_actions"
+    )
+    stale_courses = CourseFactory.create_batch(2, etl_source=ETLSource.xpro.name)
+    CourseFactory.create(etl_source=ETLSource.xpro.name, is_unpublished=True)
+    course = CourseFactory.create(etl_source=ETLSource.xpro.name)
+    mocker.patch(
+        "learning_resources.etl.loaders.load_course",
+        return_value=course.learning_resource,
+    )
+    load_courses(
+        ETLSource.xpro.name,
+        [{"readable_id": course.learning_resource.readable_id}],
+        config=CourseLoaderConfig(prune=True),
+    )
+    stale_ids = [stale_course.learning_resource.id for stale_course in stale_courses]
+    mock_unpublished_actions.assert_called_once()
+    unpublished_ids, resource_type = mock_unpublished_actions.call_args.args
+    assert sorted(unpublished_ids) == sorted(stale_ids)
+    assert resource_type == LearningResourceType.course.name
+    assert not LearningResource.objects.filter(
+        id__in=stale_ids, published=True
+    ).exists()
+
+
+def test_bulk_unpublish_runs(mocker):
+    """bulk_unpublish_runs should unpublish runs and trigger a single action"""
+    mock_runs_unpublished_actions = mocker.patch(
+        "learning_resources.etl.loaders.bulk_resource_runs_unpublished_actions"
+    )
+    runs = LearningResourceRunFactory.create_batch(2, published=True)
+    bulk_unpublish_runs([run.id for run in runs])
+    mock_runs_unpublished_actions.assert_called_once_with([run.id for run in runs])
+    for run in runs:
+        run.refresh_from_db()
+        assert run.published is False
+    bulk_unpublish_runs([])
+    mock_runs_unpublished_actions.assert_called_once()
+
+
+def _bulk_course_data(platform, readable_ids, *, now, department, parent_topic):
+    """Return course data for bulk loading tests"""
+    return [
+        {
+            "readable_id": readable_id,
+            "platform": platform.code,
+            "professional": False,
+            "certification": index % 2 == 0,
+            "title": f"Course {readable_id}",
+            "description": "description",
+            "url": f"https://test.edu/{readable_id}",
+            "published": True,
+            "image": {"url": "https://test.edu/image.jpg", "alt": "image"},
+            "offered_by": {"code": OfferedBy.xpro.name},
+            "topics": [{"name": parent_topic.name}, {"name": "Child topic"}]
+            if index
+            else [{"name": "Missing topic"}],
+            "departments": [department.department_id],
+            "content_tags": [f"Tag {index}", "Shared tag"],
+            "course": {"course_numbers": []},
+            "runs": [
+                {
+                    "run_id": f"{readable_id}+run{run_index}",
+                    "title": f"Run {run_index}",
+                    "start_date": now + timedelta(days=run_index * 30 - 15),
+                    "end_date": now + timedelta(days=run_index * 30 + 60),
+                    "prices": [Decimal("100.00"), Decimal("25.00")],
+                    "image": {"url": f"https://test.edu/{readable_id}/run.jpg"},
+                    "instructors": [
+                        {"first_name": "Jane", "last_name": "Doe"},
+                        {"full_name": f"Instructor {index}"},
+                    ],
+                }
+                for run_index in range(index + 1)
+            ],
+        }
+        for index, readable_id in enumerate(readable_ids)
+    ]
+
+
+def _course_values(resource):
+    """Return the loaded values of a course for comparison"""
+    return {
+        **model_to_dict(
+            resource,
+            fields=[
+                "professional",
+                "certification",
+                "description",
+                "published",
+                "delivery",
+                "offered_by",
+                "departments",
+                "next_start_date",
+                "availability",
+                "prices",
+                "location",
+            ],
+        ),
+        "image": resource.image.url if resource.image else None,
+        "topics": sorted(topic.name for topic in resource.topics.all()),
+        "content_tags": sorted(tag.name for tag in resource.content_tags.all()),
+        "course": model_to_dict(resource.course, exclude=["id", "learning_resource"]),
+        "runs": [
+            {
+                **model_to_dict(
+                    run,
+                    exclude=[
+                        "id",
+                        "learning_resource",
+                        "run_id",
+                        "image",
+                        "instructors",
+                    ],
+                ),
+                "image": run.image.url.split("/")[-1],
+                "instructors": sorted(
+                    instructor.full_name for instructor in run.instructors.all()
+                ),
+            }
+            for run in resource.runs.exclude(run_id="old-run").order_by("start_date")
+        ],
+        "old_runs_published": list(
+            resource.runs.filter(run_id="old-run").values_list("published", flat=True)
+        ),
+    }
+
+
+@pytest.mark.parametrize("course_exists", [True, False])
+def test_bulk_load_courses(mocker, mock_upsert_tasks, settings, course_exists):
+    """bulk_load_courses should load courses the same way load_course does"""
+    settings.ETL_BULK_LOAD_CHUNK_SIZE = 2
+    mock_upserted = mocker.patch(
+        "learning_resources.etl.loaders.bulk_resources_upserted_actions"
+    )
+    single_platform, bulk_platform = (
+        LearningResourcePlatformFactory.create(code=code)
+        for code in (PlatformType.ocw.name, PlatformType.mitxonline.name)
+    )
+    LearningResourceOfferorFactory.create(is_xpro=True)
+    department = LearningResourceDepartmentFactory.create()
+    parent_topic = LearningResourceTopicFactory.create(name="Parent topic")
+    LearningResourceTopicFactory.create(name="Child topic", parent=parent_topic)
+    readable_ids = ["course-a", "course-b", "course-c"]
+    now = timezone.now()
+    if course_exists:
+        for platform in (single_platform, bulk_platform):
+            course = CourseFactory.create(
+                platform=platform.code,
+                learning_resource__readable_id=readable_ids[1],
+                learning_resource__runs=[],
+            )
+            LearningResourceRunFactory.create(
+                learning_resource=course.learning_resource,
+                run_id="old-run",
+                published=True,
+            )
+
+    single_results = [
+        load_course(course_data, [], [], config=CourseLoaderConfig(prune=True))
+        for course_data in _bulk_course_data(
+            single_platform,
+            readable_ids,
+            now=now,
+            department=department,
+            parent_topic=parent_topic,
+        )
+    ]
+    bulk_results = bulk_load_courses(
+        _bulk_course_data(
+            bulk_platform,
+            readable_ids,
+            now=now,
+            department=department,
+            parent_topic=parent_topic,
+        ),
+        [],
+        [],
+        config=CourseLoaderConfig(prune=True, bulk=True),
+    )
+
+    assert [resource.readable_id for resource in bulk_results] == readable_ids
+    for single_result, bulk_result in zip(single_results, bulk_results):
+        single_result.refresh_from_db()
+        bulk_result.refresh_from_db()
+        assert bulk_result.platform == bulk_platform
+        assert _course_values(bulk_result) == _course_values(single_result)
+    assert mock_upserted.call_count == 2
+    mock_upserted.assert_any_call(
+        [resource.id for resource in bulk_results[:2]],
+        LearningResourceType.course.name,
+        [
+            resource.id
+            for resource in bulk_results[:2]
+            if not course_exists or resource.readable_id != readable_ids[1]
+        ],
+    )
+
+
+def test_bulk_load_courses_mixed_platforms(mocker, mock_upsert_tasks):
+    """
+    bulk_load_courses should only match existing courses on both platform and
+    readable_id when a chunk mixes platforms
+    """
+    mocker.patch("learning_resources.etl.loaders.bulk_resources_upserted_actions")
+    platform, other_platform = (
+        LearningResourcePlatformFactory.create(code=code)
+        for code in (PlatformType.ocw.name, PlatformType.mitxonline.name)
+    )
+    LearningResourceOfferorFactory.create(is_xpro=True)
+    department = LearningResourceDepartmentFactory.create()
+    parent_topic = LearningResourceTopicFactory.create(name="Parent topic")
+    LearningResourceTopicFactory.create(name="Child topic", parent=parent_topic)
+    other_course = CourseFactory.create(
+        platform=platform.code, learning_resource__readable_id="course-b"
+    ).learning_resource
+    now = timezone.now()
+    courses_data = [
+        *_bulk_course_data(
+            platform,
+            ["course-a"],
+            now=now,
+            department=department,
+            parent_topic=parent_topic,
+        ),
+        *_bulk_course_data(
+            other_platform,
+            ["course-b"],
+            now=now,
+            department=department,
+            parent_topic=parent_topic,
+        ),
+    ]
+
+    results = bulk_load_courses(
+        courses_data, [], [], config=CourseLoaderConfig(bulk=True)
+    )
+
+    assert [(result.platform_id, result.readable_id) for result in results] == [
+        (platform.code, "course-a"),
+        (other_platform.code, "course-b"),
+    ]
+    assert other_course.id not in {result.id for result in results}
+    other_course.refresh_from_db()
+    assert other_course.title != "Course course-b"
+
+
+def test_bulk_load_courses_fallback(mocker, mock_upsert_tasks):
+    """Courses bulk loading can't handle should be loaded by load_course"""
+    mocker.patch("learning_resources.etl.loaders.bulk_resources_upserted_actions")
+    mock_load_course = mocker.patch(
+        "learning_resources.etl.loaders.load_course", autospec=True
+    )
+    platform = LearningResourcePlatformFactory.create()
+    courses_data = [
+        {"readable_id": "unique", "platform": platform.code, "runs": []},
+        {"readable_id": "duplicate", "platform": platform.code, "runs": []},
+        {"readable_id": "repeated", "platform": platform.code, "runs": []},
+        {"readable_id": "repeated", "platform": platform.code, "runs": []},
+        {
+            "readable_id": "url",
+            "url": "https://test.edu/url",
+            "unique_field": "url",
+            "platform": platform.code,
+            "runs": [],
+        },
+    ]
+    duplicates = [{"course_id": "other", "duplicate_course_ids": ["duplicate"]}]
+    config = CourseLoaderConfig(bulk=True)
+    results = bulk_load_courses(courses_data, [], duplicates, config=config)
+    assert [resource.readable_id for resource in results[:2]] == ["unique", "repeated"]
+    assert results[0].published is False
+    assert mock_load_course.call_count == 3
+    for course_data in courses_data[1:2] + courses_data[3:]:
+        mock_load_course.assert_any_call(course_data, [], duplicates, config=config)
+
+
+def test_load_courses_bulk(mocker, mock_blocklist, mock_duplicates):
+    """load_courses should load courses in bulk if configured to"""
+    mock_bulk_load_courses = mocker.patch(
+        "learning_resources.etl.loaders.bulk_load_courses", return_value=[]
+    )
+    courses_data = [{"readable_id": "abc"}]
+    config = CourseLoaderConfig(bulk=True)
+    load_courses(ETLSource.xpro.name, courses_data, config=config)
+    mock_bulk_load_courses.assert_called_once_with(
+        courses_data,
+        mock_blocklist.return_value,
+        mock_duplicates.return_value,
+        config=config,
+    )
+
+
 def test_load_programs(mocker, mock_blocklist, mock_duplicates):
     """Test that load_programs calls the expected functions"""
     program_data = [{"courses": [{"platform": "a"}, {}], "id": 5}]
@@ -892,6 +1193,67 @@ def test_load_content_files(mocker, is_published, extra_run, calc_score):
     assert mock_calc_score.call_count == (1 if calc_score else 0)
 
 
+@pytest.mark.parametrize("file_count", [2, 20])
+def test_bulk_load_content_files(django_assert_num_queries, file_count):
+    """bulk_load_content_files should upsert files and tags with a fixed number of queries"""
+    course_run = LearningResourceRunFactory.create()
+    existing = ContentFileFactory.create(
+        run=course_run, key="existing", content="old text", checksum="old"
+    )
+    existing.content_tags.set([LearningResourceContentTagFactory.create(name="Old")])
+    content_data = [
+        {"key": "existing", "checksum": "old", "published": True, "content_tags": []},
+        *(
+            {
+                "key": f"file-{index}",
+                "checksum": f"checksum-{index}",
+                "content": f"text {index}",
+                "published": True,
+                "content_tags": ["Lecture Notes", f"Tag {index % 2}"],
+            }
+            for index in range(file_count)
+        ),
+    ]
+    with django_assert_num_queries(9):
+        ids = bulk_load_content_files(course_run, content_data)
+
+    content_files = ContentFile.objects.in_bulk(ids)
+    assert ids[0] == existing.id
+    existing.refresh_from_db()
+    assert existing.content == "old text"
+    assert list(existing.content_tags.all()) == []
+    for content_file_id, content_file_data in zip(ids[1:], content_data[1:]):
+        content_file = content_files[content_file_id]
+        assert content_file.run == course_run
+        assert content_file.key == content_file_data["key"]
+        assert content_file.content == content_file_data["content"]
+        assert sorted(tag.name for tag in content_file.content_tags.all()) == sorted(
+            content_file_data["content_tags"]
+        )
+
+
+def test_load_content_files_bulk_error(mocker):
+    """Files should be loaded one at a time if the bulk upsert fails"""
+    course = LearningResourceFactory.create(is_course=True, create_runs=False)
+    course_run = LearningResourceRunFactory.create(learning_resource=course)
+    mocker.patch(
+        "learning_resources.etl.loaders.bulk_load_content_files",
+        side_effect=ValueError,
+    )
+    mock_log = mocker.patch("learning_resources.etl.loaders.log.exception")
+    mock_load_content_file = mocker.patch(
+        "learning_resources.etl.loaders.load_content_file", return_value=1
+    )
+    content_data = [{"key": "a"}, {"key": "b"}]
+    assert load_content_files(course_run, content_data) == [1, 1]
+    mock_log.assert_called_once_with(
+        "ERROR bulk syncing course files for run %d, syncing one at a time",
+        course_run.id,
+    )
+    for content_file_data in content_data:
+        mock_load_content_file.assert_any_call(course_run, content_file_data)
+
+
 def test_load_content_file():
     """Test that load_content_file saves a ContentFile object"""
     learning_resource_run = LearningResourceRunFactory.create()
@@ -1207,9 +1569,10 @@ def test_load_video(mocker, video_exists, is_published, pass_topics):
         assert getattr(result, key) == value, f"Property {key} should equal {value}"
 
 
-def test_load_videos():
+def test_load_videos(mocker):
     """Verify that load_videos loads a list of videos"""
     assert Video.objects.count() == 0
+    topic = LearningResourceTopicFactory.create(name="Biology")
     video_resources = [video.learning_resource for video in VideoFactory.build_batch(5)]
     videos_data = [
         {
@@ -1219,12 +1582,26 @@ def test_load_videos():
         }
         for video in video_resources
     ]
+    videos_data[0]["topics"] = [{"name": topic.name}]
+    mock_bulk_similar_topics_action = mocker.patch(
+        "learning_resources.etl.loaders.bulk_similar_topics_action",
+        return_value=[[{"name": topic.name}], [], [], []],
+    )
+    mock_similar_topics_action = mocker.patch(
+        "learning_resources.etl.loaders.similar_topics_action", return_value=[]
+    )
 
-    results = load_videos(videos_data)
+    results = load_videos(video_data for video_data in videos_data)
 
     assert len(results) == len(video_resources)
 
     assert Video.objects.count() == len(video_resources)
+    bulk_resources = mock_bulk_similar_topics_action.call_args[0][0]
+    assert [resource.title for resource in bulk_resources] == [
+        video_data["title"] for video_data in videos_data[1:]
+    ]
+    mock_similar_topics_action.assert_not_called()
+    assert [list(result.topics.all()) for result in results[:2]] == [[topic], [topic]]
 
 
 def test_load_playlist(mocker):
@@ -1238,6 +1615,10 @@ def test_load_playlist(mocker):
         "learning_resources.etl.loaders.most_common_topics",
         return_value=expected_topics,
     )
+    mocker.patch(
+        "learning_resources.etl.loaders.bulk_similar_topics_action",
+        return_value=[[] for _ in range(5)],
+    )
     channel = VideoChannelFactory.create()
     playlist = VideoPlaylistFactory.build().learning_resource
     assert VideoPlaylist.objects.count() == 0
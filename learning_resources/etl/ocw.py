@@ -3,6 +3,7 @@
 import copy
 import logging
 import mimetypes
+from collections.abc import Generator
 from datetime import datetime
 from json import JSONDecodeError
 from pathlib import Path
@@ -33,6 +34,7 @@ from learning_resources.etl.utils import (
     extract_text_metadata,
     generate_course_numbers_json,
     get_content_type,
+    map_concurrently,
     transform_levels,
     transform_topics,
 )
@@ -42,7 +44,6 @@ from learning_resources.models import (
     default_delivery,
 )
 from learning_resources.utils import (
-    get_s3_object_and_read,
     parse_instructors,
     safe_load_json,
 )
@@ -105,6 +106,52 @@ def parse_learn_topics(course_data: dict) -> list[dict]:
         )
 
 
+def get_s3_object(s3_client, s3_key: str) -> dict:
+    """
+    Get an object from the OCW bucket. Unlike boto3 resources, clients are
+    thread-safe, so this is how objects are read from worker threads.
+
+    Args:
+        s3_client (botocore.client.S3): The S3 client
+        s3_key (str): The key of the object
+
+    Returns:
+        dict: the GetObject response, with the object's Body and LastModified
+    """
+    return s3_client.get_object(Bucket=settings.OCW_LIVE_BUCKET, Key=s3_key)
+
+
+def list_course_objects(
+    s3_resource: boto3.resource, course_prefix: str
+) -> tuple[list, list, dict]:
+    """
+    List the objects of a course in the s3 bucket. One listing gives both the
+    data.json files to read and when every file was last modified, so files
+    that haven't changed since they were last synced don't need to be fetched.
+
+    Args:
+        s3_resource (boto3.resource): The S3 resource
+        course_prefix (str): String used to query S3 bucket for course data JSONs
+
+    Returns:
+        tuple: the page data.json objects, the resource data.json objects, and
+            when each object was last modified by key
+    """
+    bucket = s3_resource.Bucket(name=settings.OCW_LIVE_BUCKET)
+    page_objects = []
+    resource_objects = []
+    last_modified_by_key = {}
+    for obj in bucket.objects.filter(Prefix=course_prefix):
+        last_modified_by_key[obj.key] = obj.last_modified
+        if not obj.key.endswith("data.json"):
+            continue
+        if obj.key.startswith(course_prefix + "pages/"):
+            page_objects.append(obj)
+        elif obj.key.startswith(course_prefix + "resources/"):
+            resource_objects.append(obj)
+    return page_objects, resource_objects, last_modified_by_key
+
+
 def transform_content_files(
     s3_resource: boto3.resource,
     course_prefix: str,
@@ -122,33 +169,64 @@ def transform_content_files(
         dict: transformed content file data
 
     """
-    bucket = s3_resource.Bucket(name=settings.OCW_LIVE_BUCKET)
-
-    for obj in bucket.objects.filter(Prefix=course_prefix + "pages/"):
-        if obj.key.endswith("data.json"):
-            try:
-                course_page_json = safe_load_json(get_s3_object_and_read(obj), obj.key)
-                yield transform_page(obj.key, course_page_json)
+    page_objects, resource_objects, last_modified_by_key = list_course_objects(
+        s3_resource, course_prefix
+    )
+    # The worker threads share the resource's client, the resource itself is
+    # not thread-safe
+    s3_client = s3_resource.meta.client
+
+    def transform_page_object(obj):
+        try:
+            course_page_json = safe_load_json(
+                get_s3_object(s3_client, obj.key)["Body"].read(), obj.key
+            )
+            return transform_page(obj.key, course_page_json)
+        except:  # noqa: E722
+            log.exception(
+                "ERROR syncing course file %s for course %s", obj.key, course_prefix
+            )
+            return None
 
-            except:  # noqa: E722
-                log.exception(
-                    "ERROR syncing course file %s for course %s", obj.key, course_prefix
-                )
+    for _, transformed_page in map_concurrently(
+        transform_page_object, page_objects, max_workers=settings.OCW_S3_CONCURRENCY
+    ):
+        if transformed_page:
+            yield transformed_page
+
+    updated_on_by_key = {}
+    for key, updated_on in (
+        ContentFile.objects.filter(key__startswith=course_prefix.lstrip("/"))
+        .order_by("id")
+        .values_list("key", "updated_on")
+    ):
+        updated_on_by_key.setdefault(key, updated_on)
 
-    for obj in bucket.objects.filter(Prefix=course_prefix + "resources/"):
-        if obj.key.endswith("data.json"):
-            try:
-                resource_json = safe_load_json(get_s3_object_and_read(obj), obj.key)
-                transformed_resource = transform_contentfile(
-                    obj.key, resource_json, s3_resource, force_overwrite
-                )
-                if transformed_resource:
-                    yield transformed_resource
+    def transform_resource(obj):
+        try:
+            resource_json = safe_load_json(
+                get_s3_object(s3_client, obj.key)["Body"].read(), obj.key
+            )
+            return transform_contentfile(
+                obj.key,
+                resource_json,
+                s3_client,
+                force_overwrite,
+                updated_on_by_key=updated_on_by_key,
+                last_modified_by_key=last_modified_by_key,
+            )
+        except:  # noqa: E722
+            log.exception(
+                "ERROR syncing course file %s for course %s", obj.key, course_prefix
+            )
+            return None
 
-            except:  # noqa: E722
-                log.exception(
-                    "ERROR syncing course file %s for course %s", obj.key, course_prefix
-                )
+    # Resource files are downloaded and sent to tika concurrently
+    for _, transformed_resource in map_concurrently(
+        transform_resource, resource_objects, max_workers=settings.TIKA_CONCURRENCY
+    ):
+        if transformed_resource:
+            yield transformed_resource
 
 
 def transform_page(s3_key: str, page_data: dict) -> dict:
@@ -177,11 +255,14 @@ def transform_page(s3_key: str, page_data: dict) -> dict:
 
 
 @retry((ReadTimeout, JSONDecodeError), tries=3, delay=1, backoff=2, jitter=(1, 5))
-def get_file_content(
+def get_file_content(  # noqa: PLR0913
     s3_path: str,
     file_s3_path: str,
-    s3_resource: boto3.resource,
+    s3_client,
     force_overwrite: bool,  # noqa: FBT001
+    *,
+    updated_on_by_key: dict | None = None,
+    last_modified_by_key: dict | None = None,
 ) -> dict:
     """
     Return the text content of the file if it is a valid text file
@@ -189,27 +270,41 @@ def get_file_content(
     Args:
         s3_path (str): S3 path for the data.json file for the page
         file_s3_path (str): S3 path for the file
-        s3_resource (boto3.resource): The S3 resource
+        s3_client (botocore.client.S3): The S3 client
         force_overwrite (bool): Overwrite document text if true
+        updated_on_by_key (dict): When the existing content files were last
+            updated, by key. Looked up in the database if not provided.
+        last_modified_by_key (dict): When the files in the bucket were last
+            modified, by S3 key. Files listed here are only fetched if they
+            were modified after their content file was last updated.
     """
     ext_lower = Path(file_s3_path).suffix.lower()
     mime_type = mimetypes.types_map.get(file_s3_path)
     content_json = None
 
     if ext_lower in VALID_TEXT_FILE_TYPES:
-        s3_obj = s3_resource.Object(
-            settings.OCW_LIVE_BUCKET, unquote(file_s3_path)
-        ).get()
-
-        course_file_obj = ContentFile.objects.filter(key=s3_path).first()
+        s3_key = unquote(file_s3_path)
+        if updated_on_by_key is None:
+            course_file_obj = ContentFile.objects.filter(key=s3_path).first()
+            updated_on = course_file_obj.updated_on if course_file_obj else None
+        else:
+            updated_on = updated_on_by_key.get(s3_path)
+
+        last_modified = (last_modified_by_key or {}).get(s3_key)
+        if (
+            not force_overwrite
+            and updated_on is not None
+            and last_modified is not None
+            and last_modified < updated_on
+        ):
+            return None
+
+        s3_obj = get_s3_object(s3_client, s3_key)
 
         needs_text_update = (
             force_overwrite
-            or course_file_obj is None
-            or (
-                s3_obj is not None
-                and s3_obj["LastModified"] >= course_file_obj.updated_on
-            )
+            or updated_on is None
+            or (s3_obj is not None and s3_obj["LastModified"] >= updated_on)
         )
 
         if needs_text_update:
@@ -226,11 +321,14 @@ def get_file_content(
     return None
 
 
-def transform_contentfile(
+def transform_contentfile(  # noqa: PLR0913
     s3_key: str,
     contentfile_data: dict,
-    s3_resource: boto3.resource,
+    s3_client,
     force_overwrite: bool,  # noqa: FBT001
+    *,
+    updated_on_by_key: dict | None = None,
+    last_modified_by_key: dict | None = None,
 ) -> dict:
     """
     Transform the data from data.json for a content file
@@ -238,9 +336,12 @@ def transform_contentfile(
     Args:
         s3_key (str):S3 path for the data.json file for the page
         contentfile_data (dict): JSON data from the data.json file for the page
-        s3_resource (str): The S3 file
+        s3_client (botocore.client.S3): The S3 client
         force_overwrite (bool): Overwrite document text if true
-
+        updated_on_by_key (dict): When the existing content files were last
+            updated, by key
+        last_modified_by_key (dict): When the files in the bucket were last
+            modified, by S3 key
 
     Returns:
         dict: transformed content file data
@@ -279,7 +380,14 @@ def transform_contentfile(
     if not file_s3_path.startswith("courses"):
         file_s3_path = "courses" + file_s3_path.split("courses")[1]
 
-    content_json = get_file_content(s3_path, file_s3_path, s3_resource, force_overwrite)
+    content_json = get_file_content(
+        s3_path,
+        file_s3_path,
+        s3_client,
+        force_overwrite,
+        updated_on_by_key=updated_on_by_key,
+        last_modified_by_key=last_modified_by_key,
+    )
     if content_json:
         contentfile_data["content"] = content_json.get("content")
 
@@ -414,12 +522,68 @@ def transform_course(course_data: dict) -> dict:
     }
 
 
+def get_course_data(
+    *,
+    url_path: str,
+    s3_client,
+) -> tuple[dict, datetime] | None:
+    """
+    Read the data.json for an OCW course from S3
+
+    Args:
+        url_path (str): The course url path
+        s3_client (botocore.client.S3): The S3 client
+
+    Returns:
+        tuple: The course data and when it was last modified, or None if it
+            could not be read
+    """
+    if not url_path.endswith("/"):
+        url_path = f"{url_path}/"
+    s3_key = url_path + "data.json"
+    try:
+        response = get_s3_object(s3_client, s3_key)
+        course_json = safe_load_json(response["Body"].read(), s3_key)
+    except:  # noqa: E722
+        log.exception("Error encountered reading data.json for %s", url_path)
+        return None
+    return course_json, response["LastModified"]
+
+
+def prefetch_course_data(
+    *,
+    url_paths: list[str],
+    s3_resource: boto3.resource,
+) -> Generator[tuple, None, None]:
+    """
+    Read the data.json for OCW courses from S3, with up to OCW_S3_CONCURRENCY
+    requests in flight, so that the next courses are ready by the time the
+    current one has been loaded
+
+    Args:
+        url_paths (list of str): The course url paths
+        s3_resource (boto3.resource): Boto3 s3 resource
+
+    Yields:
+        tuple: each url path and the result of get_course_data for it
+    """
+    # The worker threads share the resource's client, the resource itself is
+    # not thread-safe
+    s3_client = s3_resource.meta.client
+    yield from map_concurrently(
+        lambda url_path: get_course_data(url_path=url_path, s3_client=s3_client),
+        url_paths,
+        max_workers=settings.OCW_S3_CONCURRENCY,
+    )
+
+
 def extract_course(
     *,
     url_path: str,
     s3_resource: boto3.resource,
     force_overwrite: bool = False,
     start_timestamp: datetime | None = None,
+    course_data: tuple[dict, datetime] | None = None,
 ) -> dict:
     """
     Extract OCW course data from S3
@@ -429,6 +593,8 @@ def extract_course(
         s3_resource (boto3.resource): Boto3 s3 resource
         force_overwrite (bool): Force incoming course data to overwrite existing data
         start_timestamp (timestamp): start timestamp of backpopulate command.
+        course_data (tuple): The course data and when it was last modified, if
+            already read by prefetch_course_data
 
     Returns:
         dict of course info from S3
@@ -436,18 +602,13 @@ def extract_course(
     log.info("Syncing: %s ...", url_path)
     if not url_path.endswith("/"):
         url_path = f"{url_path}/"
-    s3_data_object = s3_resource.Object(
-        settings.OCW_LIVE_BUCKET, url_path + "data.json"
-    )
-
-    try:
-        course_json = safe_load_json(
-            get_s3_object_and_read(s3_data_object), s3_data_object.key
+    if course_data is None:
+        course_data = get_course_data(
+            url_path=url_path, s3_client=s3_resource.meta.client
         )
-        last_modified = s3_data_object.last_modified
-    except:  # noqa: E722
-        log.exception("Error encountered reading data.json for %s", url_path)
+    if course_data is None:
         return None
+    course_json, last_modified = course_data
 
     # if course synced before, check if modified since then
     course_instance = LearningResource.objects.filter(
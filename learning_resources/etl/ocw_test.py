@@ -16,9 +16,12 @@ from learning_resources.constants import (
     LearningResourceDelivery,
     Pace,
 )
+from learning_resources.etl import ocw
 from learning_resources.etl.constants import CourseNumberType, ETLSource
 from learning_resources.etl.ocw import (
+    get_course_data,
     parse_learn_topics,
+    prefetch_course_data,
     transform_content_files,
     transform_contentfile,
     transform_course,
@@ -120,9 +123,7 @@ def test_transform_content_files_exceptions(settings, mocker):
     setup_s3_ocw(settings)
     s3_resource = boto3.resource("s3")
     mock_log = mocker.patch("learning_resources.etl.ocw.log.exception")
-    mocker.patch(
-        "learning_resources.etl.ocw.get_s3_object_and_read", side_effect=Exception
-    )
+    mocker.patch("learning_resources.etl.ocw.get_s3_object", side_effect=Exception)
     content_data = list(
         transform_content_files(s3_resource, OCW_TEST_PREFIX, False)  # noqa: FBT003
     )
@@ -130,6 +131,59 @@ def test_transform_content_files_exceptions(settings, mocker):
     assert mock_log.call_count == 5
 
 
+@mock_s3
+@pytest.mark.parametrize("overwrite", [True, False])
+def test_transform_content_files_unchanged_files(settings, mocker, overwrite):
+    """Files not modified since their content files were updated should not be fetched"""
+    setup_s3_ocw(settings)
+    s3_resource = boto3.resource("s3")
+    mocker.patch.object(s3_resource, "Object", side_effect=AssertionError)
+    mock_get_object = mocker.patch(
+        "learning_resources.etl.ocw.get_s3_object", wraps=ocw.get_s3_object
+    )
+    mock_tika = mocker.patch(
+        "learning_resources.etl.ocw.extract_text_metadata",
+        return_value={"content": "TEXT"},
+    )
+    for resource in ("resource", "video"):
+        ContentFileFactory.create(key=f"{OCW_TEST_PREFIX}resources/{resource}/")
+
+    content_data = list(
+        transform_content_files(s3_resource, OCW_TEST_PREFIX, overwrite)
+    )
+
+    assert len(content_data) == 4
+    fetched_files = [
+        call.args[1]
+        for call in mock_get_object.call_args_list
+        if not call.args[1].endswith("data.json")
+    ]
+    assert len(fetched_files) == (2 if overwrite else 0)
+    assert mock_tika.call_count == (2 if overwrite else 0)
+    assert all(("content" in data) is overwrite for data in content_data[2:])
+
+
+@mock_s3
+def test_prefetch_course_data(settings, mocker):
+    """prefetch_course_data should read course data with the client, not the resource"""
+    settings.OCW_S3_CONCURRENCY = 2
+    setup_s3_ocw(settings)
+    s3_resource = boto3.resource("s3")
+    mocker.patch.object(s3_resource, "Object", side_effect=AssertionError)
+    url_paths = [OCW_TEST_PREFIX, "courses/missing"]
+
+    results = list(prefetch_course_data(url_paths=url_paths, s3_resource=s3_resource))
+
+    assert [url_path for url_path, _ in results] == url_paths
+    course_json, last_modified = results[0][1]
+    assert results[0][1] == get_course_data(
+        url_path=OCW_TEST_PREFIX, s3_client=s3_resource.meta.client
+    )
+    assert course_json["site_uid"]
+    assert last_modified is not None
+    assert results[1][1] is None
+
+
 @mock_s3
 @pytest.mark.parametrize("overwrite", [True, False])
 @pytest.mark.parametrize("modified_after_last_import", [True, False])
@@ -162,7 +216,7 @@ def test_transform_content_file_needs_text_update(
         ContentFile.objects.update(updated_on=datetime(2020, 12, 1, tzinfo=UTC))
 
     content_data = transform_contentfile(
-        s3_resource_object.key, resource_json, s3_resource, overwrite
+        s3_resource_object.key, resource_json, s3_resource.meta.client, overwrite
     )
 
     if overwrite or modified_after_last_import:
@@ -174,6 +228,46 @@ def test_transform_content_file_needs_text_update(
         assert "content" not in content_data
 
 
+@mock_s3
+@pytest.mark.parametrize("modified_after_last_import", [True, False])
+def test_transform_contentfile_updated_on_by_key(
+    settings, mocker, django_assert_num_queries, modified_after_last_import
+):
+    """transform_contentfile should use the given update dates instead of querying"""
+    setup_s3_ocw(settings)
+    s3_resource = boto3.resource("s3")
+    mock_tika = mocker.patch(
+        "learning_resources.etl.ocw.extract_text_metadata",
+        return_value={"content": "TEXT"},
+    )
+    s3_resource_object = s3_resource.Object(
+        settings.OCW_LIVE_BUCKET,
+        "courses/16-01-unified-engineering-i-ii-iii-iv-fall-2005-spring-2006/resources/resource/data.json",
+    )
+    resource_json = safe_load_json(
+        get_s3_object_and_read(s3_resource_object), s3_resource_object.key
+    )
+    updated_on = (
+        datetime(2020, 12, 1, tzinfo=UTC)
+        if modified_after_last_import
+        else now_in_utc()
+    )
+
+    with django_assert_num_queries(0):
+        content_data = transform_contentfile(
+            s3_resource_object.key,
+            resource_json,
+            s3_resource.meta.client,
+            False,  # noqa: FBT003
+            updated_on_by_key={
+                "courses/16-01-unified-engineering-i-ii-iii-iv-fall-2005-spring-2006/resources/resource/": updated_on
+            },
+        )
+
+    assert mock_tika.call_count == (1 if modified_after_last_import else 0)
+    assert ("content" in content_data) is modified_after_last_import
+
+
 @mock_s3
 @pytest.mark.parametrize(
     (
@@ -326,7 +420,7 @@ def test_parse_topics(mocker, has_learn_topics):
         "mit_learn_topics": mit_learn_topics,
     }
     mocker.patch(
-        "learning_resources.etl.utils.load_offeror_topic_map",
+        "learning_resources.etl.reference_data.load_offeror_topic_map",
         return_value={
             "Political Philosophy": ["Philosophy"],
             "Ethnography": ["Anthropology"],
@@ -28,109 +28,145 @@ from learning_resources.etl.constants import (
     ProgramLoaderConfig,
 )
 from learning_resources.etl.exceptions import ExtractException
+from learning_resources.etl.reference_data import with_reference_data_cache
 
 log = logging.getLogger(__name__)
 
 load_programs = curry(loaders.load_programs)
 load_courses = curry(loaders.load_courses)
 
-micromasters_etl = compose(
-    load_programs(
-        ETLSource.micromasters.name,
-        config=ProgramLoaderConfig(
-            prune=True, courses=CourseLoaderConfig(fetch_only=True)
+micromasters_etl = with_reference_data_cache(
+    compose(
+        load_programs(
+            ETLSource.micromasters.name,
+            config=ProgramLoaderConfig(
+                prune=True, courses=CourseLoaderConfig(fetch_only=True)
+            ),
         ),
-    ),
-    micromasters.transform,
-    micromasters.extract,
+        micromasters.transform,
+        micromasters.extract,
+    )
 )
 
-mit_edx_courses_etl = compose(
-    load_courses(
-        ETLSource.mit_edx.name,
-        config=CourseLoaderConfig(prune=True),
-    ),
-    mit_edx.transform,
-    mit_edx.extract,
+mit_edx_courses_etl = with_reference_data_cache(
+    compose(
+        load_courses(
+            ETLSource.mit_edx.name,
+            config=CourseLoaderConfig(prune=True, bulk=True),
+        ),
+        mit_edx.transform,
+        mit_edx.extract,
+    )
 )
 
-mit_edx_programs_etl = compose(
-    load_programs(
-        ETLSource.mit_edx.name,
-        config=ProgramLoaderConfig(
-            courses=CourseLoaderConfig(fetch_only=True), prune=True
+mit_edx_programs_etl = with_reference_data_cache(
+    compose(
+        load_programs(
+            ETLSource.mit_edx.name,
+            config=ProgramLoaderConfig(
+                courses=CourseLoaderConfig(fetch_only=True), prune=True
+            ),
         ),
-    ),
-    mit_edx_programs.transform,
-    mit_edx_programs.extract,
+        mit_edx_programs.transform,
+        mit_edx_programs.extract,
+    )
 )
 
-mitxonline_programs_etl = compose(
-    load_programs(
-        ETLSource.mitxonline.name,
-        config=ProgramLoaderConfig(
-            courses=CourseLoaderConfig(fetch_only=True), prune=True
+mitxonline_programs_etl = with_reference_data_cache(
+    compose(
+        load_programs(
+            ETLSource.mitxonline.name,
+            config=ProgramLoaderConfig(
+                courses=CourseLoaderConfig(fetch_only=True), prune=True
+            ),
         ),
-    ),
-    mitxonline.transform_programs,
-    mitxonline.extract_programs,
+        mitxonline.transform_programs,
+        mitxonline.extract_programs,
+    )
 )
-mitxonline_courses_etl = compose(
-    load_courses(ETLSource.mitxonline.name, config=CourseLoaderConfig(prune=True)),
-    mitxonline.transform_courses,
-    mitxonline.extract_courses,
+mitxonline_courses_etl = with_reference_data_cache(
+    compose(
+        load_courses(
+            ETLSource.mitxonline.name, config=CourseLoaderConfig(prune=True, bulk=True)
+        ),
+        mitxonline.transform_courses,
+        mitxonline.extract_courses,
+    )
 )
 
-oll_etl = compose(
-    load_courses(ETLSource.oll.name, config=CourseLoaderConfig(prune=True)),
-    oll.transform,
-    oll.extract,
+oll_etl = with_reference_data_cache(
+    compose(
+        load_courses(
+            ETLSource.oll.name, config=CourseLoaderConfig(prune=True, bulk=True)
+        ),
+        oll.transform,
+        oll.extract,
+    )
 )
 
 
-prolearn_programs_etl = compose(
-    load_programs(
-        ETLSource.prolearn.name,
-        config=ProgramLoaderConfig(courses=CourseLoaderConfig(fetch_only=True)),
-    ),
-    prolearn.transform_programs,
-    prolearn.extract_programs,
+prolearn_programs_etl = with_reference_data_cache(
+    compose(
+        load_programs(
+            ETLSource.prolearn.name,
+            config=ProgramLoaderConfig(courses=CourseLoaderConfig(fetch_only=True)),
+        ),
+        prolearn.transform_programs,
+        prolearn.extract_programs,
+    )
 )
 
 
-prolearn_courses_etl = compose(
-    load_courses(ETLSource.prolearn.name, config=CourseLoaderConfig(prune=True)),
-    prolearn.transform_courses,
-    prolearn.extract_courses,
+prolearn_courses_etl = with_reference_data_cache(
+    compose(
+        load_courses(
+            ETLSource.prolearn.name, config=CourseLoaderConfig(prune=True, bulk=True)
+        ),
+        prolearn.transform_courses,
+        prolearn.extract_courses,
+    )
 )
 
 
-sloan_courses_etl = compose(
-    load_courses(ETLSource.see.name, config=CourseLoaderConfig(prune=True)),
-    sloan.transform_courses,
-    sloan.extract,
+sloan_courses_etl = with_reference_data_cache(
+    compose(
+        load_courses(
+            ETLSource.see.name, config=CourseLoaderConfig(prune=True, bulk=True)
+        ),
+        sloan.transform_courses,
+        sloan.extract,
+    )
 )
 
 
-xpro_programs_etl = compose(
-    load_programs(
-        ETLSource.xpro.name,
-        config=ProgramLoaderConfig(
-            courses=CourseLoaderConfig(fetch_only=True), prune=True
+xpro_programs_etl = with_reference_data_cache(
+    compose(
+        load_programs(
+            ETLSource.xpro.name,
+            config=ProgramLoaderConfig(
+                courses=CourseLoaderConfig(fetch_only=True), prune=True
+            ),
         ),
-    ),
-    xpro.transform_programs,
-    xpro.extract_programs,
+        xpro.transform_programs,
+        xpro.extract_programs,
+    )
 )
-xpro_courses_etl = compose(
-    load_courses(ETLSource.xpro.name, config=CourseLoaderConfig(prune=True)),
-    xpro.transform_courses,
-    xpro.extract_courses,
+xpro_courses_etl = with_reference_data_cache(
+    compose(
+        load_courses(
+            ETLSource.xpro.name, config=CourseLoaderConfig(prune=True, bulk=True)
+        ),
+        xpro.transform_courses,
+        xpro.extract_courses,
+    )
 )
 
-podcast_etl = compose(loaders.load_podcasts, podcast.transform, podcast.extract)
+podcast_etl = with_reference_data_cache(
+    compose(loaders.load_podcasts, podcast.transform, podcast.extract)
+)
 
 
+@with_reference_data_cache
 def ocw_courses_etl(
     *,
     url_paths: list[str],
@@ -153,13 +189,17 @@ def ocw_courses_etl(
         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
     )
     exceptions = []
-    for url_path in url_paths:
+    # The data.json for the next courses is read while the current one loads
+    for url_path, course_data in ocw.prefetch_course_data(
+        url_paths=url_paths, s3_resource=s3_resource
+    ):
         try:
             data = ocw.extract_course(
                 url_path=url_path,
                 s3_resource=s3_resource,
                 force_overwrite=force_overwrite,
                 start_timestamp=start_timestamp,
+                course_data=course_data,
             )
             if data:
                 ocw_course_data = ocw.transform_course(data)
@@ -184,10 +224,14 @@ def ocw_courses_etl(
         raise ExtractException(message)
 
 
-youtube_etl = compose(loaders.load_video_channels, youtube.transform, youtube.extract)
+youtube_etl = with_reference_data_cache(
+    compose(loaders.load_video_channels, youtube.transform, youtube.extract)
+)
 
-posthog_etl = compose(
-    posthog.load_posthog_lrd_view_events,
-    posthog.posthog_transform_lrd_view_events,
-    posthog.posthog_extract_lrd_view_events,
+posthog_etl = with_reference_data_cache(
+    compose(
+        posthog.load_posthog_lrd_view_events,
+        posthog.posthog_transform_lrd_view_events,
+        posthog.posthog_extract_lrd_view_events,
+    )
 )
@@ -54,7 +54,7 @@ def test_mit_edx_courses_etl():
     mock_load_courses.assert_called_once_with(
         ETLSource.mit_edx.name,
         mock_transform.return_value,
-        config=CourseLoaderConfig(prune=True),
+        config=CourseLoaderConfig(prune=True, bulk=True),
     )
 
     assert result == mock_load_courses.return_value
@@ -133,7 +133,7 @@ def test_mitxonline_courses_etl():
     mock_load_courses.assert_called_once_with(
         ETLSource.mitxonline.name,
         mock_transform.return_value,
-        config=CourseLoaderConfig(prune=True),
+        config=CourseLoaderConfig(prune=True, bulk=True),
     )
 
     assert result == mock_load_courses.return_value
@@ -154,7 +154,7 @@ def test_oll_etl():
     mock_load_courses.assert_called_once_with(
         PlatformType.oll.name,
         mock_transform.return_value,
-        config=CourseLoaderConfig(prune=True),
+        config=CourseLoaderConfig(prune=True, bulk=True),
     )
 
     assert result == mock_load_courses.return_value
@@ -198,7 +198,7 @@ def test_xpro_courses_etl():
     mock_load_courses.assert_called_once_with(
         ETLSource.xpro.name,
         mock_transform.return_value,
-        config=CourseLoaderConfig(prune=True),
+        config=CourseLoaderConfig(prune=True, bulk=True),
     )
 
     assert result == mock_load_courses.return_value
@@ -352,7 +352,7 @@ def test_sloan_courses_etl():
     mock_load_courses.assert_called_once_with(
         ETLSource.see.name,
         mock_transform.return_value,
-        config=CourseLoaderConfig(prune=True),
+        config=CourseLoaderConfig(prune=True, bulk=True),
     )
 
     assert result == mock_load_courses.return_value
@@ -394,7 +394,7 @@ def test_prolearn_courses_etl():
     mock_load_courses.assert_called_once_with(
         ETLSource.prolearn.name,
         mock_transform.return_value,
-        config=CourseLoaderConfig(prune=True),
+        config=CourseLoaderConfig(prune=True, bulk=True),
     )
 
     assert result == mock_load_courses.return_value
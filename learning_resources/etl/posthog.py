@@ -13,7 +13,12 @@ import requests
 from django.conf import settings
 
 from learning_resources.exceptions import PostHogAuthenticationError, PostHogQueryError
-from learning_resources.models import LearningResource, LearningResourceViewEvent
+from learning_resources.models import (
+    LearningResource,
+    LearningResourceViewCount,
+    LearningResourceViewEvent,
+)
+from main.utils import chunks
 
 log = logging.getLogger(__name__)
 
@@ -216,64 +221,116 @@ def posthog_transform_lrd_view_events(
         )
 
 
-def load_posthog_lrd_view_event(
-    event: PostHogLearningResourceViewEvent,
-) -> LearningResourceViewEvent | None:
+def parse_posthog_event_date(event_date: datetime | str) -> datetime:
     """
-    Load a PostHogLearningResourceViewEvent into the database.
+    Parse a PostHog event timestamp.
+
+    PostHog returns naive timestamps that are in UTC.
 
     Args:
-    - event (PostHogLearningResourceViewEvent): the event to load
+    - event_date (datetime | str): the timestamp
     Returns:
-    LearningResourceViewEvent of the event
+    Timezone-aware datetime of the timestamp
     """
 
-    try:
-        learning_resource = LearningResource.objects.filter(pk=event.resourceId).get()
-    except LearningResource.DoesNotExist:
-        skip_warning = (
-            f"WARNING: skipping event for resource ID {event.resourceId}"
-            " - resource not found"
-        )
-        log.warning(skip_warning)
-        return None
-    except LearningResource.MultipleObjectsReturned:
-        skip_warning = (
-            f"WARNING: skipping event for resource ID {event.resourceId}"
-            " - multiple objects returned"
+    if isinstance(event_date, str):
+        event_date = datetime.fromisoformat(event_date)
+
+    if event_date.tzinfo is None:
+        event_date = event_date.replace(tzinfo=UTC)
+
+    return event_date
+
+
+def load_posthog_lrd_view_event_batch(
+    events: list[PostHogLearningResourceViewEvent],
+) -> list[LearningResourceViewEvent]:
+    """
+    Load a batch of PostHogLearningResourceViewEvents into the database.
+
+    Resource ids are checked with one query and events that already exist, or
+    that appear more than once in the batch, are skipped.
+
+    Args:
+    - events (list[PostHogLearningResourceViewEvent]): the events to load
+    Returns:
+    List of the LearningResourceViewEvents that were created
+    """
+
+    view_keys = []
+
+    for event in events:
+        try:
+            resource_id = int(event.resourceId)
+        except (TypeError, ValueError):
+            log.warning(
+                "WARNING: skipping event for resource ID %s - invalid ID",
+                event.resourceId,
+            )
+            continue
+
+        view_keys.append((resource_id, parse_posthog_event_date(event.event_date)))
+
+    resource_ids = {resource_id for resource_id, _ in view_keys}
+    found_resource_ids = set(
+        LearningResource.objects.filter(id__in=resource_ids).values_list(
+            "id", flat=True
         )
-        log.warning(skip_warning)
-        return None
-    except ValueError:
-        skip_warning = (
-            f"WARNING: skipping event for resource ID {event.resourceId}"
-            " - invalid ID"
+    )
+
+    for resource_id in resource_ids - found_resource_ids:
+        log.warning(
+            "WARNING: skipping event for resource ID %s - resource not found",
+            resource_id,
         )
-        log.warning(skip_warning)
-        return None
-
-    lr_event, _ = LearningResourceViewEvent.objects.update_or_create(
-        learning_resource=learning_resource,
-        event_date=event.event_date,
-        defaults={
-            "learning_resource": learning_resource,
-            "event_date": event.event_date,
-        },
+
+    # dict.fromkeys dedupes the events while keeping their order
+    view_keys = dict.fromkeys(
+        view_key for view_key in view_keys if view_key[0] in found_resource_ids
+    )
+    existing_keys = set(
+        LearningResourceViewEvent.objects.filter(
+            learning_resource_id__in={resource_id for resource_id, _ in view_keys},
+            event_date__in={event_date for _, event_date in view_keys},
+        ).values_list("learning_resource_id", "event_date")
     )
 
-    return lr_event
+    created = LearningResourceViewEvent.objects.bulk_create(
+        [
+            LearningResourceViewEvent(
+                learning_resource_id=resource_id, event_date=event_date
+            )
+            for resource_id, event_date in view_keys
+            if (resource_id, event_date) not in existing_keys
+        ]
+    )
+    if created:
+        # bulk_create skips LearningResourceViewEvent.save, refresh counts here
+        LearningResourceViewCount.objects.refresh(
+            {event.learning_resource_id for event in created},
+            {event.event_date for event in created},
+        )
+    return created
 
 
 def load_posthog_lrd_view_events(
     events: iter,
 ) -> list[LearningResourceViewEvent]:
     """
-    Load a list of PostHogLearningResourceViewEvent into the database.
+    Load PostHogLearningResourceViewEvents into the database.
+
+    Events are streamed from the iterable and loaded in batches of
+    POSTHOG_EVENT_LOAD_BATCH_SIZE.
 
     Args:
-    - events (list[PostHogLearningResourceViewEvent]): the events to load
+    - events (iter[PostHogLearningResourceViewEvent]): the events to load
     Returns:
-    List of LearningResourceViewEvent
+    List of the LearningResourceViewEvents that were created
     """
 
-    return [load_posthog_lrd_view_event(event) for event in events]
+    loaded = []
+
+    for batch in chunks(events, chunk_size=settings.POSTHOG_EVENT_LOAD_BATCH_SIZE):
+        loaded.extend(load_posthog_lrd_view_event_batch(batch))
+
+    return loaded
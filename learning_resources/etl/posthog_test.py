@@ -3,14 +3,18 @@
 import json
 import random
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 from django.conf import settings
 from faker import Faker
 
 from learning_resources.etl import posthog
-from learning_resources.models import LearningResourceViewEvent
+from learning_resources.factories import (
+    LearningResourceFactory,
+    LearningResourceViewEventFactory,
+)
+from learning_resources.models import LearningResource, LearningResourceViewEvent
 from main.test_utils import MockResponse
 
 fake = Faker()
@@ -252,3 +256,56 @@ def load_posthog_lrd_view_events(mocker):
     stored_events = load_posthog_lrd_view_events(lr_events)
 
     assert LearningResourceViewEvent.objects.count() == len(stored_events)
+
+
+@pytest.mark.django_db
+def test_load_posthog_lrd_view_events(settings, django_assert_max_num_queries):
+    """The loader should create new view events in batches, skipping bad ones"""
+
+    settings.POSTHOG_EVENT_LOAD_BATCH_SIZE = 4
+    resources = LearningResourceFactory.create_batch(3)
+    existing = LearningResourceViewEventFactory.create(learning_resource=resources[0])
+    event_date = datetime(2024, 1, 1, 12, 0, 0)  # noqa: DTZ001
+
+    def lrd_view_event(resource_id, date=event_date):
+        return posthog.PostHogLearningResourceViewEvent(
+            resourceType="course",
+            platformCode="ocw",
+            resourceId=resource_id,
+            readableId="",
+            event_date=date.isoformat(),
+        )
+
+    events = [
+        lrd_view_event(resources[0].id),
+        lrd_view_event(resources[0].id),
+        lrd_view_event(
+            resources[0].id, existing.event_date.astimezone(UTC).replace(tzinfo=None)
+        ),
+        lrd_view_event(""),
+        lrd_view_event(resources[1].id),
+        lrd_view_event(resources[2].id + 1000),
+        lrd_view_event(resources[2].id),
+    ]
+
+    # 7 queries per batch: resources, existing events, the insert and
+    # refreshing the view counts
+    with django_assert_max_num_queries(14):
+        loaded = posthog.load_posthog_lrd_view_events(iter(events))
+
+    assert len(loaded) == 3
+    assert {
+        (view.learning_resource_id, view.event_date)
+        for view in LearningResourceViewEvent.objects.all()
+    } == {
+        (resources[0].id, existing.event_date),
+        (resources[0].id, event_date.replace(tzinfo=UTC)),
+        (resources[1].id, event_date.replace(tzinfo=UTC)),
+        (resources[2].id, event_date.replace(tzinfo=UTC)),
+    }
+    assert [
+        resource.views_count
+        for resource in LearningResource.objects.filter(
+            id__in=[resource.id for resource in resources]
+        ).order_by("id")
+    ] == [2, 1, 1]
@@ -0,0 +1,205 @@
+"""Reference data cached for the duration of an ETL run"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+
+from learning_resources.models import (
+    LearningResourceContentTag,
+    LearningResourceDepartment,
+    LearningResourceOfferor,
+    LearningResourcePlatform,
+    LearningResourceTopic,
+    LearningResourceTopicMapping,
+)
+
+TOPICS = "topics"
+TOPIC_MAPPINGS = "topic_mappings"
+OFFERORS = "offerors"
+PLATFORMS = "platforms"
+DEPARTMENTS = "departments"
+CONTENT_TAGS = "content_tags"
+
+_reference_data = None
+
+
+def load_offeror_topic_map(offeror_code: str) -> dict[str, list[str]]:
+    """
+    Load the topic mappings of an offeror from the database.
+
+    Returns:
+    - dict, the mapping dictionary
+    """
+    mappings = defaultdict(list)
+    for topic_name, mapped_topic_name in LearningResourceTopicMapping.objects.filter(
+        offeror__code=offeror_code
+    ).values_list("topic_name", "topic__name"):
+        mappings[topic_name].append(mapped_topic_name)
+    return dict(mappings)
+
+
+def _load_topics() -> dict:
+    """Load topics by id and by name. The first topic created wins a name."""
+    topics_by_id = LearningResourceTopic.objects.order_by("id").in_bulk()
+    topics_by_name = {}
+    for topic in topics_by_id.values():
+        topics_by_name.setdefault(topic.name, topic)
+    return {"by_id": topics_by_id, "by_name": topics_by_name}
+
+
+def _load_topic_mappings() -> dict:
+    """Load the topic mappings of every offeror"""
+    mappings = defaultdict(lambda: defaultdict(list))
+    for (
+        offeror_code,
+        topic_name,
+        mapped_topic_name,
+    ) in LearningResourceTopicMapping.objects.order_by("id").values_list(
+        "offeror__code", "topic_name", "topic__name"
+    ):
+        mappings[offeror_code][topic_name].append(mapped_topic_name)
+    return {
+        offeror_code: dict(offeror_mappings)
+        for offeror_code, offeror_mappings in mappings.items()
+    }
+
+
+def _load_offerors() -> dict:
+    """Load offerors by code and by name"""
+    offerors = LearningResourceOfferor.objects.in_bulk()
+    return {
+        "code": offerors,
+        "name": {offeror.name: offeror for offeror in offerors.values()},
+    }
+
+
+_LOADERS = {
+    TOPICS: _load_topics,
+    TOPIC_MAPPINGS: _load_topic_mappings,
+    OFFERORS: _load_offerors,
+    PLATFORMS: LearningResourcePlatform.objects.in_bulk,
+    DEPARTMENTS: LearningResourceDepartment.objects.in_bulk,
+    CONTENT_TAGS: lambda: LearningResourceContentTag.objects.in_bulk(field_name="name"),
+}
+
+
+class ReferenceData:
+    """
+    Reference tables loaded in full the first time they are used. These tables
+    only have a few hundred rows but are looked up for every record an ETL loads.
+    """
+
+    def __init__(self):
+        self._tables = {}
+
+    def get(self, table: str) -> dict:
+        """Get a table, loading it if needed"""
+        if table not in self._tables:
+            self._tables[table] = _LOADERS[table]()
+        return self._tables[table]
+
+    def clear(self, *tables: str):
+        """Clear tables so they are reloaded the next time they are used"""
+        for table in tables or list(self._tables):
+            self._tables.pop(table, None)
+
+
+def get_reference_data() -> ReferenceData | None:
+    """Get the reference data of the active ETL run, if any"""
+    return _reference_data
+
+
+@contextmanager
+def reference_data_cache():
+    """Cache reference data until the block exits. Nested blocks share a cache."""
+    global _reference_data  # noqa: PLW0603
+    if _reference_data is not None:
+        yield _reference_data
+        return
+    _reference_data = ReferenceData()
+    try:
+        yield _reference_data
+    finally:
+        _reference_data = None
+
+
+def with_reference_data_cache(func):
+    """Decorate an ETL pipeline to cache reference data while it runs"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with reference_data_cache():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def clear_reference_data(*tables: str):
+    """Clear tables of the active ETL run's reference data, or all of them"""
+    if _reference_data is not None:
+        _reference_data.clear(*tables)
+
+
+def get_topics_by_id() -> dict[int, LearningResourceTopic]:
+    """Get all topics by id"""
+    if _reference_data is None:
+        return _load_topics()["by_id"]
+    return _reference_data.get(TOPICS)["by_id"]
+
+
+def get_topic_by_name(name: str) -> LearningResourceTopic | None:
+    """Get the first topic with a name"""
+    if _reference_data is None:
+        return LearningResourceTopic.objects.filter(name=name).order_by("id").first()
+    return _reference_data.get(TOPICS)["by_name"].get(name)
+
+
+def get_offeror_topic_map(offeror_code: str) -> dict[str, list[str]]:
+    """Get the topic mappings of an offeror"""
+    if _reference_data is None:
+        return load_offeror_topic_map(offeror_code)
+    return _reference_data.get(TOPIC_MAPPINGS).get(offeror_code, {})
+
+
+def get_offeror(offered_by_data: dict) -> LearningResourceOfferor | None:
+    """Get the offeror matching offered_by data, by code or name"""
+    if _reference_data is not None and len(offered_by_data) == 1:
+        field, value = next(iter(offered_by_data.items()))
+        offerors = _reference_data.get(OFFERORS)
+        if field in offerors:
+            return offerors[field].get(value)
+    return LearningResourceOfferor.objects.filter(**offered_by_data).first()
+
+
+def get_platform(code: str) -> LearningResourcePlatform | None:
+    """Get a platform by code"""
+    if _reference_data is None:
+        return LearningResourcePlatform.objects.filter(code=code).first()
+    return _reference_data.get(PLATFORMS).get(code)
+
+
+def get_department(department_id: str) -> LearningResourceDepartment:
+    """
+    Get a department by id
+
+    Raises:
+        LearningResourceDepartment.DoesNotExist: if there is no such department
+    """
+    if _reference_data is None:
+        return LearningResourceDepartment.objects.get(department_id=department_id)
+    departments = _reference_data.get(DEPARTMENTS)
+    if department_id not in departments:
+        departments[department_id] = LearningResourceDepartment.objects.get(
+            department_id=department_id
+        )
+    return departments[department_id]
+
+
+def get_or_create_content_tag(name: str) -> LearningResourceContentTag:
+    """Get a content tag by name, creating it if it doesn't exist"""
+    if _reference_data is None:
+        return LearningResourceContentTag.objects.get_or_create(name=name)[0]
+    tags = _reference_data.get(CONTENT_TAGS)
+    if name not in tags:
+        tags[name] = LearningResourceContentTag.objects.get_or_create(name=name)[0]
+    return tags[name]
@@ -0,0 +1,127 @@
+"""Tests for reference data cached during ETL runs"""
+
+import pytest
+
+from learning_resources.etl.reference_data import (
+    DEPARTMENTS,
+    TOPICS,
+    clear_reference_data,
+    get_department,
+    get_offeror,
+    get_offeror_topic_map,
+    get_or_create_content_tag,
+    get_platform,
+    get_reference_data,
+    get_topic_by_name,
+    reference_data_cache,
+    with_reference_data_cache,
+)
+from learning_resources.factories import (
+    LearningResourceContentTagFactory,
+    LearningResourceDepartmentFactory,
+    LearningResourceOfferorFactory,
+    LearningResourcePlatformFactory,
+    LearningResourceTopicFactory,
+    LearningResourceTopicMappingFactory,
+)
+from learning_resources.models import (
+    LearningResourceContentTag,
+    LearningResourceDepartment,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def reference_objects():
+    """Create reference data"""
+    offeror = LearningResourceOfferorFactory.create()
+    topic = LearningResourceTopicFactory.create(name="Biology")
+    LearningResourceTopicFactory.create(name="Biology")
+    mapping = LearningResourceTopicMappingFactory.create(
+        offeror=offeror, topic=topic, topic_name="Life Sciences"
+    )
+    return {
+        "offeror": offeror,
+        "topic": topic,
+        "mapping": mapping,
+        "platform": LearningResourcePlatformFactory.create(),
+        "department": LearningResourceDepartmentFactory.create(),
+        "tag": LearningResourceContentTagFactory.create(),
+    }
+
+
+def lookup_all(objects):
+    """Look up every kind of reference data"""
+    return [
+        get_topic_by_name("Biology"),
+        get_topic_by_name("Missing"),
+        get_offeror_topic_map(objects["offeror"].code),
+        get_offeror({"code": objects["offeror"].code}),
+        get_offeror({"name": objects["offeror"].name}),
+        get_platform(objects["platform"].code),
+        get_department(objects["department"].department_id),
+        get_or_create_content_tag(objects["tag"].name),
+    ]
+
+
+def test_reference_data_lookups(reference_objects):
+    """Lookups should return the same values with and without a cache"""
+    expected = [
+        reference_objects["topic"],
+        None,
+        {"Life Sciences": ["Biology"]},
+        reference_objects["offeror"],
+        reference_objects["offeror"],
+        reference_objects["platform"],
+        reference_objects["department"],
+        reference_objects["tag"],
+    ]
+    assert lookup_all(reference_objects) == expected
+    with reference_data_cache():
+        assert lookup_all(reference_objects) == expected
+    assert get_reference_data() is None
+
+
+def test_reference_data_cache_queries(reference_objects, django_assert_num_queries):
+    """Reference tables should be loaded once per cache"""
+    with reference_data_cache():
+        with django_assert_num_queries(6):
+            lookup_all(reference_objects)
+        with django_assert_num_queries(0):
+            lookup_all(reference_objects)
+        with reference_data_cache(), django_assert_num_queries(0):
+            lookup_all(reference_objects)
+
+
+def test_reference_data_cache_misses():
+    """Missing departments should raise and new content tags should be created"""
+    with reference_data_cache():
+        with pytest.raises(LearningResourceDepartment.DoesNotExist):
+            get_department("missing")
+        department = LearningResourceDepartmentFactory.create(department_id="new")
+        assert get_department("new") == department
+        tag = get_or_create_content_tag("new tag")
+        assert get_or_create_content_tag("new tag") == tag
+    assert LearningResourceContentTag.objects.filter(name="new tag").count() == 1
+
+
+def test_clear_reference_data(reference_objects):
+    """Cleared tables should be reloaded"""
+    clear_reference_data(TOPICS)
+    with reference_data_cache():
+        assert get_topic_by_name("Chemistry") is None
+        chemistry = LearningResourceTopicFactory.create(name="Chemistry")
+        assert get_topic_by_name("Chemistry") is None
+        clear_reference_data(DEPARTMENTS)
+        assert get_topic_by_name("Chemistry") is None
+        clear_reference_data(TOPICS)
+        assert get_topic_by_name("Chemistry") == chemistry
+
+
+def test_with_reference_data_cache(mocker):
+    """The decorated function should run with a reference data cache"""
+    func = mocker.Mock(side_effect=lambda *_args, **_kwargs: get_reference_data())
+    assert with_reference_data_cache(func)(1, a=2) is not None
+    func.assert_called_once_with(1, a=2)
+    assert get_reference_data() is None
@@ -1,26 +1,28 @@
 """Helper functions for ETL"""
 
-import glob
 import logging
 import mimetypes
-import os
 import re
 import tarfile
 import uuid
-from collections import Counter
-from collections.abc import Generator
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
-from hashlib import md5
-from pathlib import Path
-from subprocess import check_call
+from hashlib import md5, sha256
+from http import HTTPStatus
+from pathlib import Path, PurePosixPath
 from tempfile import TemporaryDirectory
+from typing import BinaryIO
 
 import boto3
 import rapidjson
 import requests
 from django.conf import settings
+from django.core.cache import caches
 from django.utils.dateparse import parse_duration
 from django.utils.text import slugify
+from retry.api import retry_call
 from tika import parser as tika_parser
 from xbundle import XBundle
 
@@ -41,41 +43,22 @@ from learning_resources.etl.constants import (
     CourseNumberType,
     ETLSource,
 )
+from learning_resources.etl.exceptions import ExtractException
+from learning_resources.etl.reference_data import (
+    get_offeror_topic_map,
+    get_topic_by_name,
+)
 from learning_resources.models import (
     ContentFile,
     Course,
     LearningResource,
     LearningResourceRun,
-    LearningResourceTopic,
-    LearningResourceTopicMapping,
 )
 
 log = logging.getLogger(__name__)
 
-
-def load_offeror_topic_map(offeror_code: str):
-    """
-    Load the topic mappings from the database.
-
-    Returns:
-    - dict, the mapping dictionary
-    """
-
-    pmt_mappings = (
-        LearningResourceTopicMapping.objects.filter(offeror__code=offeror_code)
-        .prefetch_related("topic")
-        .all()
-    )
-
-    mappings = {}
-
-    for pmt_mapping in pmt_mappings:
-        if pmt_mapping.topic_name not in mappings:
-            mappings[pmt_mapping.topic_name] = []
-
-        mappings[pmt_mapping.topic_name].append(pmt_mapping.topic.name)
-
-    return mappings
+# Files XBundle reads to build the course structure of an OLX archive
+XBUNDLE_FILE_TYPES = {".html", ".json", ".xml"}
 
 
 def transform_topics(topics: list, offeror_code: str):
@@ -90,7 +73,7 @@ def transform_topics(topics: list, offeror_code: str):
     Return:
         list of dict: the transformed topics
     """
-    topic_mappings = load_offeror_topic_map(offeror_code)
+    topic_mappings = get_offeror_topic_map(offeror_code)
 
     transformed_topics = []
 
@@ -101,9 +84,7 @@ def transform_topics(topics: list, offeror_code: str):
                 for mapped_topic in topic_mappings.get(topic["name"])
             ]
         else:
-            base_topic = LearningResourceTopic.objects.filter(
-                name=topic["name"]
-            ).exists()
+            base_topic = get_topic_by_name(topic["name"]) is not None
 
             transformed_topics.append({"name": topic["name"]}) if base_topic else None
 
@@ -152,9 +133,37 @@ def sync_s3_text(bucket, key, content_meta):
         )
 
 
+def get_extracted_text_cache_key(data, headers: dict) -> str:
+    """
+    Get the cache key for the text tika extracts from data, so identical
+    documents sent with the same headers are only extracted once
+
+    Args:
+        data (str or bytes): File contents
+        headers (dict): Headers sent to tika
+
+    Returns:
+        str: the cache key
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    options = rapidjson.dumps(
+        {
+            name: value
+            for name, value in sorted(headers.items())
+            if name != "X-Access-Token"
+        }
+    )
+    return (
+        f"extracted_text.{sha256(data).hexdigest()}."
+        f"{md5(options.encode('utf-8')).hexdigest()}"  # noqa: S324
+    )
+
+
 def extract_text_metadata(data, *, other_headers=None):
     """
-    Use tika to extract text content from file data
+    Use tika to extract text content from file data, or get the text already
+    extracted from identical data from the cache
 
     Args:
         data (str): File contents
@@ -179,7 +188,114 @@ def extract_text_metadata(data, *, other_headers=None):
         "headers": headers,
     }
 
-    return tika_parser.from_buffer(data, requestOptions=request_options)
+    cache = caches["extracted_text"]
+    cache_key = get_extracted_text_cache_key(data, headers)
+    tika_output = cache.get(cache_key)
+    if tika_output is None:
+        tika_output = tika_parser.from_buffer(data, requestOptions=request_options)
+        if tika_output and tika_output.get("status", HTTPStatus.OK) == HTTPStatus.OK:
+            cache.set(cache_key, tika_output)
+    return tika_output
+
+
+def _extract_text_metadata_or_raise(data, other_headers):
+    """Extract text with tika, raising an exception for tika server errors"""
+    tika_output = extract_text_metadata(data, other_headers=other_headers)
+    if tika_output and tika_output.get("status", 200) >= 500:  # noqa: PLR2004
+        msg = f"Tika returned status {tika_output['status']}"
+        raise ExtractException(msg)
+    return tika_output
+
+
+def extract_text_metadata_with_retries(data, *, other_headers=None):
+    """
+    Use tika to extract text content from file data, retrying requests that
+    fail or time out after TIKA_TIMEOUT seconds up to TIKA_MAX_RETRIES times
+
+    Args:
+        data (str): File contents
+        other_headers (dict): Optional other headers to send to tika
+
+    Returns:
+         dict: metadata returned by tika, or None if every request failed
+    """
+    try:
+        return retry_call(
+            _extract_text_metadata_or_raise,
+            fargs=(data, other_headers),
+            exceptions=(requests.exceptions.RequestException, ExtractException),
+            tries=settings.TIKA_MAX_RETRIES + 1,
+            delay=1,
+            backoff=2,
+            jitter=(0, 1),
+        )
+    except (requests.exceptions.RequestException, ExtractException):
+        log.exception(
+            "Could not extract text after %d tries", settings.TIKA_MAX_RETRIES + 1
+        )
+        return None
+
+
+def map_concurrently(
+    func: Callable, items: Iterable, *, max_workers: int
+) -> Generator[tuple, None, None]:
+    """
+    Call a function on items in a thread pool, with up to max_workers calls in
+    flight. Items are read lazily as calls finish, and results are yielded in
+    the same order as the items.
+
+    Args:
+        func (Callable): the function to call on each item
+        items (iterable): the items
+        max_workers (int): the maximum number of concurrent calls
+
+    Yields:
+        tuple: each item and the result of the function for it
+    """
+    max_workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = deque()
+        try:
+            for item in items:
+                futures.append((item, executor.submit(func, item)))
+                if len(futures) >= max_workers:
+                    finished_item, future = futures.popleft()
+                    yield finished_item, future.result()
+            while futures:
+                finished_item, future = futures.popleft()
+                yield finished_item, future.result()
+        finally:
+            for _, future in futures:
+                future.cancel()
+
+
+def extract_text_metadata_concurrently(
+    documents: Iterable[tuple],
+) -> Generator[tuple, None, None]:
+    """
+    Extract text from documents with up to TIKA_CONCURRENCY tika requests in
+    flight, yielding the results in the same order as the documents
+
+    Args:
+        documents (iterable of tuple): (item, data, other_headers) for each
+            document. Documents without data are not sent to tika.
+
+    Yields:
+        tuple: each document's item and the metadata returned by tika, or None
+    """
+
+    def extract(document):
+        _, data, other_headers = document
+        if not data:
+            return None
+        return extract_text_metadata_with_retries(data, other_headers=other_headers)
+
+    for (item, _, _), tika_output in map_concurrently(
+        extract,
+        documents,
+        max_workers=settings.TIKA_CONCURRENCY,
+    ):
+        yield item, tika_output
 
 
 def extract_text_from_url(url, *, mime_type=None):
@@ -361,119 +477,169 @@ def get_xbundle_docs(olx_path: str) -> Generator[dict, None, None]:
         )
 
 
-def documents_from_olx(
-    olx_path: str,
+def _get_olx_member_path(member: tarfile.TarInfo) -> PurePosixPath | None:
+    """
+    Get the path of a course archive member relative to the course directory,
+    or None if it is not a regular file inside it
+    """
+    path = PurePosixPath(member.name)
+    if not member.isfile() or len(path.parts) < 2 or ".." in path.parts:  # noqa: PLR2004
+        return None
+    return PurePosixPath(*path.parts[1:])
+
+
+def _is_course_structure_file(path: PurePosixPath) -> bool:
+    """Return True if XBundle reads the file to build the course structure"""
+    return path.parts[0] != "static" and (
+        path.suffix.lower() in XBUNDLE_FILE_TYPES or path.parts[0] == "about"
+    )
+
+
+def open_archive_stream(archive: str | Path | BinaryIO) -> tarfile.TarFile:
+    """
+    Open a tar archive for a single sequential read
+
+    Args:
+        archive (str, Path or file object): The path to the archive, or a file
+            object to read it from, such as an S3 object body
+
+    Returns:
+        tarfile.TarFile: The archive, opened as a stream
+    """
+    if hasattr(archive, "read"):
+        return tarfile.open(fileobj=archive, mode="r|*")
+    return tarfile.open(archive, "r|*")
+
+
+def documents_from_olx_archive(
+    archive: str | Path | BinaryIO,
 ) -> Generator[tuple, None, None]:
     """
-    Extract text from OLX directory
+    Extract text from an OLX archive in one sequential pass, without unpacking
+    it. Text files are yielded as they are read. Only the files describing the
+    course structure are written to a temporary directory, where XBundle reads
+    the verticals from once the archive has been read.
 
     Args:
-        olx_path (str): The path to the directory with the OLX data
+        archive (str, Path or file object): The path to the OLX archive, or a
+            file object to stream it from
 
     Yields:
         tuple: A list of (bytes of content, metadata)
     """
-    try:
-        yield from get_xbundle_docs(olx_path)
-    except:  # noqa: E722
-        log.exception("Could not read verticals from path %s", olx_path)
-
     counter = _infinite_counter()
 
-    for root, _, files in os.walk(olx_path):
-        for filename in files:
-            extension_lower = Path(filename).suffix.lower()
+    with (
+        TemporaryDirectory() as structure_path,
+        open_archive_stream(archive) as archive_file,
+    ):
+        for member in archive_file:
+            path = _get_olx_member_path(member)
+            if path is None:
+                continue
+            extension_lower = path.suffix.lower()
+            is_structure_file = _is_course_structure_file(path)
+            if extension_lower not in VALID_TEXT_FILE_TYPES and not is_structure_file:
+                continue
+
+            filebytes = archive_file.extractfile(member).read()
+            if is_structure_file:
+                structure_file = Path(structure_path, *path.parts)
+                structure_file.parent.mkdir(parents=True, exist_ok=True)
+                structure_file.write_bytes(filebytes)
             if extension_lower in VALID_TEXT_FILE_TYPES:
-                with Path.open(Path(root, filename), "rb") as f:
-                    filebytes = f.read()
-
-                mimetype = mimetypes.types_map.get(extension_lower)
-
                 yield (
                     filebytes,
                     {
-                        "key": f"document_{next(counter)}_{filename}",
+                        "key": f"document_{next(counter)}_{path.name}",
                         "content_type": CONTENT_TYPE_FILE,
-                        "mime_type": mimetype,
+                        "mime_type": mimetypes.types_map.get(extension_lower),
                         "checksum": md5(filebytes).hexdigest(),  # noqa: S324
                     },
                 )
 
+        try:
+            yield from get_xbundle_docs(structure_path)
+        except:  # noqa: E722
+            log.exception("Could not read verticals from path %s", archive)
+
 
 def transform_content_files(
-    course_tarpath: Path, run: LearningResourceRun
+    course_archive: Path | BinaryIO, run: LearningResourceRun
 ) -> Generator[dict, None, None]:
     """
-    Pass content to tika, then return JSON document with transformed content inside it
+    Pass content to tika, then return JSON document with transformed content inside it.
+    Up to TIKA_CONCURRENCY documents are sent to tika at once. Documents with the
+    same checksum as the run's existing content files are not passed to tika and
+    are returned without content.
 
     Args:
-        course_tarpath (str): The path to the tarball which contains the OLX
+        course_archive (Path or file object): The tarball which contains the OLX
         run (LearningResourceRun): The run associated witb the content files
 
     Yields:
         dict: content from file
     """
-    basedir = course_tarpath.name.split(".")[0]
-    with TemporaryDirectory(prefix=basedir) as inner_tempdir:
-        check_call(["tar", "xf", course_tarpath], cwd=inner_tempdir)  # noqa: S603,S607
-        olx_path = glob.glob(inner_tempdir + "/*")[0]  # noqa: PTH207
-        for document, metadata in documents_from_olx(olx_path):
+    existing_checksums = dict(
+        ContentFile.objects.filter(run=run).values_list("key", "checksum")
+    )
+    skip_tika = settings.SKIP_TIKA and settings.ENVIRONMENT != "production"
+
+    def documents():
+        for document, metadata in documents_from_olx_archive(course_archive):
             key = metadata["key"]
-            content_type = metadata["content_type"]
             mime_type = metadata.get("mime_type")
-
-            existing_content = ContentFile.objects.filter(key=key, run=run).first()
-            if not existing_content or existing_content.checksum != metadata.get(
-                "checksum"
-            ):
-                if settings.SKIP_TIKA and settings.ENVIRONMENT != "production":
-                    content_dict = {
-                        "content": "",
-                        "content_title": "",
-                        "content_author": "",
-                        "content_language": "",
-                    }
-                else:
-                    tika_output = extract_text_metadata(
-                        document,
-                        other_headers={"Content-Type": mime_type} if mime_type else {},
-                    )
-
-                    if tika_output is None:
-                        log.info("No tika response for %s", key)
-                        continue
-
-                    tika_content = tika_output.get("content") or ""
-                    tika_metadata = tika_output.get("metadata") or {}
-                    content_dict = {
-                        "content": tika_content.strip(),
-                        "content_title": (
-                            metadata.get("title") or tika_metadata.get("title") or ""
-                        )[: get_max_contentfile_length("content_title")],
-                        "content_author": (tika_metadata.get("Author") or "")[
-                            : get_max_contentfile_length("content_author")
-                        ],
-                        "content_language": (tika_metadata.get("language") or "")[
-                            : get_max_contentfile_length("content_language")
-                        ],
-                    }
-            else:
-                content_dict = {
-                    "content": existing_content.content,
-                    "content_title": existing_content.content_title,
-                    "content_author": existing_content.content_author,
-                    "content_language": existing_content.content_language,
-                }
+            needs_text = key not in existing_checksums or existing_checksums[
+                key
+            ] != metadata.get("checksum")
             yield (
-                {
-                    "key": key,
-                    "published": True,
-                    "content_type": content_type,
-                    "checksum": metadata.get("checksum"),
-                    **content_dict,
-                }
+                (metadata, needs_text),
+                document if needs_text and not skip_tika else None,
+                {"Content-Type": mime_type} if mime_type else {},
             )
 
+    for (metadata, needs_text), tika_output in extract_text_metadata_concurrently(
+        documents()
+    ):
+        key = metadata["key"]
+        if not needs_text:
+            # The file is unchanged, keep the text already extracted for it
+            content_dict = {}
+        elif skip_tika:
+            content_dict = {
+                "content": "",
+                "content_title": "",
+                "content_author": "",
+                "content_language": "",
+            }
+        elif tika_output is None:
+            log.info("No tika response for %s", key)
+            continue
+        else:
+            tika_content = tika_output.get("content") or ""
+            tika_metadata = tika_output.get("metadata") or {}
+            content_dict = {
+                "content": tika_content.strip(),
+                "content_title": (
+                    metadata.get("title") or tika_metadata.get("title") or ""
+                )[: get_max_contentfile_length("content_title")],
+                "content_author": (tika_metadata.get("Author") or "")[
+                    : get_max_contentfile_length("content_author")
+                ],
+                "content_language": (tika_metadata.get("language") or "")[
+                    : get_max_contentfile_length("content_language")
+                ],
+            }
+        yield (
+            {
+                "key": key,
+                "published": True,
+                "content_type": metadata["content_type"],
+                "checksum": metadata.get("checksum"),
+                **content_dict,
+            }
+        )
+
 
 def get_learning_course_bucket_name(etl_source: str) -> str:
     """
@@ -515,17 +681,17 @@ def get_learning_course_bucket(etl_source: str) -> object:
     return None
 
 
-def calc_checksum(filename) -> str:
+def calc_checksum(archive) -> str:
     """
-    Return the md5 checksum of the specified filepath
+    Return the checksum of the specified archive
 
     Args:
-        filename(str): The path to the file to checksum
+        archive(str, Path or file object): The archive to checksum
     Returns:
-        str: The md5 checksum of the file
+        str: The checksum of the archive
     """
-    with tarfile.open(filename, "r") as tgz_file:
-        return str(hash(tuple(ti.chksum for ti in tgz_file.getmembers())))
+    with open_archive_stream(archive) as tgz_file:
+        return str(hash(tuple(ti.chksum for ti in tgz_file)))
 
 
 def get_content_type(file_type: str) -> str:
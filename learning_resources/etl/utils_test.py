@@ -1,14 +1,21 @@
 """ETL utils test"""
 
 import datetime
+import json
 import pathlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from random import randrange
 from subprocess import check_call
 from tempfile import TemporaryDirectory
+from types import SimpleNamespace
 from unittest.mock import ANY
 
 import pytest
+import requests
 from lxml import etree
+from tika import parser as tika_parser
 
 from learning_resources.constants import (
     CONTENT_TYPE_FILE,
@@ -31,8 +38,11 @@ from learning_resources.factories import (
 
 pytestmark = pytest.mark.django_db
 
+# The unpatched request method, for tests against local servers
+session_request = requests.sessions.Session.request
 
-def get_olx_test_docs():
+
+def get_olx_test_docs(*, as_file_object=False):
     """Get a list of edx docs from a sample archive file"""
     script_dir = pathlib.Path(__file__).parent.absolute().parent.parent
     with TemporaryDirectory() as temp:
@@ -44,13 +54,11 @@ def get_olx_test_docs():
             ],
             cwd=temp,
         )
-        check_call(  # noqa: S603
-            ["tar", "xf", "content-devops-0001.tar.gz"],  # noqa: S607
-            cwd=temp,
-        )
-
-        olx_path = pathlib.Path(temp, "content-devops-0001")
-        return list(utils.documents_from_olx(str(olx_path)))
+        archive = pathlib.Path(temp, "content-devops-0001.tar.gz")
+        if as_file_object:
+            with archive.open("rb") as archive_file:
+                return list(utils.documents_from_olx_archive(archive_file))
+        return list(utils.documents_from_olx_archive(archive))
 
 
 @pytest.mark.parametrize("has_bucket", [True, False])
@@ -106,6 +114,162 @@ def test_extract_text_metadata(  # noqa: PLR0913
         mock_tika.assert_not_called()
 
 
+def test_extract_text_metadata_cache(mocker, settings):
+    """Text extracted from identical data with the same headers should be cached"""
+    settings.CACHES = {
+        **settings.CACHES,
+        "extracted_text": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-extracted-text",
+        },
+    }
+    settings.TIKA_ACCESS_TOKEN = None
+    mock_response = {"metadata": {}, "content": "Extracted text", "status": 200}
+    mock_tika = mocker.patch(
+        "learning_resources.etl.utils.tika_parser.from_buffer",
+        return_value=mock_response,
+    )
+    pdf_headers = {"Content-Type": "application/pdf"}
+
+    for data in ["text", b"text", b"text"]:
+        assert utils.extract_text_metadata(data) == mock_response
+    assert mock_tika.call_count == 1
+    assert utils.extract_text_metadata(b"text", other_headers=pdf_headers) == (
+        mock_response
+    )
+    assert mock_tika.call_count == 2
+
+    mock_tika.return_value = {"metadata": None, "content": None, "status": 503}
+    for _ in range(2):
+        assert utils.extract_text_metadata(b"other") == mock_tika.return_value
+    assert mock_tika.call_count == 4
+
+    settings.TIKA_ACCESS_TOKEN = "token"  # noqa: S105
+    assert utils.extract_text_metadata(b"text") == mock_response
+    assert mock_tika.call_count == 4
+
+
+@pytest.fixture
+def tika_stub_server(mocker):
+    """Run a local server that answers tika requests like tika does"""
+    state = SimpleNamespace(in_flight=0, max_in_flight=0, failed=set())
+    lock = threading.Lock()
+
+    class TikaHandler(BaseHTTPRequestHandler):
+        """Extract the text of a request body after a short delay"""
+
+        def do_PUT(self):  # noqa: N802
+            body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+            with lock:
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            # time.sleep is patched to skip the delays between retries
+            threading.Event().wait(0.05)
+            with lock:
+                state.in_flight -= 1
+                # Fail the first request for each "flaky" document
+                failed = body.startswith("flaky") and body not in state.failed
+                state.failed.add(body)
+            if failed:
+                self.send_response(503)
+                self.end_headers()
+                return
+            response = json.dumps(
+                [{"X-TIKA:content": body.upper(), "Author": "tika"}]
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TikaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    mocker.patch("requests.sessions.Session.request", new=session_request)
+    from_buffer = tika_parser.from_buffer
+    mocker.patch("tika.tika.TikaClientOnly", new=True)
+    mocker.patch(
+        "learning_resources.etl.utils.tika_parser.from_buffer",
+        side_effect=lambda data, **kwargs: from_buffer(
+            data, serverEndpoint=endpoint, **kwargs
+        ),
+    )
+    mocker.patch("retry.api.time.sleep")
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_extract_text_metadata_concurrently(settings, tika_stub_server):
+    """Documents should be extracted concurrently and returned in order"""
+    settings.TIKA_CONCURRENCY = 4
+    settings.TIKA_MAX_RETRIES = 1
+    documents = [
+        (index, f"{'flaky' if index % 3 == 0 else 'document'} {index}", {})
+        for index in range(12)
+    ]
+    documents.append((12, None, {}))
+
+    results = list(utils.extract_text_metadata_concurrently(iter(documents)))
+
+    assert [item for item, _ in results] == list(range(13))
+    for (_, data, _), (_, tika_output) in zip(documents[:12], results):
+        assert tika_output["content"] == data.upper()
+        assert tika_output["metadata"]["Author"] == "tika"
+    assert results[12][1] is None
+    assert tika_stub_server.max_in_flight == 4
+
+
+def test_extract_text_metadata_with_retries(mocker, settings):
+    """Failed tika requests should be retried, then logged"""
+    settings.TIKA_MAX_RETRIES = 2
+    mocker.patch("retry.api.time.sleep")
+    mock_log = mocker.patch("learning_resources.etl.utils.log.exception")
+    mock_extract = mocker.patch(
+        "learning_resources.etl.utils.extract_text_metadata",
+        side_effect=[
+            requests.exceptions.ReadTimeout(),
+            {"status": 500, "content": None},
+            {"status": 200, "content": "text"},
+        ],
+    )
+    assert utils.extract_text_metadata_with_retries(b"data") == {
+        "status": 200,
+        "content": "text",
+    }
+    assert mock_extract.call_count == 3
+    mock_log.assert_not_called()
+
+    mock_extract.side_effect = requests.exceptions.ConnectionError()
+    assert utils.extract_text_metadata_with_retries(b"data") is None
+    assert mock_extract.call_count == 6
+    mock_log.assert_called_once_with("Could not extract text after %d tries", 3)
+
+
+def test_map_concurrently():
+    """map_concurrently should read items lazily and yield results in order"""
+    read = []
+
+    def items():
+        for item in range(10):
+            read.append(item)
+            yield item
+
+    def func(item):
+        time.sleep((10 - item) / 1000)
+        return item * 2
+
+    results = utils.map_concurrently(func, items(), max_workers=3)
+    assert next(results) == (0, 0)
+    assert read == [0, 1, 2]
+    assert list(results) == [(item, item * 2) for item in range(1, 10)]
+
+
 @pytest.mark.parametrize("content", ["text", None])
 def test_extract_text_from_url(mocker, content):
     """extract_text_from_url should make appropriate requests and calls to extract_text_metadata"""
@@ -229,7 +393,7 @@ def test_transform_content_files(mocker, has_metadata, matching_checksum):
         )
 
     documents_mock = mocker.patch(
-        "learning_resources.etl.utils.documents_from_olx",
+        "learning_resources.etl.utils.documents_from_olx_archive",
         return_value=[
             (document, {"key": key, "content_type": content_type, "checksum": checksum})
         ],
@@ -245,16 +409,23 @@ def test_transform_content_files(mocker, has_metadata, matching_checksum):
             pathlib.Path(script_dir, "test_json", "exported_courses_12345.tar.gz"), run
         )
     )
-    assert content == [
-        {
+    expected_content = (
+        {}
+        if matching_checksum
+        else {
             "content": tika_output["content"],
-            "key": key,
-            "published": True,
             "content_author": metadata["Author"] if has_metadata else "",
             "content_title": metadata["title"] if has_metadata else "",
             "content_language": metadata["language"] if has_metadata else "",
+        }
+    )
+    assert content == [
+        {
+            "key": key,
+            "published": True,
             "content_type": content_type,
             "checksum": checksum,
+            **expected_content,
         }
     ]
     if matching_checksum:
@@ -264,8 +435,8 @@ def test_transform_content_files(mocker, has_metadata, matching_checksum):
     assert documents_mock.called is True
 
 
-def test_documents_from_olx():
-    """Test for documents_from_olx"""
+def test_documents_from_olx_archive():
+    """Test for documents_from_olx_archive"""
     parsed_documents = get_olx_test_docs()
     assert len(parsed_documents) == 108
 
@@ -276,7 +447,8 @@ def test_documents_from_olx():
         " to fail if executed in Studio. \n\n  Where Jasmine will inject its output"
         " (dictated in boot.js)  \n Test output will generate here when viewing in LMS."
     )
-    assert parsed_documents[0] == (
+    vertical = next(doc for doc in parsed_documents if doc[1]["key"] == "vertical_1")
+    assert vertical == (
         expected_parsed_vertical,
         {
             "key": "vertical_1",
@@ -295,7 +467,12 @@ def test_documents_from_olx():
     assert formula2do[1]["mime_type"].endswith("/xml")
 
 
-def test_documents_from_olx_bad_vertical(mocker):
+def test_documents_from_olx_archive_file_object():
+    """documents_from_olx_archive should read an archive streamed from a file object"""
+    assert get_olx_test_docs(as_file_object=True) == get_olx_test_docs()
+
+
+def test_documents_from_olx_archive_bad_vertical(mocker):
     """An exception should be logged if verticals can't be read, other files should still be processed"""
     mock_log = mocker.patch("learning_resources.etl.utils.log.exception")
     mock_bundle = mocker.patch("learning_resources.etl.utils.XBundle")
@@ -305,6 +482,22 @@ def test_documents_from_olx_bad_vertical(mocker):
     assert len(parsed_documents) == 92
 
 
+def test_documents_from_olx_archive_writes_structure_only(mocker):
+    """Only the files describing the course structure should be written to disk"""
+    write_bytes = mocker.spy(pathlib.Path, "write_bytes")
+    parsed_documents = get_olx_test_docs()
+    written = [
+        pathlib.PurePosixPath(call.args[0]) for call in write_bytes.call_args_list
+    ]
+    assert len(written) > 0
+    assert all(
+        path.suffix in utils.XBUNDLE_FILE_TYPES or "about" in path.parts
+        for path in written
+    )
+    assert not any("static" in path.parts for path in written)
+    assert len(written) < len(parsed_documents)
+
+
 @pytest.mark.parametrize(
     "platform", [PlatformType.mitxonline.name, PlatformType.xpro.name]
 )
@@ -446,6 +639,8 @@ def test_calc_checksum(previous_archive, identical):
         "test_json/course-v1:MITxT+8.01.3x+3T2022.tar.gz"
     )
     assert (utils.calc_checksum(previous_archive) == reference_checksum) is identical
+    with pathlib.Path(previous_archive).open("rb") as archive_file:
+        assert (utils.calc_checksum(archive_file) == reference_checksum) is identical
 
 
 @pytest.mark.parametrize(
@@ -3,7 +3,7 @@
 import logging
 from decimal import Decimal
 
-from django.db.models import Count, Q
+from django.db.models import Q
 from django_filters import (
     BooleanFilter,
     ChoiceFilter,
@@ -182,8 +182,7 @@ class LearningResourceFilter(FilterSet):
         sort_param = LEARNING_RESOURCE_SORTBY_OPTIONS[value]["sort"]
 
         if "views" in value:
-            queryset = queryset.annotate(num_hits=Count("views"))
-            sort_param = sort_param.replace("views", "num_hits")
+            sort_param = sort_param.replace("views", "views_count")
 
         return queryset.order_by(sort_param)
 
@@ -40,6 +40,14 @@ class LearningResourceHooks:
     def resource_similar_topics(self, resource) -> list[dict]:
         """Get similar topics for a learning resource"""
 
+    @hookspec
+    def bulk_resource_similar_topics(self, resources) -> list[list[dict]]:
+        """Get similar topics for multiple learning resources"""
+
+    @hookspec
+    def bulk_resources_upserted(self, resource_ids, resource_type, percolate_ids):
+        """Trigger actions after multiple learning resources are created or updated"""
+
     @hookspec
     def bulk_resources_unpublished(self, resource_ids, resource_type):
         """Trigger actions after multiple learning resources are unpublished"""
@@ -56,6 +64,10 @@ class LearningResourceHooks:
     def resource_run_delete(self, run):
         """Trigger actions to remove a learning resource run"""
 
+    @hookspec
+    def bulk_resource_runs_unpublished(self, run_ids):
+        """Trigger actions after multiple learning resource runs are unpublished"""
+
     @hookspec
     def topic_upserted(self, topic, overwrite):
         """Trigger actions after a learning resource topic is created or updated"""
@@ -0,0 +1,101 @@
+# Generated by Django 4.2.16 on 2026-10-18 03:20
+
+from datetime import UTC
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def populate_view_counts(apps, schema_editor):
+    """
+    Populate the daily and total view counts from existing view events
+    """
+    LearningResource = apps.get_model("learning_resources", "LearningResource")
+    LearningResourceViewCount = apps.get_model(
+        "learning_resources", "LearningResourceViewCount"
+    )
+    LearningResourceViewEvent = apps.get_model(
+        "learning_resources", "LearningResourceViewEvent"
+    )
+    daily_counts = (
+        LearningResourceViewEvent.objects.annotate(
+            view_date=TruncDate("event_date", tzinfo=UTC)
+        )
+        .values("learning_resource_id", "view_date")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    LearningResourceViewCount.objects.bulk_create(
+        (
+            LearningResourceViewCount(
+                learning_resource_id=daily_count["learning_resource_id"],
+                view_date=daily_count["view_date"],
+                count=daily_count["count"],
+            )
+            for daily_count in daily_counts.iterator()
+        ),
+        batch_size=1000,
+    )
+    LearningResource.objects.filter(view_counts__isnull=False).distinct().update(
+        views_count=Coalesce(
+            Subquery(
+                LearningResourceViewCount.objects.filter(
+                    learning_resource=OuterRef("pk")
+                )
+                .values("learning_resource")
+                .annotate(total=Sum("count"))
+                .values("total")
+            ),
+            0,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_resources", "0070_learningresource_location"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="learningresource",
+            name="views_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Total views, kept in sync with the daily view counts",
+            ),
+        ),
+        migrations.CreateModel(
+            name="LearningResourceViewCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("view_date", models.DateField()),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "learning_resource",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="view_counts",
+                        to="learning_resources.learningresource",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("learning_resource", "view_date")},
+            },
+        ),
+        migrations.RunPython(populate_view_counts, migrations.RunPython.noop),
+    ]
@@ -2,15 +2,28 @@
 
 import uuid
 from abc import abstractmethod
+from datetime import UTC, timedelta
 from functools import cached_property
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
-from django.db.models import CharField, Count, JSONField, OuterRef, Prefetch, Q
-from django.db.models.functions import Lower
+from django.db.models import (
+    CharField,
+    Count,
+    Exists,
+    JSONField,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce, Lower, TruncDate
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from learning_resources import constants
 from learning_resources.constants import (
@@ -317,61 +330,90 @@ class LearningResourceQuerySet(TimestampedModelQuerySet):
 
     def for_serialization(self, *, user: User | None = None):
         """Return the list of prefetches"""
-        return (
-            self.prefetch_related(
-                Prefetch(
-                    "topics",
-                    queryset=LearningResourceTopic.objects.for_serialization(),
-                ),
-                Prefetch(
-                    "offered_by",
-                    queryset=LearningResourceOfferor.objects.for_serialization(),
-                ),
-                Prefetch(
-                    "departments",
-                    queryset=LearningResourceDepartment.objects.for_serialization().select_related(
-                        "school"
-                    ),
-                ),
-                "content_tags",
-                Prefetch(
-                    "runs",
-                    queryset=LearningResourceRun.objects.filter(
-                        published=True
-                    ).for_serialization(),
+        return self.prefetch_related(
+            Prefetch(
+                "topics",
+                queryset=LearningResourceTopic.objects.for_serialization(),
+            ),
+            Prefetch(
+                "offered_by",
+                queryset=LearningResourceOfferor.objects.for_serialization(),
+            ),
+            Prefetch(
+                "departments",
+                queryset=LearningResourceDepartment.objects.for_serialization().select_related(
+                    "school"
                 ),
-                Prefetch(
-                    "parents",
-                    queryset=LearningResourceRelationship.objects.filter(
-                        relation_type=LearningResourceRelationTypes.LEARNING_PATH_ITEMS.value
-                    )
-                    if user is not None
-                    and user.is_authenticated
-                    and (
-                        user.is_staff
-                        or user.is_superuser
-                        or user.groups.filter(
-                            name=constants.GROUP_STAFF_LISTS_EDITORS
-                        ).exists()
+            ),
+            "content_tags",
+            Prefetch(
+                "runs",
+                queryset=LearningResourceRun.objects.filter(
+                    published=True
+                ).for_serialization(),
+            ),
+            Prefetch(
+                "parents",
+                queryset=LearningResourceRelationship.objects.filter(
+                    relation_type=LearningResourceRelationTypes.LEARNING_PATH_ITEMS.value
+                )
+                if user is not None
+                and user.is_authenticated
+                and (
+                    user.is_staff
+                    or user.is_superuser
+                    or user.groups.filter(
+                        name=constants.GROUP_STAFF_LISTS_EDITORS
+                    ).exists()
+                )
+                else LearningResourceRelationship.objects.none(),
+                to_attr="_learning_path_parents",
+            ),
+            Prefetch(
+                "user_lists",
+                queryset=UserListRelationship.objects.filter(parent__author=user)
+                if user is not None and user.is_authenticated
+                else UserListRelationship.objects.none(),
+                to_attr="_user_list_parents",
+            ),
+            *LearningResourceDetailModel.get_subclass_prefetches(),
+        ).select_related("image", "platform")
+
+    def with_recent_views(self, days):
+        """
+        Annotate the number of views in the last number of days as
+        recent_views_count, from the daily view counts
+        """
+        since = (timezone.now() - timedelta(days=days)).date()
+        return self.annotate(
+            recent_views_count=Coalesce(
+                Subquery(
+                    LearningResourceViewCount.objects.filter(
+                        learning_resource=OuterRef("pk"), view_date__gte=since
                     )
-                    else LearningResourceRelationship.objects.none(),
-                    to_attr="_learning_path_parents",
+                    .values("learning_resource")
+                    .annotate(total=Sum("count"))
+                    .values("total")
                 ),
-                Prefetch(
-                    "user_lists",
-                    queryset=UserListRelationship.objects.filter(parent__author=user)
-                    if user is not None and user.is_authenticated
-                    else UserListRelationship.objects.none(),
-                    to_attr="_user_list_parents",
-                ),
-                *LearningResourceDetailModel.get_subclass_prefetches(),
+                0,
             )
-            .select_related("image", "platform")
-            .annotate(views_count=Count("views"))
         )
 
     def for_search_serialization(self):
-        return self.annotate(in_featured_lists=Count("parents__parent__channel"))
+        """
+        Annotate the number of channel featured lists a resource is in and its
+        best position in them, and its views in the last SEARCH_RECENT_VIEWS_DAYS
+        """
+        return self.with_recent_views(settings.SEARCH_RECENT_VIEWS_DAYS).annotate(
+            in_featured_lists=Count("parents__parent__channel"),
+            featured_position=Subquery(
+                LearningResourceRelationship.objects.filter(
+                    child=OuterRef("pk"), parent__channel__isnull=False
+                )
+                .order_by("position")
+                .values("position")[:1]
+            ),
+        )
 
 
 class LearningResource(TimestampedModel):
@@ -456,6 +498,11 @@ class LearningResource(TimestampedModel):
         default=default_format,
     )
     location = models.CharField(max_length=256, blank=True)
+    views_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Total views, kept in sync with the daily view counts",
+    )
 
     @property
     def audience(self) -> str | None:
@@ -473,13 +520,6 @@ class LearningResource(TimestampedModel):
             .first()
         )
 
-    @cached_property
-    def views_count(self) -> int:
-        """Return the number of views for the resource."""
-        return models.LearningResourceViewEvent.objects.filter(
-            learning_resource=self
-        ).count()
-
     @cached_property
     def user_list_parents(self) -> list["LearningResourceRelationship"]:
         """Return a list of user lists that the resource is in"""
@@ -703,7 +743,7 @@ class LearningPathQuerySet(LearningResourceDetailQuerySet):
 
     def for_serialization(self):
         """Prefetch for serialization"""
-        return self
+        return self.annotate(item_count=Count("learning_resource__children"))
 
 
 class LearningPath(LearningResourceDetailModel):
@@ -1012,9 +1052,27 @@ class VideoPlaylist(LearningResourceDetailModel):
         )
 
 
+class LearningResourceViewEventQuerySet(TimestampedModelQuerySet):
+    """QuerySet for LearningResourceViewEvent"""
+
+    def delete(self):
+        """Delete the events and update the view counts for their resources and days."""
+
+        view_keys = list(self.values_list("learning_resource_id", "event_date"))
+        deleted = super().delete()
+        if view_keys:
+            LearningResourceViewCount.objects.refresh(
+                {resource_id for resource_id, _ in view_keys},
+                {event_date for _, event_date in view_keys},
+            )
+        return deleted
+
+
 class LearningResourceViewEvent(TimestampedModel):
     """Stores lrd_view events, with an FK to the resource the event is for."""
 
+    objects = LearningResourceViewEventQuerySet.as_manager()
+
     learning_resource = models.ForeignKey(
         LearningResource,
         on_delete=models.CASCADE,
@@ -1036,3 +1094,114 @@ class LearningResourceViewEvent(TimestampedModel):
             f" {self.learning_resource.readable_id})"
             f" on {self.event_date}"
         )
+
+    def save(self, *args, **kwargs):
+        """Save the event and update the view counts for its resource and day."""
+
+        super().save(*args, **kwargs)
+        LearningResourceViewCount.objects.refresh(
+            [self.learning_resource_id], [self.event_date]
+        )
+
+    def delete(self, *args, **kwargs):
+        """Delete the event and update the view counts for its resource and day."""
+
+        deleted = super().delete(*args, **kwargs)
+        LearningResourceViewCount.objects.refresh(
+            [self.learning_resource_id], [self.event_date]
+        )
+        return deleted
+
+
+def get_view_date(event_date):
+    """
+    Get the day (UTC) of a view event date. The date may still be the string
+    it was assigned as if the event hasn't been reloaded since it was saved.
+    """
+    if isinstance(event_date, str):
+        event_date = parse_datetime(event_date)
+    if timezone.is_naive(event_date):
+        event_date = timezone.make_aware(event_date, UTC)
+    return event_date.astimezone(UTC).date()
+
+
+class LearningResourceViewCountQuerySet(TimestampedModelQuerySet):
+    """QuerySet for LearningResourceViewCount"""
+
+    def refresh(self, learning_resource_ids, event_dates):
+        """
+        Recompute the daily view counts of resources on the days of the given
+        event dates from their view events, then their total view counts.
+        Daily view counts left without any view events are deleted.
+
+        Bulk inserts of LearningResourceViewEvent should call this for the
+        resources and event dates they inserted.
+        """
+        view_dates = {get_view_date(event_date) for event_date in event_dates}
+        self.filter(
+            learning_resource_id__in=learning_resource_ids, view_date__in=view_dates
+        ).exclude(
+            Exists(
+                LearningResourceViewEvent.objects.filter(
+                    learning_resource=OuterRef("learning_resource"),
+                    event_date__date=OuterRef("view_date"),
+                )
+            )
+        ).delete()
+        daily_counts = (
+            LearningResourceViewEvent.objects.filter(
+                learning_resource_id__in=learning_resource_ids,
+                event_date__date__in=view_dates,
+            )
+            .annotate(view_date=TruncDate("event_date", tzinfo=UTC))
+            .values("learning_resource_id", "view_date")
+            .annotate(count=Count("id"))
+        )
+        self.bulk_create(
+            [
+                LearningResourceViewCount(
+                    learning_resource_id=daily_count["learning_resource_id"],
+                    view_date=daily_count["view_date"],
+                    count=daily_count["count"],
+                )
+                for daily_count in daily_counts
+            ],
+            update_conflicts=True,
+            unique_fields=["learning_resource", "view_date"],
+            update_fields=["count", "updated_on"],
+        )
+        # updated_on changes too, so changed-only reindexing picks up the counts
+        LearningResource.objects.filter(id__in=learning_resource_ids).update(
+            updated_on=timezone.now(),
+            views_count=Coalesce(
+                Subquery(
+                    LearningResourceViewCount.objects.filter(
+                        learning_resource=OuterRef("pk")
+                    )
+                    .values("learning_resource")
+                    .annotate(total=Sum("count"))
+                    .values("total")
+                ),
+                0,
+            ),
+        )
+
+
+class LearningResourceViewCount(TimestampedModel):
+    """The number of views a learning resource had on a day (UTC)."""
+
+    objects = LearningResourceViewCountQuerySet.as_manager()
+
+    learning_resource = models.ForeignKey(
+        LearningResource,
+        on_delete=models.CASCADE,
+        related_name="view_counts",
+    )
+    view_date = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.learning_resource_id} on {self.view_date}: {self.count} views"
+
+    class Meta:
+        unique_together = (("learning_resource", "view_date"),)
@@ -1,12 +1,22 @@
 """Tests for learning_resources.models"""
 
+from datetime import UTC, date, datetime, timedelta
+
 import pytest
+from django.utils import timezone
 
 from learning_resources.constants import LearningResourceType
 from learning_resources.factories import (
     CourseFactory,
+    LearningResourceFactory,
+    LearningResourceViewEventFactory,
     ProgramFactory,
 )
+from learning_resources.models import (
+    LearningResource,
+    LearningResourceViewCount,
+    LearningResourceViewEvent,
+)
 
 pytestmark = [pytest.mark.django_db]
 
@@ -49,3 +59,104 @@ def test_course_creation():
     assert resource.offered_by is not None
     assert resource.runs.count() == course.runs.count()
     assert resource.prices == []
+
+
+def test_view_counts():
+    """Saving and deleting view events should update the view counts"""
+    resource = LearningResourceFactory.create()
+    other_resource = LearningResourceFactory.create()
+    first_day = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+    events = [
+        LearningResourceViewEventFactory.create(
+            learning_resource=resource, event_date=event_date
+        )
+        for event_date in (first_day, first_day, first_day + timedelta(days=1))
+    ]
+    LearningResourceViewEventFactory.create(learning_resource=other_resource)
+
+    assert {
+        view_count.view_date: view_count.count
+        for view_count in LearningResourceViewCount.objects.filter(
+            learning_resource=resource
+        )
+    } == {date(2024, 1, 1): 2, date(2024, 1, 2): 1}
+    resource.refresh_from_db()
+    assert resource.views_count == 3
+
+    events[0].delete()
+    resource.refresh_from_db()
+    assert resource.views_count == 2
+    other_resource.refresh_from_db()
+    assert other_resource.views_count == 1
+
+    events[2].delete()
+    assert {
+        view_count.view_date: view_count.count
+        for view_count in LearningResourceViewCount.objects.filter(
+            learning_resource=resource
+        )
+    } == {date(2024, 1, 1): 1}
+    resource.refresh_from_db()
+    assert resource.views_count == 1
+
+
+@pytest.mark.parametrize(
+    "event_date", ["2024-01-01T23:30:00Z", "2024-01-01T18:30:00-05:00"]
+)
+def test_view_counts_string_event_date(event_date):
+    """View events saved with a string date should count on their day in UTC"""
+    resource = LearningResourceFactory.create()
+    LearningResourceViewEvent.objects.create(
+        learning_resource=resource, event_date=event_date
+    )
+    assert list(
+        LearningResourceViewCount.objects.filter(
+            learning_resource=resource
+        ).values_list("view_date", "count")
+    ) == [(date(2024, 1, 1), 1)]
+
+
+def test_view_counts_updated_on():
+    """Refreshing view counts should mark the resources as updated"""
+    resource = LearningResourceFactory.create()
+    updated_on = resource.updated_on
+    LearningResourceViewEventFactory.create(learning_resource=resource)
+    resource.refresh_from_db()
+    assert resource.views_count == 1
+    assert resource.updated_on > updated_on
+
+
+def test_with_recent_views():
+    """with_recent_views should only count the views in the last days"""
+    resource = LearningResourceFactory.create()
+    for days_ago in (0, 1, 10):
+        LearningResourceViewEventFactory.create(
+            learning_resource=resource,
+            event_date=timezone.now() - timedelta(days=days_ago),
+        )
+    unviewed = LearningResourceFactory.create()
+
+    recent_views = dict(
+        LearningResource.objects.filter(id__in=[resource.id, unviewed.id])
+        .with_recent_views(7)
+        .values_list("id", "recent_views_count")
+    )
+    assert recent_views == {resource.id: 2, unviewed.id: 0}
+
+
+def test_view_counts_queryset_delete():
+    """Deleting view events in bulk should update the view counts"""
+    resource = LearningResourceFactory.create()
+    event_date = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+    LearningResourceViewEventFactory.create_batch(
+        2, learning_resource=resource, event_date=event_date
+    )
+    resource.refresh_from_db()
+    assert resource.views_count == 2
+
+    LearningResourceViewEvent.objects.filter(learning_resource=resource).delete()
+    assert not LearningResourceViewCount.objects.filter(
+        learning_resource=resource
+    ).exists()
+    resource.refresh_from_db()
+    assert resource.views_count == 0
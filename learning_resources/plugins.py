@@ -3,6 +3,13 @@
 from django.apps import apps
 
 from learning_resources.constants import FAVORITES_TITLE
+from learning_resources.etl.reference_data import (
+    DEPARTMENTS,
+    OFFERORS,
+    TOPIC_MAPPINGS,
+    TOPICS,
+    clear_reference_data,
+)
 from learning_resources.models import UserList
 
 
@@ -20,3 +27,39 @@ class FavoritesListPlugin:
         UserList.objects.get_or_create(
             author=user, title=FAVORITES_TITLE, defaults={"description": "My Favorites"}
         )
+
+
+class ReferenceDataPlugin:
+    """Clear reference data cached by a running ETL when it changes"""
+
+    hookimpl = apps.get_app_config("learning_resources").hookimpl
+
+    @hookimpl
+    def topic_upserted(self, topic, overwrite):  # noqa: ARG002
+        """Clear the cached topics and topic mappings"""
+        clear_reference_data(TOPICS, TOPIC_MAPPINGS)
+
+    @hookimpl
+    def topic_delete(self, topic):  # noqa: ARG002
+        """Clear the cached topics and topic mappings"""
+        clear_reference_data(TOPICS, TOPIC_MAPPINGS)
+
+    @hookimpl
+    def department_upserted(self, department, overwrite):  # noqa: ARG002
+        """Clear the cached departments"""
+        clear_reference_data(DEPARTMENTS)
+
+    @hookimpl
+    def department_delete(self, department):  # noqa: ARG002
+        """Clear the cached departments"""
+        clear_reference_data(DEPARTMENTS)
+
+    @hookimpl
+    def offeror_upserted(self, offeror, overwrite):  # noqa: ARG002
+        """Clear the cached offerors and topic mappings"""
+        clear_reference_data(OFFERORS, TOPIC_MAPPINGS)
+
+    @hookimpl
+    def offeror_delete(self, offeror):  # noqa: ARG002
+        """Clear the cached offerors and topic mappings"""
+        clear_reference_data(OFFERORS, TOPIC_MAPPINGS)
@@ -3,8 +3,14 @@
 import pytest
 
 from learning_resources.constants import FAVORITES_TITLE
+from learning_resources.etl.reference_data import (
+    DEPARTMENTS,
+    OFFERORS,
+    TOPIC_MAPPINGS,
+    TOPICS,
+)
 from learning_resources.factories import UserListFactory
-from learning_resources.plugins import FavoritesListPlugin
+from learning_resources.plugins import FavoritesListPlugin, ReferenceDataPlugin
 from main.factories import UserFactory
 
 
@@ -20,3 +26,33 @@ def test_favorites_plugin_user_created(existing_list):
     FavoritesListPlugin().user_created(user)
     user.refresh_from_db()
     assert user.user_lists.count() == 1
+
+
+@pytest.mark.parametrize(
+    ("hook", "kwargs", "tables"),
+    [
+        (
+            "topic_upserted",
+            {"topic": None, "overwrite": False},
+            (TOPICS, TOPIC_MAPPINGS),
+        ),
+        ("topic_delete", {"topic": None}, (TOPICS, TOPIC_MAPPINGS)),
+        (
+            "department_upserted",
+            {"department": None, "overwrite": True},
+            (DEPARTMENTS,),
+        ),
+        ("department_delete", {"department": None}, (DEPARTMENTS,)),
+        (
+            "offeror_upserted",
+            {"offeror": None, "overwrite": False},
+            (OFFERORS, TOPIC_MAPPINGS),
+        ),
+        ("offeror_delete", {"offeror": None}, (OFFERORS, TOPIC_MAPPINGS)),
+    ],
+)
+def test_reference_data_plugin(mocker, hook, kwargs, tables):
+    """Reference data cached by a running ETL should be cleared when it changes"""
+    mock_clear = mocker.patch("learning_resources.plugins.clear_reference_data")
+    getattr(ReferenceDataPlugin(), hook)(**kwargs)
+    mock_clear.assert_called_once_with(*tables)
@@ -295,10 +295,10 @@ class ResourceListMixin(serializers.Serializer):
 
     def get_item_count(self, instance) -> int:
         """Return the number of items in the list"""
-        return (
-            getattr(instance, "item_count", None)
-            or instance.learning_resource.children.count()
-        )
+        item_count = getattr(instance, "item_count", None)
+        if item_count is None:
+            item_count = instance.learning_resource.children.count()
+        return item_count
 
 
 class CourseNumberSerializer(serializers.Serializer):
@@ -508,7 +508,13 @@ class LearningResourceBaseSerializer(serializers.ModelSerializer, WriteableTopic
             "learning_path_parents",
             "user_list_parents",
         ]
-        exclude = ["content_tags", "resources", "etl_source", *COMMON_IGNORED_FIELDS]
+        exclude = [
+            "content_tags",
+            "resources",
+            "etl_source",
+            "views_count",
+            *COMMON_IGNORED_FIELDS,
+        ]
 
 
 class ProgramResourceSerializer(LearningResourceBaseSerializer):
@@ -596,7 +602,13 @@ class LearningPathResourceSerializer(LearningResourceBaseSerializer):
 
     class Meta:
         model = models.LearningResource
-        exclude = ["content_tags", "resources", "etl_source", *COMMON_IGNORED_FIELDS]
+        exclude = [
+            "content_tags",
+            "resources",
+            "etl_source",
+            "views_count",
+            *COMMON_IGNORED_FIELDS,
+        ]
         read_only_fields = ["platform", "offered_by", "readable_id"]
 
 
@@ -290,6 +290,16 @@ def similar_topics_action(resource: LearningResource) -> dict:
     return topics[0] if topics else []
 
 
+def bulk_similar_topics_action(resources: list[LearningResource]) -> list[list[dict]]:
+    """
+    Trigger plugin to get similar topics for multiple resources
+    """
+    pm = get_plugin_manager()
+    hook = pm.hook
+    topics = hook.bulk_resource_similar_topics(resources=resources)
+    return topics[0] if topics else [[] for _ in resources]
+
+
 def resource_delete_actions(resource: LearningResource):
     """
     Trigger plugin to handle learning resource deletion
@@ -300,6 +310,21 @@ def resource_delete_actions(resource: LearningResource):
     resource.delete()
 
 
+def bulk_resources_upserted_actions(
+    resource_ids: list[int], resource_type: str, percolate_ids: list[int]
+):
+    """
+    Trigger plugins when multiple LearningResources are created or updated
+    """
+    pm = get_plugin_manager()
+    hook = pm.hook
+    hook.bulk_resources_upserted(
+        resource_ids=resource_ids,
+        resource_type=resource_type,
+        percolate_ids=percolate_ids,
+    )
+
+
 def bulk_resources_unpublished_actions(resource_ids: list[int], resource_type: str):
     """
     Trigger plugins when a LearningResource is removed/unpublished
@@ -329,6 +354,15 @@ def resource_run_unpublished_actions(run: LearningResourceRun):
     hook.resource_run_unpublished(run=run)
 
 
+def bulk_resource_runs_unpublished_actions(run_ids: list[int]):
+    """
+    Trigger plugins when multiple LearningResourceRuns are unpublished
+    """
+    pm = get_plugin_manager()
+    hook = pm.hook
+    hook.bulk_resource_runs_unpublished(run_ids=run_ids)
+
+
 def resource_run_delete_actions(run: LearningResourceRun):
     """
     Trigger plugin to handle learning resource run deletion
@@ -219,6 +219,18 @@ def test_similar_topics_action(mock_plugin_manager, fixture_resource) -> dict:
     )
 
 
+def test_bulk_similar_topics_action(mock_plugin_manager, fixture_resource):
+    """
+    bulk_similar_topics_action should trigger plugin hook's bulk_resource_similar_topics function
+    """
+    mock_topics = [[{"name": "Biology"}, {"name": "Chemistry"}]]
+    mock_plugin_manager.hook.bulk_resource_similar_topics.return_value = [mock_topics]
+    assert utils.bulk_similar_topics_action([fixture_resource]) == mock_topics
+    mock_plugin_manager.hook.bulk_resource_similar_topics.assert_called_once_with(
+        resources=[fixture_resource]
+    )
+
+
 def test_resource_unpublished_actions(mock_plugin_manager, fixture_resource):
     """
     resource_unpublished_actions function should trigger plugin hook's resource_unpublished function
@@ -253,6 +265,16 @@ def test_resource_run_unpublished_actions(mock_plugin_manager, fixture_resource_
     )
 
 
+def test_bulk_resource_runs_unpublished_actions(mock_plugin_manager):
+    """
+    bulk_resource_runs_unpublished_actions function should trigger plugin hook's bulk_resource_runs_unpublished function
+    """
+    utils.bulk_resource_runs_unpublished_actions([1, 2])
+    mock_plugin_manager.hook.bulk_resource_runs_unpublished.assert_called_once_with(
+        run_ids=[1, 2]
+    )
+
+
 def test_resource_run_delete_actions(mock_plugin_manager, fixture_resource_run):
     """
     resource_run_delete_actions function should trigger plugin hook's resource_run_deleted function
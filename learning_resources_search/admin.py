@@ -14,3 +14,13 @@ class PercolateQueryAdmin(admin.ModelAdmin):
 
 
 admin.site.register(models.PercolateQuery, PercolateQueryAdmin)
+
+
+class IndexUpdateMarkAdmin(admin.ModelAdmin):
+    """IndexUpdateMark Admin"""
+
+    model = models.IndexUpdateMark
+    list_display = ("object_type", "etl_source", "synced_on")
+
+
+admin.site.register(models.IndexUpdateMark, IndexUpdateMarkAdmin)
@@ -1,17 +1,23 @@
 """API for general search-related functionality"""
 
+import base64
+import hashlib
+import json
 import logging
 import re
 from collections import Counter
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from django.conf import settings
-from opensearch_dsl import Search
+from django.core.cache import caches
+from opensearch_dsl import MultiSearch, Search
 from opensearch_dsl.query import MoreLikeThis, Percolate
-from opensearchpy.exceptions import NotFoundError
+from opensearchpy.exceptions import NotFoundError, TransportError
 
 from learning_resources.models import LearningResource
 from learning_resources_search.connection import (
+    get_conn,
     get_default_alias_name,
 )
 from learning_resources_search.constants import (
@@ -35,6 +41,7 @@ from learning_resources_search.utils import (
     adjust_search_for_percolator,
     document_percolated_actions,
 )
+from main.utils import chunks, get_search_cache_generation
 
 log = logging.getLogger(__name__)
 
@@ -535,6 +542,8 @@ def adjust_original_query_for_percolate(query):
         "search_mode",
         "slop",
         "use_dfs_query_then_fetch",
+        "pagination",
+        "cursor",
     ]:
         query.pop(key, None)
     return order_params(query)
@@ -562,6 +571,61 @@ def percolate_matches_for_document(document_id):
     return percolated_queries
 
 
+def percolate_matches_for_documents(resources):
+    """
+    Percolate matching queries for learning resources with batched multi-search
+    requests, and call the signal handler with the matches for each resource
+
+    Args:
+        resources (iterable of LearningResource): The learning resources
+
+    Returns:
+        dict: The ids of the matching PercolateQuery objects, keyed by resource id
+    """
+    matches = {}
+    matched_resources = []
+    for batch in chunks(resources, chunk_size=settings.OPENSEARCH_PERCOLATE_BATCH_SIZE):
+        multi_search = MultiSearch()
+        for resource in batch:
+            multi_search = multi_search.add(
+                Search().query(
+                    Percolate(
+                        field="query",
+                        index=get_default_alias_name(resource.resource_type),
+                        id=str(resource.id),
+                    )
+                )
+            )
+        for resource, response in zip(
+            batch, multi_search.execute(raise_on_error=False)
+        ):
+            if response is None:
+                log.info("document %s not found in index", resource.id)
+                continue
+            percolate_ids = [int(result.id) for result in response.hits]
+            if percolate_ids:
+                matches[resource.id] = percolate_ids
+                matched_resources.append(resource)
+
+    percolated_queries = PercolateQuery.objects.in_bulk(
+        {
+            percolate_id
+            for percolate_ids in matches.values()
+            for percolate_id in percolate_ids
+        }
+    )
+    for resource in matched_resources:
+        document_percolated_actions(
+            resource,
+            [
+                percolated_queries[percolate_id]
+                for percolate_id in matches[resource.id]
+                if percolate_id in percolated_queries
+            ],
+        )
+    return matches
+
+
 def add_text_query_to_search(search, text, search_params, query_type_query):
     if search_params.get("endpoint") == CONTENT_FILE_TYPE:
         text_query = generate_content_file_text_clause(text)
@@ -703,17 +767,225 @@ def construct_search(search_params):
     return search
 
 
-def execute_learn_search(search_params):
+def _template_placeholder(name):
+    """Get the placeholder a search query template holds for a parameter value"""
+    return f"\x00{name}\x00"
+
+
+TEMPLATE_TEXT_PLACEHOLDER = _template_placeholder("q")
+TEMPLATE_ORIGIN_PLACEHOLDER = _template_placeholder("origin")
+# Parameters whose values are filled into a template rather than shaping it
+TEMPLATE_VALUE_PARAMS = {"q", "offset", "limit"}
+# Parameters that don't change the aggregations of a search
+AGGREGATION_CACHE_EXCLUDED_PARAMS = {"offset", "limit", "sortby", "dev_mode"}
+# Pagination mode that pages with a point in time and search_after
+CURSOR_PAGINATION = "cursor"
+
+
+def _is_template_filter(name, value):
+    """Whether the values of a search parameter are filter values to fill in"""
+    return name in SEARCH_FILTERS and name != "resource_type" and bool(value)
+
+
+def _freeze(value):
+    """Make a search parameter value hashable"""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def _normalize_text(text):
+    """Replace curly quotes in a search text with straight ones"""
+    return re.sub("[\u201c\u201d]", '"', text or "")
+
+
+def _text_placeholder(text):
+    """Get the placeholder for a search text, which keeps any enclosing quotes"""
+    if text.startswith('"') and text.endswith('"'):
+        return f'"{TEMPLATE_TEXT_PLACEHOLDER}"'
+    return TEMPLATE_TEXT_PLACEHOLDER
+
+
+def get_search_template_key(search_params):
     """
-    Execute a learning resources search based on the query
+    Get the shape of the search parameters, which determines the structure of the
+    query. Text, pagination and filter values are left out since they are filled
+    into the query template. The values of other parameters, like the sort order,
+    search mode and resource types, change the structure or are rarely anything
+    but the defaults, so they are part of the shape.
+
+    Args:
+        search_params (dict): The opensearch query params
+
+    Returns:
+        tuple: the shape of the search parameters
+    """
+    shape = []
+    for name, value in sorted(search_params.items()):
+        if name == "q":
+            text = _normalize_text(value)
+            shape.append((name, text and _text_placeholder(text)))
+        elif name in TEMPLATE_VALUE_PARAMS:
+            shape.append((name, bool(value)))
+        elif _is_template_filter(name, value):
+            shape.append((name, len(value)))
+        else:
+            shape.append((name, _freeze(value)))
+    return tuple(shape)
+
+
+def _compile_template(node, placeholders):
+    """
+    Compile part of a request body into a function that copies it with its
+    placeholders replaced by their values. Parts without placeholders are shared
+    by every copy rather than copied.
+    """
+    if isinstance(node, str) and node in placeholders:
+        return lambda values: values[node]
+    if isinstance(node, dict):
+        fillers = {
+            key: _compile_template(value, placeholders) for key, value in node.items()
+        }
+        dynamic = {key: fill for key, fill in fillers.items() if fill is not None}
+        if dynamic:
+            static = {key: node[key] for key in node if key not in dynamic}
+            return lambda values: {
+                **static,
+                **{key: fill(values) for key, fill in dynamic.items()},
+            }
+    elif isinstance(node, list):
+        fillers = [_compile_template(value, placeholders) for value in node]
+        if any(fill is not None for fill in fillers):
+            return lambda values: [
+                item if fill is None else fill(values)
+                for item, fill in zip(node, fillers)
+            ]
+    return None
+
+
+@lru_cache(maxsize=settings.OPENSEARCH_QUERY_TEMPLATE_CACHE_SIZE)
+def get_search_template(template_key):
+    """
+    Build the query template for a shape of search parameters. The template is the
+    request body of a search made with placeholders for the parameter values,
+    compiled into a function that fills them in.
+
+    Args:
+        template_key (tuple): the shape from get_search_template_key
+
+    Returns:
+        tuple of (list of str, function): the search indexes and a function
+            taking the values of the placeholders and returning a request body
+    """
+    search_params = {}
+    placeholders = {TEMPLATE_ORIGIN_PLACEHOLDER}
+    for name, shape in template_key:
+        if name == "q":
+            search_params[name] = shape
+            if shape:
+                placeholders.add(shape)
+        elif name in TEMPLATE_VALUE_PARAMS:
+            search_params[name] = _template_placeholder(name) if shape else None
+            if shape:
+                placeholders.add(search_params[name])
+        elif _is_template_filter(name, shape):
+            search_params[name] = [
+                _template_placeholder(f"{name}.{index}") for index in range(shape)
+            ]
+            placeholders.update(search_params[name])
+        else:
+            search_params[name] = shape
+
+    search = construct_search(search_params)
+    body = search.to_dict()
+    script = body.get("query", {}).get("script_score", {}).get("script", {})
+    if "origin" in script.get("params", {}):
+        script["params"]["origin"] = TEMPLATE_ORIGIN_PLACEHOLDER
+
+    fill = _compile_template(body, placeholders) or (lambda _values: body)
+    return search._index, fill  # noqa: SLF001
 
 
+class TemplateSearch(Search):
+    """
+    A search with a request body filled in from a query template. The body is sent
+    as it is, so the search can't be refined with query(), filter() and the like.
+    """
+
+    def __init__(self, body=None, **kwargs):
+        """Create a search with a request body"""
+        super().__init__(**kwargs)
+        self._body = body or {}
+
+    def _clone(self):
+        search = super()._clone()
+        search._body = self._body  # noqa: SLF001
+        return search
+
+    def to_dict(self, count=False, **kwargs):  # noqa: FBT002
+        """Get the request body of the search"""
+        if count:
+            body = {"query": self._body["query"]} if "query" in self._body else {}
+        else:
+            body = self._body
+        return {**body, **kwargs}
+
+
+def construct_search_from_template(search_params, *, include_aggregations=True):
+    """
+    Construct a learning resources search from a cached query template. This is
+    the same search as construct_search makes, but for search parameters of a
+    shape that was seen before it only costs filling in the parameter values.
+
     Args:
         search_params (dict): The opensearch query params returned from
         LearningResourcesSearchRequestSerializer
+        include_aggregations (bool): Whether to request the aggregations. The
+            indexes searched stay the same either way.
 
     Returns:
-        dict: The opensearch response dict
+        TemplateSearch: an opensearch search instance
+    """
+    if (
+        not search_params.get("resource_type")
+        and search_params.get("endpoint") != CONTENT_FILE_TYPE
+    ):
+        search_params["resource_type"] = list(LEARNING_RESOURCE_TYPES)
+
+    indexes, fill = get_search_template(get_search_template_key(search_params))
+
+    values = {
+        TEMPLATE_ORIGIN_PLACEHOLDER: datetime.now(tz=UTC).strftime(
+            "%Y-%m-%dT%H:%M:%S.%fZ"
+        )
+    }
+    for name, value in search_params.items():
+        if name == "q":
+            text = _normalize_text(value)
+            values[_text_placeholder(text)] = text
+        elif name in TEMPLATE_VALUE_PARAMS:
+            values[_template_placeholder(name)] = value
+        elif _is_template_filter(name, value):
+            for index, filter_value in enumerate(value):
+                values[_template_placeholder(f"{name}.{index}")] = filter_value
+
+    body = fill(values)
+    if not include_aggregations:
+        body = {key: value for key, value in body.items() if key != "aggs"}
+    return TemplateSearch(body, index=indexes).params(
+        search_type="dfs_query_then_fetch"
+    )
+
+
+def set_default_search_params(search_params):
+    """
+    Fill in the default values of the learning resource search parameters that
+    weren't given
+
+    Args:
+        search_params (dict): The opensearch query params
     """
     if search_params.get("endpoint") != CONTENT_FILE_TYPE:
         if search_params.get("yearly_decay_percent") is None:
@@ -730,8 +1002,183 @@ def execute_learn_search(search_params):
             search_params["max_incompleteness_penalty"] = (
                 settings.DEFAULT_SEARCH_MAX_INCOMPLETENESS_PENALTY
             )
-    search = construct_search(search_params)
-    return search.execute().to_dict()
+
+
+def execute_learn_search(search_params):
+    """
+    Execute a learning resources search based on the query
+
+
+    Args:
+        search_params (dict): The opensearch query params returned from
+        LearningResourcesSearchRequestSerializer
+
+    Returns:
+        dict: The opensearch response dict
+    """
+    set_default_search_params(search_params)
+    cursor = search_params.pop("cursor", None)
+    use_cursor = search_params.pop("pagination", None) == CURSOR_PAGINATION or cursor
+
+    cache_key = None
+    cached_aggregations = None
+    if (
+        search_params.get("aggregations")
+        and not search_params.get("dev_mode")
+        and settings.SEARCH_AGGREGATION_CACHE_DURATION
+    ):
+        cache_key = get_aggregations_cache_key(search_params)
+        cached_aggregations = caches["redis"].get(cache_key)
+
+    search = construct_search_from_template(
+        search_params, include_aggregations=cached_aggregations is None
+    )
+    if use_cursor:
+        cursor_search = paginate_search_with_cursor(search, cursor)
+        use_cursor = cursor_search is not None
+        search = cursor_search or search
+    response = search.execute().to_dict()
+    if use_cursor:
+        add_next_search_cursor(search, response)
+
+    if cached_aggregations is not None:
+        response["aggregations"] = cached_aggregations
+    elif cache_key and "aggregations" in response:
+        caches["redis"].set(
+            cache_key,
+            response["aggregations"],
+            timeout=settings.SEARCH_AGGREGATION_CACHE_DURATION,
+        )
+    return response
+
+
+def encode_search_cursor(pit_id, search_after):
+    """
+    Encode the point in time of a search and the sort values of the last hit on a
+    page into an opaque token for the next page
+
+    Args:
+        pit_id (str): The id of the point in time
+        search_after (list): The sort values of the last hit
+
+    Returns:
+        str: the cursor token
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps({"pit_id": pit_id, "search_after": search_after}).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_search_cursor(cursor):
+    """
+    Decode a cursor token made by encode_search_cursor
+
+    Args:
+        cursor (str): The cursor token
+
+    Returns:
+        tuple of (str, list): the point in time id and the search_after values
+
+    Raises:
+        ValueError: if the cursor is not a valid token
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return data["pit_id"], list(data["search_after"])
+    except (ValueError, TypeError, KeyError) as ex:
+        msg = "Invalid search cursor"
+        raise ValueError(msg) from ex
+
+
+def paginate_search_with_cursor(search, cursor=None):
+    """
+    Page through a search with a point in time and search_after rather than with
+    from and size, which gets more expensive the deeper the page. The first page
+    opens a point in time on the indexes of the search.
+
+    Args:
+        search (TemplateSearch): The search to page through
+        cursor (str): The cursor token of the page, or None for the first page
+
+    Returns:
+        TemplateSearch: the search for the page, or None if a point in time could
+            not be opened for the first page, such as when the cluster already
+            has search.max_open_pit_context open. The search should then be
+            paged with from and size instead.
+    """
+    body = {key: value for key, value in search.to_dict().items() if key != "from"}
+    if cursor:
+        pit_id, body["search_after"] = decode_search_cursor(cursor)
+    else:
+        try:
+            pit_id = get_conn().create_point_in_time(
+                index=search._index,  # noqa: SLF001
+                keep_alive=settings.OPENSEARCH_SEARCH_CURSOR_KEEP_ALIVE,
+            )["pit_id"]
+        except TransportError as ex:
+            log.warning(
+                "Could not open a point in time, using offset pagination: %s", ex
+            )
+            return None
+    body["pit"] = {
+        "id": pit_id,
+        "keep_alive": settings.OPENSEARCH_SEARCH_CURSOR_KEEP_ALIVE,
+    }
+    # search_after needs a unique sort value for every hit
+    body["sort"] = [*body.get("sort", ["_score"]), {"id": "asc"}]
+    body.setdefault("size", settings.OPENSEARCH_DEFAULT_PAGE_SIZE)
+    # A search with a point in time must not name any indexes
+    return TemplateSearch(body).params(**search._params)  # noqa: SLF001
+
+
+def add_next_search_cursor(search, response):
+    """
+    Add the cursor token of the next page to the response of a search paged with
+    paginate_search_with_cursor, and mark the response as cursor paginated. The
+    point in time is closed after the last page.
+
+    Args:
+        search (TemplateSearch): The search for the page
+        response (dict): The opensearch response dict
+    """
+    body = search.to_dict()
+    pit_id = response.get("pit_id", body["pit"]["id"])
+    hits = response.get("hits", {}).get("hits", [])
+    response["pagination"] = CURSOR_PAGINATION
+    if hits and len(hits) >= body["size"]:
+        response["next_cursor"] = encode_search_cursor(pit_id, hits[-1]["sort"])
+        return
+    try:
+        get_conn().delete_point_in_time(body={"pit_id": [pit_id]})
+    except TransportError:
+        log.exception("Could not delete point in time %s", pit_id)
+
+
+def get_aggregations_cache_key(search_params):
+    """
+    Get the cache key for the aggregations of a search. Aggregations don't depend
+    on the page or sort order, so those parameters are left out. The key changes
+    whenever the search cache is cleared, such as after the indexes are updated.
+
+    Args:
+        search_params (dict): The opensearch query params
+
+    Returns:
+        str: the cache key
+    """
+    params_hash = hashlib.sha256(
+        json.dumps(
+            order_params(
+                {
+                    name: value
+                    for name, value in search_params.items()
+                    if name not in AGGREGATION_CACHE_EXCLUDED_PARAMS
+                }
+            ),
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+    return f"search_aggregations.{get_search_cache_generation()}.{params_hash}"
 
 
 def subscribe_user_to_search_query(
@@ -846,6 +1293,14 @@ def get_similar_topics(
         list of str:
             list of topic values
     """
+    search = _similar_topics_search(value_doc, min_term_freq, min_doc_freq)
+    return _most_common_topics(search.execute(), num_topics)
+
+
+def _similar_topics_search(
+    value_doc: dict, min_term_freq: int, min_doc_freq: int
+) -> Search:
+    """Build a search for courses similar to the text values of a document"""
     indexes = relevant_indexes([COURSE_TYPE], [], endpoint=LEARNING_RESOURCE)
     search = Search(index=",".join(indexes))
     search = search.filter("term", resource_type=COURSE_TYPE)
@@ -862,11 +1317,78 @@ def get_similar_topics(
             min_doc_freq=min_doc_freq,
         )
     )
-    search = search.source(includes="topics")
+    return search.source(includes="topics")
 
-    response = search.execute()
 
-    topics = [topic.to_dict()["name"] for hit in response.hits for topic in hit.topics]
+def _most_common_topics(response, num_topics: int) -> list[str]:
+    """Get the most common topic names of the hits in a search response"""
+    counter = Counter(
+        topic.to_dict()["name"] for hit in response.hits for topic in hit.topics
+    )
+    return [topic_name for topic_name, _ in counter.most_common(num_topics)]
+
+
+def _similar_topics_cache_key(
+    value_doc: dict, num_topics: int, min_term_freq: int, min_doc_freq: int
+) -> str:
+    """Get the cache key for the similar topics of a document's text values"""
+    text_hash = hashlib.sha256(
+        json.dumps(
+            [value_doc, num_topics, min_term_freq, min_doc_freq], sort_keys=True
+        ).encode("utf-8")
+    ).hexdigest()
+    return f"similar_topics.{text_hash}"
+
+
+def get_similar_topics_bulk(
+    value_docs: list[dict], num_topics: int, min_term_freq: int, min_doc_freq: int
+) -> list[list[str]]:
+    """
+    Get lists of similar topics for many documents, with one multi-search request
+    per batch. Results are cached by the documents' text values, so unchanged
+    documents are not searched again.
+
+    Args:
+        value_docs (list of dict):
+            documents representing the data fields we want to search with
+        num_topics (int):
+            number of topics to return per document
+        min_term_freq (int):
+            minimum times a term needs to show up in input
+        min_doc_freq (int):
+            minimum times a term needs to show up in docs
+
+    Returns:
+        list of list of str:
+            lists of topic values, in the same order as value_docs
+    """
+    cache = caches["durable"]
+    cache_keys = [
+        _similar_topics_cache_key(value_doc, num_topics, min_term_freq, min_doc_freq)
+        for value_doc in value_docs
+    ]
+    cached = cache.get_many(cache_keys)
+    missing = {
+        cache_key: value_doc
+        for cache_key, value_doc in zip(cache_keys, value_docs)
+        if cache_key not in cached
+    }
+
+    for batch in chunks(
+        list(missing.items()), chunk_size=settings.OPEN_VIDEO_SIMILAR_TOPICS_BATCH_SIZE
+    ):
+        multi_search = MultiSearch()
+        for _, value_doc in batch:
+            multi_search = multi_search.add(
+                _similar_topics_search(value_doc, min_term_freq, min_doc_freq)
+            )
+        results = {
+            cache_key: _most_common_topics(response, num_topics)
+            for (cache_key, _), response in zip(batch, multi_search.execute())
+        }
+        cache.set_many(
+            results, timeout=settings.OPEN_VIDEO_SIMILAR_TOPICS_CACHE_TIMEOUT
+        )
+        cached.update(results)
 
-    counter = Counter(topics)
-    return list(dict(counter.most_common(num_topics)).keys())
+    return [cached[cache_key] for cache_key in cache_keys]
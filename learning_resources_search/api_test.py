@@ -3,14 +3,19 @@
 from unittest.mock import Mock
 
 import pytest
+from django.core.cache import caches
 from freezegun import freeze_time
 from opensearch_dsl import response
 from opensearch_dsl.query import Percolate
+from opensearchpy.exceptions import TransportError
 
 from learning_resources.factories import LearningResourceFactory
 from learning_resources_search.api import (
     Search,
     construct_search,
+    construct_search_from_template,
+    decode_search_cursor,
+    encode_search_cursor,
     execute_learn_search,
     generate_aggregation_clause,
     generate_aggregation_clauses,
@@ -20,8 +25,11 @@ from learning_resources_search.api import (
     generate_learning_resources_text_clause,
     generate_sort_clause,
     generate_suggest_clause,
+    get_search_template,
     get_similar_topics,
+    get_similar_topics_bulk,
     percolate_matches_for_document,
+    percolate_matches_for_documents,
     relevant_indexes,
 )
 from learning_resources_search.constants import (
@@ -31,6 +39,7 @@ from learning_resources_search.constants import (
 )
 from learning_resources_search.factories import PercolateQueryFactory
 from learning_resources_search.models import PercolateQuery
+from main.utils import clear_search_cache
 
 
 def os_topic(topic_name) -> Mock:
@@ -1456,6 +1465,7 @@ def test_execute_learn_search_for_learning_resource_query(opensearch):
                 "resource_age_date",
                 "featured_rank",
                 "is_incomplete_or_stale",
+                "recent_views_count",
             ]
         },
     }
@@ -1933,6 +1943,7 @@ def test_execute_learn_search_with_script_score(
                 "resource_age_date",
                 "featured_rank",
                 "is_incomplete_or_stale",
+                "recent_views_count",
             ]
         },
     }
@@ -2362,6 +2373,7 @@ def test_execute_learn_search_with_min_score(mocker, settings, opensearch):
                 "resource_age_date",
                 "featured_rank",
                 "is_incomplete_or_stale",
+                "recent_views_count",
             ]
         },
     }
@@ -2575,6 +2587,7 @@ def test_execute_learn_search_for_content_file_query(opensearch):
                 "resource_age_date",
                 "featured_rank",
                 "is_incomplete_or_stale",
+                "recent_views_count",
             ]
         },
     }
@@ -2701,6 +2714,98 @@ def test_document_percolation(opensearch, mocker):
     )
 
 
+@pytest.mark.django_db
+def test_percolate_matches_for_documents(mocker, settings, django_assert_num_queries):
+    """
+    percolate_matches_for_documents should percolate resources in batched
+    multi-search requests, load the matched queries in one query and call the
+    plugin handler for each matched resource
+    """
+    settings.OPENSEARCH_PERCOLATE_BATCH_SIZE = 2
+    mocker.patch(
+        "learning_resources_search.indexing_api._update_document_by_id", autospec=True
+    )
+    queries = PercolateQueryFactory.create_batch(2)
+    resources = LearningResourceFactory.create_batch(3)
+
+    def percolate_response(query_ids):
+        return response.Response(
+            Search(),
+            {
+                "hits": {
+                    "hits": [
+                        {
+                            "_index": "test",
+                            "_id": str(query_id),
+                            "_source": {"id": query_id},
+                        }
+                        for query_id in query_ids
+                    ]
+                }
+            },
+        )
+
+    mock_execute = mocker.patch(
+        "learning_resources_search.api.MultiSearch.execute",
+        side_effect=[
+            [percolate_response([queries[0].id, queries[1].id]), None],
+            [percolate_response([queries[1].id])],
+        ],
+    )
+    mock_actions = mocker.patch(
+        "learning_resources_search.api.document_percolated_actions"
+    )
+
+    with django_assert_num_queries(1):
+        assert percolate_matches_for_documents(resources) == {
+            resources[0].id: [queries[0].id, queries[1].id],
+            resources[2].id: [queries[1].id],
+        }
+    assert mock_execute.call_count == 2
+    assert mock_actions.call_args_list == [
+        mocker.call(resources[0], queries),
+        mocker.call(resources[2], [queries[1]]),
+    ]
+
+
+@pytest.mark.django_db
+def test_get_similar_topics_bulk(mocker, settings):
+    """get_similar_topics_bulk should search in batches and cache the results"""
+    settings.OPEN_VIDEO_SIMILAR_TOPICS_BATCH_SIZE = 2
+    input_docs = [{"title": f"title {num}", "description": None} for num in range(3)]
+
+    def topics_response(*topic_lists):
+        return response.Response(
+            Search(),
+            {
+                "hits": {
+                    "hits": [
+                        {"_source": {"topics": [os_topic(name) for name in names]}}
+                        for names in topic_lists
+                    ]
+                }
+            },
+        )
+
+    mock_execute = mocker.patch(
+        "learning_resources_search.api.MultiSearch.execute",
+        side_effect=[
+            [
+                topics_response(["topic b", "topic a"], ["topic a"]),
+                topics_response(),
+            ],
+            [topics_response(["topic c"])],
+        ],
+    )
+
+    expected = [["topic a", "topic b"], [], ["topic c"]]
+    assert get_similar_topics_bulk(input_docs, 2, 1, 15) == expected
+    assert mock_execute.call_count == 2
+
+    assert get_similar_topics_bulk(input_docs[::-1], 2, 1, 15) == expected[::-1]
+    assert mock_execute.call_count == 2
+
+
 @pytest.mark.parametrize(
     ("sortby", "q", "result"),
     [
@@ -2713,6 +2818,7 @@ def test_document_percolation(opensearch, mocker):
                 "featured_rank",
                 "is_learning_material",
                 "is_incomplete_or_stale",
+                "recent_views_count",
                 {"created_on": {"order": "desc"}},
             ],
         ),
@@ -2750,3 +2856,211 @@ def test_dev_mode(dev_mode):
         assert construct_search(search_params).to_dict().get("explain")
     else:
         assert construct_search(search_params).to_dict().get("explain") is None
+
+
+@freeze_time("2024-07-20")
+@pytest.mark.parametrize(
+    "search_params",
+    [
+        {"endpoint": LEARNING_RESOURCE},
+        {
+            "endpoint": LEARNING_RESOURCE,
+            "q": "machine learning",
+            "limit": 20,
+            "offset": 40,
+            "aggregations": ["resource_type", "free", "topic", "department"],
+            "free": [True],
+            "topic": ["Mathematics", "Physics"],
+            "yearly_decay_percent": 2.5,
+            "search_mode": "phrase",
+            "slop": 6,
+            "min_score": 5,
+            "max_incompleteness_penalty": 90,
+            "content_file_score_weight": 0.5,
+        },
+        {
+            "endpoint": LEARNING_RESOURCE,
+            "q": "\u201cmachine learning\u201d",
+            "sortby": "mitcoursenumber",
+            "department": ["6", "18"],
+            "resource_type": ["course"],
+            "offset": 0,
+            "dev_mode": True,
+        },
+        {
+            "endpoint": CONTENT_FILE_TYPE,
+            "q": "lecture notes",
+            "aggregations": ["platform"],
+            "run_id": [1, 2],
+            "sortby": "-views",
+        },
+    ],
+)
+def test_construct_search_from_template(search_params):
+    """A search built from a template should match the one construct_search builds"""
+    expected = construct_search(search_params.copy())
+    search = construct_search_from_template(search_params.copy())
+    assert search.to_dict() == expected.to_dict()
+    assert search._index == expected._index  # noqa: SLF001
+    assert search._params == expected._params  # noqa: SLF001
+    assert search.to_dict(count=True) == expected.to_dict(count=True)
+
+
+def test_construct_search_from_template_cache():
+    """Search parameters of the same shape should share a template"""
+    get_search_template.cache_clear()
+    search_params = {
+        "endpoint": LEARNING_RESOURCE,
+        "q": "biology",
+        "topic": ["Biology"],
+        "limit": 10,
+    }
+    construct_search_from_template(search_params.copy())
+    search = construct_search_from_template(
+        {**search_params, "q": "chemistry", "topic": ["Chemistry"], "limit": 5}
+    )
+    assert get_search_template.cache_info().hits == 1
+    assert (
+        search.to_dict()
+        == construct_search(
+            {**search_params, "q": "chemistry", "topic": ["Chemistry"], "limit": 5}
+        ).to_dict()
+    )
+
+    construct_search_from_template({**search_params, "topic": ["Biology", "Math"]})
+    construct_search_from_template({**search_params, "q": '"biology"'})
+    assert get_search_template.cache_info().misses == 3
+
+
+@pytest.mark.parametrize("dev_mode", [True, False])
+def test_execute_learn_search_cached_aggregations(settings, opensearch, dev_mode):
+    """Aggregations should be cached across pages and sort orders of a search"""
+    settings.CACHES = {
+        **settings.CACHES,
+        "redis": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-search-aggregations",
+        },
+    }
+    aggregations = {"free": {"buckets": [{"key": 1, "doc_count": 5}]}}
+    opensearch.conn.search.side_effect = lambda **kwargs: {
+        "hits": {"hits": [], "total": {"value": 5}},
+        **({"aggregations": aggregations} if "aggs" in kwargs["body"] else {}),
+    }
+    search_params = {
+        "q": "biology",
+        "aggregations": ["free"],
+        "endpoint": LEARNING_RESOURCE,
+        "dev_mode": dev_mode,
+    }
+
+    for page in range(2):
+        response = execute_learn_search(
+            {**search_params, "offset": page * 10, "sortby": "-views"}
+        )
+        assert response["aggregations"] == aggregations
+    clear_search_cache()
+    execute_learn_search(search_params.copy())
+
+    bodies = [call.kwargs["body"] for call in opensearch.conn.search.call_args_list]
+    assert ["aggs" in body for body in bodies] == [True, dev_mode, True]
+    caches["redis"].clear()
+
+
+def test_search_cursor():
+    """Cursors should be decoded to the point in time and sort values encoded in them"""
+    assert decode_search_cursor(encode_search_cursor("pit", [1.5, "a", 3])) == (
+        "pit",
+        [1.5, "a", 3],
+    )
+    for cursor in ["spaceship", encode_search_cursor("pit", 3)[:-2], "Wzld"]:
+        with pytest.raises(ValueError, match="Invalid search cursor"):
+            decode_search_cursor(cursor)
+
+
+def test_execute_learn_search_cursor_pagination(mocker, settings, opensearch):
+    """Searches using cursor pagination should page with a point in time"""
+    settings.OPENSEARCH_SEARCH_CURSOR_KEEP_ALIVE = "1m"
+    mock_conn = mocker.patch("learning_resources_search.api.get_conn").return_value
+    mock_conn.create_point_in_time.return_value = {"pit_id": "pit1"}
+    opensearch.conn.search.side_effect = [
+        {
+            "pit_id": "pit2",
+            "hits": {
+                "total": {"value": 3},
+                "hits": [
+                    {"_id": "1", "sort": [2.0, 1]},
+                    {"_id": "2", "sort": [1.0, 2]},
+                ],
+            },
+        },
+        {
+            "pit_id": "pit2",
+            "hits": {"total": {"value": 3}, "hits": [{"_id": "3", "sort": [1.0, 3]}]},
+        },
+    ]
+    search_params = {
+        "q": "biology",
+        "limit": 2,
+        "offset": 10,
+        "endpoint": LEARNING_RESOURCE,
+        "pagination": "cursor",
+    }
+
+    response = execute_learn_search(search_params.copy())
+    mock_conn.create_point_in_time.assert_called_once()
+    pit_kwargs = mock_conn.create_point_in_time.call_args.kwargs
+    assert pit_kwargs["keep_alive"] == "1m"
+    assert "testindex_course_default" in pit_kwargs["index"][0].split(",")
+    first_call = opensearch.conn.search.call_args_list[0].kwargs
+    assert first_call["index"] is None
+    assert first_call["search_type"] == "dfs_query_then_fetch"
+    assert "from" not in first_call["body"]
+    assert "search_after" not in first_call["body"]
+    assert first_call["body"]["pit"] == {"id": "pit1", "keep_alive": "1m"}
+    assert first_call["body"]["sort"] == ["_score", {"id": "asc"}]
+    assert first_call["body"]["size"] == 2
+    assert response["pagination"] == "cursor"
+    assert decode_search_cursor(response["next_cursor"]) == ("pit2", [1.0, 2])
+    mock_conn.delete_point_in_time.assert_not_called()
+
+    response = execute_learn_search(
+        {**search_params, "cursor": response["next_cursor"]}
+    )
+    assert mock_conn.create_point_in_time.call_count == 1
+    second_call = opensearch.conn.search.call_args_list[1].kwargs
+    assert second_call["body"]["search_after"] == [1.0, 2]
+    assert second_call["body"]["pit"] == {"id": "pit2", "keep_alive": "1m"}
+    assert "next_cursor" not in response
+    mock_conn.delete_point_in_time.assert_called_once_with(body={"pit_id": ["pit2"]})
+
+
+def test_execute_learn_search_cursor_pagination_fallback(mocker, opensearch):
+    """Cursor searches should use offset pagination if no point in time can be opened"""
+    mock_conn = mocker.patch("learning_resources_search.api.get_conn").return_value
+    mock_conn.create_point_in_time.side_effect = TransportError(
+        400,
+        "illegal_argument_exception",
+        "Trying to create too many Point In Time contexts",
+    )
+    opensearch.conn.search.return_value = {
+        "hits": {"total": {"value": 3}, "hits": [{"_id": "1"}, {"_id": "2"}]},
+    }
+
+    response = execute_learn_search(
+        {
+            "q": "biology",
+            "limit": 2,
+            "offset": 4,
+            "endpoint": LEARNING_RESOURCE,
+            "pagination": "cursor",
+        }
+    )
+
+    body = opensearch.conn.search.call_args.kwargs["body"]
+    assert body["from"] == 4
+    assert body["size"] == 2
+    assert "pit" not in body
+    assert "pagination" not in response
+    assert "next_cursor" not in response
+    mock_conn.delete_point_in_time.assert_not_called()
@@ -291,6 +291,7 @@ LEARNING_RESOURCE_MAP = {
     "next_start_date": {"type": "date"},
     "resource_age_date": {"type": "date"},
     "featured_rank": {"type": "float"},
+    "recent_views_count": {"type": "integer"},
     "completeness": {"type": "float"},
     "license_cc": {"type": "boolean"},
     "continuing_ed_credits": {"type": "float"},
@@ -420,6 +421,7 @@ SOURCE_EXCLUDED_FIELDS = [
     "resource_age_date",
     "featured_rank",
     "is_incomplete_or_stale",
+    "recent_views_count",
 ]
 
 LEARNING_RESOURCE_SEARCH_SORTBY_OPTIONS = {
@@ -1,4 +1,5 @@
 import random
+from datetime import UTC
 
 import factory
 from factory.django import DjangoModelFactory
@@ -129,3 +130,12 @@ class PercolateQueryFactory(DjangoModelFactory):
 
     class Meta:
         model = models.PercolateQuery
+
+
+class IndexUpdateMarkFactory(DjangoModelFactory):
+    object_type = "course"
+    etl_source = ""
+    synced_on = factory.Faker("date_time", tzinfo=UTC)
+
+    class Meta:
+        model = models.IndexUpdateMark
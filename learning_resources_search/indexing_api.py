@@ -2,16 +2,19 @@
 Functions and constants for OpenSearch indexing
 """
 
-import json
+import hashlib
 import logging
-from math import ceil
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from opensearchpy.exceptions import ConflictError, NotFoundError
-from opensearchpy.helpers import BulkIndexError, bulk
+from opensearchpy.helpers import expand_action
+from opensearchpy.serializer import JSONSerializer
 
 from learning_resources.models import ContentFile, LearningResourceRun
+from learning_resources_search.api import gen_content_file_id
 from learning_resources_search.connection import (
     get_active_aliases,
     get_conn,
@@ -30,6 +33,7 @@ from learning_resources_search.constants import (
     IndexestoUpdate,
 )
 from learning_resources_search.exceptions import ReindexError
+from learning_resources_search.models import DocumentFingerprint
 from learning_resources_search.serializers import (
     serialize_bulk_learning_resources,
     serialize_bulk_learning_resources_for_deletion,
@@ -43,6 +47,42 @@ from main.utils import chunks
 log = logging.getLogger(__name__)
 User = get_user_model()
 
+# The same serializer the opensearch transport uses for request bodies
+BULK_SERIALIZER = JSONSerializer()
+
+
+@cache
+def _get_alias_write_executor():
+    """
+    Get the thread pool used to write to multiple aliases at once. The pool is
+    created lazily so that it is not shared across forked worker processes.
+
+    Returns:
+        ThreadPoolExecutor: The executor for alias writes
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.OPENSEARCH_ALIAS_WRITE_WORKERS,
+        thread_name_prefix="opensearch-alias-write",
+    )
+
+
+def map_aliases(func, aliases):
+    """
+    Call a function for each alias, concurrently if there is more than one.
+    The opensearch client is thread-safe and shares its connection pool
+    (OPENSEARCH_CONNECTIONS_PER_NODE) between the threads.
+
+    Args:
+        func (callable): A function that takes an alias name
+        aliases (list of str): The aliases to call the function for
+
+    Returns:
+        dict: The results of the function keyed by alias
+    """
+    if len(aliases) <= 1:
+        return {alias: func(alias) for alias in aliases}
+    return dict(zip(aliases, _get_alias_write_executor().map(func, aliases)))
+
 
 def clear_featured_rank(rank, clear_all_greater_than):
     """
@@ -99,7 +139,8 @@ def _update_document_by_id(doc_id, body, object_type, *, retry_on_conflict=0, **
         kwargs (dict): Optional kwargs to be passed to opensearch
     """
     conn = get_conn()
-    for alias in get_active_aliases(conn, object_types=[object_type]):
+
+    def _update(alias):
         try:
             conn.update(
                 index=alias,
@@ -117,6 +158,11 @@ def _update_document_by_id(doc_id, body, object_type, *, retry_on_conflict=0, **
                 doc_id,
             )
 
+    map_aliases(_update, get_active_aliases(conn, object_types=[object_type]))
+    DocumentFingerprint.objects.filter(
+        object_type=object_type, doc_id=str(doc_id)
+    ).delete()
+
 
 def clear_and_create_index(*, index_name=None, skip_mapping=False, object_type=None):
     """
@@ -135,6 +181,7 @@ def clear_and_create_index(*, index_name=None, skip_mapping=False, object_type=N
     conn = get_conn()
     if conn.indices.exists(index_name):
         conn.indices.delete(index_name)
+    DocumentFingerprint.objects.filter(index_name=index_name).delete()
     index_create_data = {
         "settings": {
             "index": {
@@ -228,8 +275,8 @@ def update_document_with_partial(doc_id, doc, object_type, *, retry_on_conflict=
 
 def deindex_items(documents, object_type, index_types, **kwargs):
     """
-    Call index_items with error catching around not_found for objects that don't exist
-    in the index
+    Call index_items to delete documents. Documents that don't exist in the index
+    are not treated as errors.
 
     Args:
         documents (iterable of dict): An iterable with opensearch documents to index
@@ -238,18 +285,182 @@ def deindex_items(documents, object_type, index_types, **kwargs):
             index, the reindexing index or both need to be updated
 
     """
+    index_items(documents, object_type, index_types, **kwargs)
 
-    try:
-        index_items(documents, object_type, index_types, **kwargs)
-    except BulkIndexError as error:
-        error_messages = error.args[1]
 
-        for error_message in error_messages:
-            message = next(iter(error_message.values()))
-            if message["result"] != "not_found":
-                log.exception("Bulk deindex failed. Error: %s", str(message))
-                msg = f"Bulk deindex failed: {message}"
-                raise ReindexError(msg) from error
+def encode_bulk_action(document):
+    """
+    Serialize a document into the newline-delimited lines of a bulk request
+
+    Args:
+        document (dict): An opensearch document or bulk action
+
+    Returns:
+        bytes: The encoded action line, followed by the source line if there is one
+    """
+    action, source = expand_action(document)
+    lines = [BULK_SERIALIZER.dumps(action)]
+    if source is not None:
+        lines.append(BULK_SERIALIZER.dumps(source))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def chunk_bulk_actions(documents, object_type):
+    """
+    Serialize each document once and group the encoded actions into chunks
+    of at most OPENSEARCH_INDEXING_CHUNK_SIZE documents and
+    OPENSEARCH_MAX_REQUEST_SIZE bytes.
+
+    Args:
+        documents (iterable of dict): An iterable with opensearch documents
+        object_type (str): the ES object type
+
+    Yields:
+        list of tuple of (dict, bytes): The documents in the chunk and their
+            encoded bulk actions
+    """
+    max_size = settings.OPENSEARCH_MAX_REQUEST_SIZE
+    chunk_size = settings.OPENSEARCH_INDEXING_CHUNK_SIZE
+    chunk, body_size = [], 0
+    for document in documents:
+        encoded = encode_bulk_action(document)
+        if len(encoded) > max_size:
+            log.error(
+                "Document id %s for object_type %s exceeds max size %d: %d",
+                document.get("_id"),
+                object_type,
+                max_size,
+                len(encoded),
+            )
+            continue
+        if chunk and (len(chunk) >= chunk_size or body_size + len(encoded) > max_size):
+            yield chunk
+            chunk, body_size = [], 0
+        chunk.append((document, encoded))
+        body_size += len(encoded)
+    if chunk:
+        yield chunk
+
+
+def get_backing_index(conn, alias):
+    """
+    Get the index an alias points to
+
+    Args:
+        conn (opensearchpy.OpenSearch): An opensearch client
+        alias (str): The alias
+
+    Returns:
+        str: The backing index, or None if the alias doesn't point to exactly one index
+    """
+    indices = list(conn.indices.get_alias(name=alias))
+    return indices[0] if len(indices) == 1 else None
+
+
+def _is_index_action(document):
+    """Return True if the bulk action writes the whole document"""
+    return document.get("_op_type", "index") == "index"
+
+
+def get_changed_actions(actions, backing_indices):
+    """
+    Drop the index actions whose fingerprint matches the one last written to the
+    backing index of each alias. Other actions are always kept.
+
+    Args:
+        actions (list of tuple of (dict, bytes)): Documents and encoded actions
+        backing_indices (dict): The backing index of each alias to write to,
+            keyed by alias
+
+    Returns:
+        dict: The changed actions with their fingerprints keyed by alias
+    """
+    fingerprinted = [
+        (document, encoded, hashlib.blake2b(encoded, digest_size=16).hexdigest())
+        for document, encoded in actions
+    ]
+    stored = set(
+        DocumentFingerprint.objects.filter(
+            index_name__in=[index for index in backing_indices.values() if index],
+            doc_id__in=[str(document["_id"]) for document, _ in actions],
+        ).values_list("index_name", "doc_id", "fingerprint")
+    )
+    return {
+        alias: [
+            (document, encoded, fingerprint)
+            for document, encoded, fingerprint in fingerprinted
+            if not _is_index_action(document)
+            or (backing_indices[alias], str(document["_id"]), fingerprint) not in stored
+        ]
+        for alias in backing_indices
+    }
+
+
+def save_fingerprints(object_type, index_name, actions, errors):
+    """
+    Store the fingerprints of index actions written to a backing index, and remove
+    them for all other actions or failed writes
+
+    Args:
+        object_type (str): the ES object type
+        index_name (str): The backing index the actions were written to
+        actions (list of tuple of (dict, bytes, str)): The documents, encoded
+            actions and fingerprints that were sent
+        errors (list of dict): Failed bulk items
+    """
+    failed_ids = {str(item.get("_id")) for error in errors for item in error.values()}
+    written, removed = [], []
+    for document, _, fingerprint in actions:
+        doc_id = str(document["_id"])
+        if _is_index_action(document) and doc_id not in failed_ids:
+            written.append(
+                DocumentFingerprint(
+                    index_name=index_name,
+                    object_type=object_type,
+                    doc_id=doc_id,
+                    fingerprint=fingerprint,
+                )
+            )
+        else:
+            removed.append(doc_id)
+    if removed:
+        DocumentFingerprint.objects.filter(
+            index_name=index_name, doc_id__in=removed
+        ).delete()
+    DocumentFingerprint.objects.bulk_create(
+        written,
+        update_conflicts=True,
+        unique_fields=["index_name", "doc_id"],
+        update_fields=["fingerprint", "updated_on"],
+    )
+
+
+def send_bulk_body(conn, body, alias, **kwargs):
+    """
+    Send an encoded bulk request body to an alias
+
+    Args:
+        conn(opensearch.client.Opensearch): An Opensearch client
+        body (bytes): The encoded bulk request body
+        alias (str): The alias to send the request to
+        kwargs (dict): Optional kwargs to be passed to opensearch
+
+    Returns:
+        list of dict: Failed items from the bulk response, keyed by operation type.
+            Deletions of documents that were not found are not included.
+    """
+    response = conn.bulk(body=body, index=alias, **kwargs)
+    if not response.get("errors"):
+        return []
+    errors = []
+    for item in response["items"]:
+        op_type, result = next(iter(item.items()))
+        if 200 <= result.get("status", 500) < 300:  # noqa: PLR2004
+            continue
+        if op_type == "delete" and result.get("result") == "not_found":
+            continue
+        errors.append({op_type: result})
+    return errors
 
 
 def index_items(documents, object_type, index_types, **kwargs):
@@ -263,46 +474,39 @@ def index_items(documents, object_type, index_types, **kwargs):
             index, the reindexing index or both need to be updated
     """
     conn = get_conn()
-    # bulk will also break an iterable into chunks. However we should do this here so
-    # that we can use the same documents when indexing to multiple aliases.
-    for chunk in chunks(documents, chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE):
-        documents_size = len(json.dumps(chunk, default=str))
-        # Keep chunking the chunks until either the size is acceptable or there's
-        # nothing left to chunk
-        if documents_size > settings.OPENSEARCH_MAX_REQUEST_SIZE:
-            if len(chunk) == 1:
-                log.error(
-                    "Document id %s for object_type %s exceeds max size %d: %d",
-                    chunk[0]["_id"],
-                    object_type,
-                    settings.OPENSEARCH_MAX_REQUEST_SIZE,
-                    documents_size,
-                )
-                continue
-            num_chunks = min(
-                ceil(
-                    len(chunk)
-                    / ceil(documents_size / settings.OPENSEARCH_MAX_REQUEST_SIZE)
-                ),
-                len(chunk) - 1,
-            )
-            for smaller_chunk in chunks(chunk, chunk_size=num_chunks):
-                index_items(smaller_chunk, object_type, index_types, **kwargs)
-        else:
-            for alias in get_active_aliases(
-                conn, object_types=[object_type], index_types=index_types
-            ):
-                _, errors = bulk(
-                    conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                    **kwargs,
+    # The backing index of each alias is looked up once per call, not per chunk
+    alias_backing_indices = {}
+    # Each document is serialized only once, and only documents that changed
+    # since they were last written to an alias are sent to it. Aliases are
+    # updated at the same time.
+    for actions in chunk_bulk_actions(documents, object_type):
+        aliases = get_active_aliases(
+            conn, object_types=[object_type], index_types=index_types
+        )
+        for alias in aliases:
+            if alias not in alias_backing_indices:
+                alias_backing_indices[alias] = get_backing_index(conn, alias)
+        backing_indices = {alias: alias_backing_indices[alias] for alias in aliases}
+        changed_actions = get_changed_actions(actions, backing_indices)
+
+        def _send(alias, changed_actions=changed_actions):
+            if not changed_actions[alias]:
+                return []
+            body = b"".join(encoded for _, encoded, _ in changed_actions[alias])
+            return send_bulk_body(conn, body, alias, **kwargs)
+
+        alias_errors = {}
+        for alias, errors in map_aliases(_send, aliases).items():
+            if backing_indices[alias]:
+                save_fingerprints(
+                    object_type, backing_indices[alias], changed_actions[alias], errors
                 )
-                if len(errors) > 0:
-                    log.error(errors)
-                    msg = f"Error during bulk {object_type} insert: {errors}"
-                    raise ReindexError(msg)
+            if len(errors) > 0:
+                alias_errors[alias] = errors
+        if alias_errors:
+            log.error(alias_errors)
+            msg = f"Error during bulk {object_type} insert: {alias_errors}"
+            raise ReindexError(msg)
 
 
 def index_learning_resources(ids, resource_type, index_types):
@@ -491,6 +695,47 @@ def deindex_run_content_files(run_id, unpublished_only):
     ).delete()
 
 
+def deindex_runs_content_files(run_ids, unpublished_only):
+    """
+    Deindex and delete the content files of several runs, with a single delete
+    by query request on run_id per alias instead of one bulk request per run
+
+    Args:
+        run_ids(list of int): Course run ids
+        unpublished_only(bool): if true only delete files with published=False
+
+    """
+    content_files = ContentFile.objects.filter(run_id__in=run_ids)
+    if unpublished_only:
+        content_files = content_files.filter(published=False)
+    doc_ids = [
+        gen_content_file_id(content_file_id)
+        for content_file_id in content_files.values_list("id", flat=True)
+    ]
+    if not doc_ids:
+        return
+
+    query_filter = [{"terms": {"run_id": list(run_ids)}}]
+    if unpublished_only:
+        query_filter.append({"ids": {"values": doc_ids}})
+    conn = get_conn()
+    for alias in get_active_aliases(
+        conn,
+        object_types=[COURSE_TYPE],
+        index_types=IndexestoUpdate.all_indexes.value,
+    ):
+        conn.delete_by_query(
+            index=alias,
+            conflicts="proceed",
+            body={"query": {"bool": {"filter": query_filter}}},
+        )
+    DocumentFingerprint.objects.filter(doc_id__in=doc_ids).delete()
+    # Delete the content files now that they are deindexed
+    ContentFile.objects.filter(
+        pk__in=content_files.values_list("id", flat=True)
+    ).delete()
+
+
 def deindex_document(doc_id, object_type, **kwargs):
     """
     Make a request to ES to delete a document
@@ -501,7 +746,8 @@ def deindex_document(doc_id, object_type, **kwargs):
         kwargs (dict): optional parameters for the request
     """
     conn = get_conn()
-    for alias in get_active_aliases(conn, object_types=[object_type]):
+
+    def _delete(alias):
         try:
             conn.delete(index=alias, id=doc_id, params=kwargs)
         except NotFoundError:
@@ -509,6 +755,11 @@ def deindex_document(doc_id, object_type, **kwargs):
                 "Tried to delete an ES document that didn't exist, doc_id: '%s'", doc_id
             )
 
+    map_aliases(_delete, get_active_aliases(conn, object_types=[object_type]))
+    DocumentFingerprint.objects.filter(
+        object_type=object_type, doc_id=str(doc_id)
+    ).delete()
+
 
 def create_backing_index(object_type):
     """
@@ -574,6 +825,7 @@ def switch_indices(backing_index, object_type):
     refresh_index(backing_index)
     for index in old_backing_indexes:
         conn.indices.delete(index)
+    DocumentFingerprint.objects.filter(index_name__in=old_backing_indexes).delete()
 
     # Finally, remove the link to the reindexing alias
     try:
@@ -606,6 +858,7 @@ def delete_orphaned_indexes(obj_types, delete_reindexing_tags):
                 if object_type in index:
                     log.info("Deleting orphaned index %s", index)
                     conn.indices.delete(index)
+                    DocumentFingerprint.objects.filter(index_name=index).delete()
                     break
 
 
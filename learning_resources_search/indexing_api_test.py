@@ -3,6 +3,7 @@ Tests for the indexing API
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
 from types import SimpleNamespace
 
@@ -36,29 +37,38 @@ from learning_resources_search.indexing_api import (
     deindex_learning_resources,
     deindex_percolators,
     deindex_run_content_files,
+    deindex_runs_content_files,
     delete_orphaned_indexes,
+    encode_bulk_action,
     get_reindexing_alias_name,
     index_content_files,
     index_course_content_files,
     index_items,
     index_learning_resources,
     index_run_content_files,
+    send_bulk_body,
     switch_indices,
     update_document_with_partial,
 )
-from learning_resources_search.models import PercolateQuery
+from learning_resources_search.models import DocumentFingerprint, PercolateQuery
 from learning_resources_search.utils import remove_child_queries
 from main.utils import chunks
 
 pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("mocked_es")]
 
 
+def encode_bulk_body(documents):
+    """Return the bulk request body expected for a list of documents"""
+    return b"".join(encode_bulk_action(document) for document in documents)
+
+
 @pytest.fixture
 def mocked_es(mocker, settings):
     """ES client objects/functions mock"""
     index_name = "test"
     settings.OPENSEARCH_INDEX = index_name
     conn = mocker.Mock()
+    conn.indices.get_alias.return_value = {}
     get_conn_patch = mocker.patch(
         "learning_resources_search.indexing_api.get_conn",
         autospec=True,
@@ -121,7 +131,7 @@ def test_switch_indices(mocked_es, mocker, default_exists, alias_exists, object_
     conn_mock = mocked_es.conn
     conn_mock.indices.exists_alias.return_value = default_exists
     old_backing_index = "old_backing"
-    conn_mock.indices.get_alias.return_value.keys.return_value = [old_backing_index]
+    conn_mock.indices.get_alias.return_value = {old_backing_index: {}}
     conn_mock.indices.delete_alias.side_effect = (
         None if alias_exists else NotFoundError()
     )
@@ -205,7 +215,7 @@ def test_create_backing_index(mocked_es, mocker, temp_alias_exists):
     )
 
 
-@pytest.mark.parametrize("errors", [(), "error"])
+@pytest.mark.parametrize("errors", [[], [{"index": {"status": 400}}]])
 @pytest.mark.parametrize(
     "index_types",
     [
@@ -225,7 +235,7 @@ def test_index_learning_resources(
     index functions should call bulk with correct arguments
     """
     settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 3
-    documents = ["doc1", "doc2", "doc3", "doc4", "doc5"]
+    documents = [{"_id": idx, "title": f"doc{idx}"} for idx in range(1, 6)]
     mock_get_aliases = mocker.patch(
         "learning_resources_search.indexing_api.get_active_aliases",
         autospec=True,
@@ -237,9 +247,9 @@ def test_index_learning_resources(
         return_value=(doc for doc in documents),
     )
     bulk_mock = mocker.patch(
-        "learning_resources_search.indexing_api.bulk",
+        "learning_resources_search.indexing_api.send_bulk_body",
         autospec=True,
-        return_value=(0, errors),
+        return_value=errors,
     )
 
     if errors:
@@ -259,19 +269,18 @@ def test_index_learning_resources(
             ):
                 bulk_mock.assert_any_call(
                     mocked_es.conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                    encode_bulk_body(chunk),
+                    alias,
                 )
 
 
-@pytest.mark.parametrize("errors", [(), "error"])
+@pytest.mark.parametrize("errors", [[], [{"delete": {"status": 500}}]])
 def test_deindex_learning_resources(mocked_es, mocker, settings, errors):
     """
     Deindex functions should call bulk with correct arguments
     """
     settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 3
-    documents = ["doc1", "doc2", "doc3", "doc4", "doc5"]
+    documents = [{"_id": idx, "_op_type": "delete"} for idx in range(1, 6)]
     mock_get_aliases = mocker.patch(
         "learning_resources_search.indexing_api.get_active_aliases",
         autospec=True,
@@ -283,9 +292,9 @@ def test_deindex_learning_resources(mocked_es, mocker, settings, errors):
         return_value=(doc for doc in documents),
     )
     bulk_mock = mocker.patch(
-        "learning_resources_search.indexing_api.bulk",
+        "learning_resources_search.indexing_api.send_bulk_body",
         autospec=True,
-        return_value=(0, errors),
+        return_value=errors,
     )
 
     if errors:
@@ -305,9 +314,8 @@ def test_deindex_learning_resources(mocked_es, mocker, settings, errors):
             ):
                 bulk_mock.assert_any_call(
                     mocked_es.conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                    encode_bulk_body(chunk),
+                    alias,
                 )
 
 
@@ -320,8 +328,12 @@ def test_deindex_document(mocked_es, mocker):
         autospec=True,
         return_value=["a"],
     )
+    DocumentFingerprint.objects.create(
+        index_name="a_backing", object_type="course", doc_id="1", fingerprint="abc"
+    )
     deindex_document(1, "course")
     mocked_es.conn.delete.assert_called_with(index="a", id=1, params={})
+    assert DocumentFingerprint.objects.exists() is False
 
 
 def test_deindex_document_not_found(mocked_es, mocker):
@@ -362,6 +374,170 @@ def test_index_items_size_limits(settings, mocker, max_size, chunks, exceeds_siz
     assert mock_log.call_count == (10 if exceeds_size else 0)
 
 
+def test_index_items_serializes_once(mocked_es, mocker, settings):
+    """Each document should be serialized once and the same body sent to every alias"""
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 2
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    encode_mock = mocker.patch(
+        "learning_resources_search.indexing_api.encode_bulk_action",
+        side_effect=encode_bulk_action,
+    )
+    mocked_es.conn.bulk.return_value = {"errors": False, "items": []}
+    documents = [{"_id": idx, "title": f"doc {idx}"} for idx in range(3)]
+    index_items(documents, COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+    assert encode_mock.call_count == len(documents)
+    for alias in ["a", "b"]:
+        for chunk in chunks(documents, chunk_size=2):
+            mocked_es.conn.bulk.assert_any_call(
+                body=encode_bulk_body(chunk), index=alias
+            )
+    assert mocked_es.conn.bulk.call_count == 4
+
+
+def test_index_items_alias_errors(mocked_es, mocker):
+    """Bulk errors should be reported for each alias that failed"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    failed = {"index": {"_id": 1, "status": 400}}
+    mocker.patch(
+        "learning_resources_search.indexing_api.send_bulk_body",
+        autospec=True,
+        side_effect=lambda _conn, _body, alias, **_kwargs: (
+            [failed] if alias == "b" else []
+        ),
+    )
+    with pytest.raises(ReindexError) as exc_info:
+        index_items([{"_id": 1}], COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+    assert str(exc_info.value) == (
+        f"Error during bulk {COURSE_TYPE} insert: {{'b': [{failed}]}}"
+    )
+
+
+def test_index_items_skips_unchanged(mocked_es, mocker):
+    """Documents should only be sent to an alias if they changed since they were last written to its index"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    mocked_es.conn.indices.get_alias.side_effect = lambda name: {f"{name}_backing": {}}
+    bulk_mock = mocker.patch(
+        "learning_resources_search.indexing_api.send_bulk_body",
+        autospec=True,
+        return_value=[],
+    )
+    documents = [{"_id": idx, "title": f"doc {idx}"} for idx in range(3)]
+    index_items(documents, COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+    assert bulk_mock.call_count == 2
+    assert DocumentFingerprint.objects.count() == 6
+
+    # Fingerprints for "b" are gone, as if its index had been recreated
+    DocumentFingerprint.objects.filter(index_name="b_backing").delete()
+    bulk_mock.reset_mock()
+    documents[1]["title"] = "changed"
+    index_items(documents, COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+    bulk_mock.assert_any_call(mocked_es.conn, encode_bulk_body([documents[1]]), "a")
+    bulk_mock.assert_any_call(mocked_es.conn, encode_bulk_body(documents), "b")
+    assert bulk_mock.call_count == 2
+
+    bulk_mock.reset_mock()
+    index_items(documents, COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+    bulk_mock.assert_not_called()
+
+    index_items(
+        [{"_id": 0, "_op_type": "delete"}],
+        COURSE_TYPE,
+        IndexestoUpdate.all_indexes.value,
+    )
+    assert bulk_mock.call_count == 2
+    assert not DocumentFingerprint.objects.filter(doc_id="0").exists()
+
+
+def test_index_items_backing_index_lookups(mocked_es, mocker, settings):
+    """The backing index of each alias should be looked up once per index_items call"""
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 1
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    mocked_es.conn.indices.get_alias.side_effect = lambda name: {f"{name}_backing": {}}
+    bulk_mock = mocker.patch(
+        "learning_resources_search.indexing_api.send_bulk_body",
+        autospec=True,
+        return_value=[],
+    )
+    documents = [{"_id": idx, "title": f"doc {idx}"} for idx in range(3)]
+    index_items(documents, COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+    assert bulk_mock.call_count == 6
+    assert mocked_es.conn.indices.get_alias.call_count == 2
+
+
+def test_index_items_failed_fingerprints(mocked_es, mocker):
+    """Fingerprints should not be stored for documents that failed to index"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a"],
+    )
+    mocked_es.conn.indices.get_alias.return_value = {"a_backing": {}}
+    mocker.patch(
+        "learning_resources_search.indexing_api.send_bulk_body",
+        autospec=True,
+        return_value=[{"index": {"_id": "1", "status": 400}}],
+    )
+    with pytest.raises(ReindexError):
+        index_items(
+            [{"_id": 1}, {"_id": 2}], COURSE_TYPE, IndexestoUpdate.all_indexes.value
+        )
+    assert list(DocumentFingerprint.objects.values_list("doc_id", flat=True)) == ["2"]
+
+
+def test_map_aliases(mocker, settings):
+    """map_aliases should call the function for each alias and key results by alias"""
+    settings.OPENSEARCH_ALIAS_WRITE_WORKERS = 2
+    mock_executor = mocker.patch(
+        "learning_resources_search.indexing_api._get_alias_write_executor",
+        return_value=ThreadPoolExecutor(max_workers=2),
+    )
+    assert indexing_api.map_aliases(str.upper, ["a"]) == {"a": "A"}
+    assert mock_executor.call_count == 0
+    assert indexing_api.map_aliases(str.upper, ["a", "b"]) == {"a": "A", "b": "B"}
+    assert mock_executor.call_count == 1
+
+
+def test_encode_bulk_action():
+    """encode_bulk_action should return newline-delimited action and source lines"""
+    assert encode_bulk_action({"_id": 1, "title": "a"}) == (
+        b'{"index":{"_id":1}}\n{"title":"a"}\n'
+    )
+    assert encode_bulk_action({"_id": 1, "_op_type": "delete"}) == (
+        b'{"delete":{"_id":1}}\n'
+    )
+
+
+def test_send_bulk_body(mocked_es):
+    """send_bulk_body should return failed items except missing deletions"""
+    failed = {"index": {"_id": 2, "status": 400, "error": "bad"}}
+    mocked_es.conn.bulk.return_value = {
+        "errors": True,
+        "items": [
+            {"index": {"_id": 1, "status": 201}},
+            failed,
+            {"delete": {"_id": 3, "status": 404, "result": "not_found"}},
+        ],
+    }
+    assert send_bulk_body(mocked_es.conn, b"body", "a", routing=1) == [failed]
+    mocked_es.conn.bulk.assert_called_once_with(body=b"body", index="a", routing=1)
+
+
 @pytest.mark.parametrize("delete_reindexing_tags", [True, False])
 def test_delete_orphaned_indexes(mocker, mocked_es, delete_reindexing_tags):
     """
@@ -589,7 +765,7 @@ def test_index_content_files_serialization(mocker, index_types):
     ("indexing_chunk_size", "document_indexing_chunk_size"),
     [[2, 3], [3, 2]],  # noqa: PT007
 )
-@pytest.mark.parametrize("errors", [[], ["error"]])
+@pytest.mark.parametrize("errors", [[], [{"index": {"status": 400}}]])
 def test_bulk_index_content_files(  # noqa: PLR0913
     mocked_es,
     mocker,
@@ -618,9 +794,9 @@ def test_bulk_index_content_files(  # noqa: PLR0913
         return_value=["a", "b"],
     )
     bulk_mock = mocker.patch(
-        "learning_resources_search.indexing_api.bulk",
+        "learning_resources_search.indexing_api.send_bulk_body",
         autospec=True,
-        return_value=(0, errors),
+        return_value=errors,
     )
     mocker.patch(
         "learning_resources_search.indexing_api.serialize_content_file_for_bulk",
@@ -658,14 +834,13 @@ def test_bulk_index_content_files(  # noqa: PLR0913
             for chunk in chunks([doc for _ in content_files], chunk_size=chunk_size):
                 bulk_mock.assert_any_call(
                     mocked_es.conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                    encode_bulk_body(chunk),
+                    alias,
                     routing=course.learning_resource_id,
                 )
 
 
-@pytest.mark.parametrize("errors", [[], ["error"]])
+@pytest.mark.parametrize("errors", [[], [{"index": {"status": 400}}]])
 @pytest.mark.parametrize(
     ("indexing_func_name", "doc"),
     [
@@ -699,9 +874,9 @@ def test_index_content_files(  # noqa: PLR0913
         return_value=["a", "b"],
     )
     bulk_mock = mocker.patch(
-        "learning_resources_search.indexing_api.bulk",
+        "learning_resources_search.indexing_api.send_bulk_body",
         autospec=True,
-        return_value=(0, errors),
+        return_value=errors,
     )
     mocker.patch(
         "learning_resources_search.indexing_api.serialize_content_file_for_bulk",
@@ -738,9 +913,8 @@ def test_index_content_files(  # noqa: PLR0913
         for alias in mock_get_aliases.return_value:
             bulk_mock.assert_any_call(
                 mocked_es.conn,
-                [doc for _ in content_files],
-                index=alias,
-                chunk_size=6,
+                encode_bulk_body([doc for _ in content_files]),
+                alias,
                 routing=course.learning_resource_id,
             )
 
@@ -758,6 +932,73 @@ def test_deindex_run_content_files_no_files(mocker, has_files):
     assert mock_deindex_items.call_count == (1 if has_files else 0)
 
 
+@pytest.mark.parametrize("unpublished_only", [True, False])
+def test_deindex_runs_content_files(mocker, mocked_es, unpublished_only):
+    """deindex_runs_content_files should delete the files of all runs with one query per alias"""
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        return_value=["a", "b"],
+    )
+    runs = LearningResourceRunFactory.create_batch(2, published=True)
+    other_file = ContentFileFactory.create(published=True)
+    published_files = [
+        ContentFileFactory.create(run=run, published=True) for run in runs
+    ]
+    unpublished_files = [
+        ContentFileFactory.create(run=run, published=False) for run in runs
+    ]
+    deleted_files = (
+        unpublished_files if unpublished_only else published_files + unpublished_files
+    )
+    for content_file in [other_file, *published_files, *unpublished_files]:
+        DocumentFingerprint.objects.create(
+            index_name="a_backing",
+            object_type=COURSE_TYPE,
+            doc_id=f"cf_{content_file.id}",
+            fingerprint="fingerprint",
+        )
+
+    deindex_runs_content_files([run.id for run in runs], unpublished_only)
+
+    query_filter = [{"terms": {"run_id": [run.id for run in runs]}}]
+    if unpublished_only:
+        query_filter.append(
+            {
+                "ids": {
+                    "values": [
+                        f"cf_{content_file.id}" for content_file in deleted_files
+                    ]
+                }
+            }
+        )
+    assert mocked_es.conn.delete_by_query.call_count == 2
+    for alias in ["a", "b"]:
+        mocked_es.conn.delete_by_query.assert_any_call(
+            index=alias,
+            conflicts="proceed",
+            body={"query": {"bool": {"filter": query_filter}}},
+        )
+    deleted_ids = {content_file.id for content_file in deleted_files}
+    assert set(ContentFile.objects.values_list("id", flat=True)) == {
+        content_file.id
+        for content_file in [other_file, *published_files, *unpublished_files]
+        if content_file.id not in deleted_ids
+    }
+    assert set(DocumentFingerprint.objects.values_list("doc_id", flat=True)) == {
+        f"cf_{content_file_id}"
+        for content_file_id in ContentFile.objects.values_list("id", flat=True)
+    }
+
+
+def test_deindex_runs_content_files_no_files(mocked_es):
+    """deindex_runs_content_files shouldn't do anything if there are no content files"""
+    run = LearningResourceRunFactory.create(published=True)
+    ContentFileFactory.create(run=run, published=True)
+    deindex_runs_content_files([run.id], unpublished_only=True)
+    mocked_es.conn.delete_by_query.assert_not_called()
+    assert ContentFile.objects.count() == 1
+
+
 def test_percolate_query_format():
     """Test utility function to remove related queries from percolate"""
     percolate_query = {
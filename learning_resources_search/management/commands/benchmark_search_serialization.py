@@ -0,0 +1,85 @@
+"""Management command to time building search documents for learning resources"""
+
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from learning_resources.models import LearningResource
+from learning_resources.serializers import LearningResourceSerializer
+from learning_resources_search.serializers import project_learning_resource
+
+
+class Command(BaseCommand):
+    """
+    Times project_learning_resource against LearningResourceSerializer for the
+    same learning resources. Nothing is asserted, the timings are only reported.
+    """
+
+    help = "Time building search documents for learning resources"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            dest="count",
+            type=int,
+            default=1000,
+            help="The number of published learning resources to serialize",
+        )
+        parser.add_argument(
+            "--repeat",
+            dest="repeat",
+            type=int,
+            default=3,
+            help="The number of times to serialize the resources, the best run is kept",
+        )
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        resources = list(
+            LearningResource.objects.filter(published=True)
+            .for_search_serialization()
+            .order_by("id")[: options["count"]]
+        )
+        if not resources:
+            msg = "There are no published learning resources to serialize"
+            raise CommandError(msg)
+        self.stdout.write(
+            f"Serializing {len(resources)} learning resources, "
+            f"best of {options['repeat']} runs"
+        )
+
+        # Build the compiled serializers outside of the timed runs
+        project_learning_resource(resources[0])
+
+        timings = {
+            "LearningResourceSerializer": self.time(
+                lambda resource: LearningResourceSerializer(resource).data,
+                resources,
+                options["repeat"],
+            ),
+            "project_learning_resource": self.time(
+                project_learning_resource, resources, options["repeat"]
+            ),
+        }
+        for name, seconds in timings.items():
+            self.stdout.write(
+                f"{name}: {seconds:.3f} seconds, "
+                f"{len(resources) / seconds:.0f} resources/second"
+            )
+        speedup = (
+            timings["LearningResourceSerializer"] / timings["project_learning_resource"]
+        )
+        self.stdout.write(
+            f"project_learning_resource was {speedup:.1f}x as fast as "
+            "LearningResourceSerializer"
+        )
+
+    def time(self, serialize, resources, repeat):
+        """Return the fastest time in seconds to serialize all the resources"""
+        timings = []
+        for _ in range(max(repeat, 1)):
+            start = perf_counter()
+            for resource in resources:
+                serialize(resource)
+            timings.append(perf_counter() - start)
+        return min(timings)
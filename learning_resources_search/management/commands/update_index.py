@@ -41,13 +41,25 @@ class Command(BaseCommand):
             help="Filter courses and course files update by etl_source.",
         )
 
+        parser.add_argument(
+            "--changed_only",
+            dest="changed_only",
+            action="store_true",
+            help=(
+                "Only update objects changed since the last successful update "
+                "of each index."
+            ),
+        )
+
         super().add_arguments(parser)
 
     def handle(self, **options):
         """Index the comments and posts for the channels the user is subscribed to"""
 
         if options["all"]:
-            task = start_update_index.delay(valid_object_types, options["etl_source"])
+            task = start_update_index.delay(
+                valid_object_types, options["etl_source"], options["changed_only"]
+            )
             self.stdout.write(
                 f"Started celery task {task} to update index content for all indexes"
             )
@@ -72,7 +84,9 @@ class Command(BaseCommand):
                     self.stdout.write(f"  --{object_type}s")
                 return
 
-            task = start_update_index.delay(indexes_to_update, options["etl_source"])
+            task = start_update_index.delay(
+                indexes_to_update, options["etl_source"], options["changed_only"]
+            )
             self.stdout.write(
                 "".join(
                     [
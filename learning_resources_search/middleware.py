@@ -0,0 +1,18 @@
+"""Middleware for learning_resources_search"""
+
+from learning_resources_search.plugins import deferred_index_updates
+
+
+class DeferredIndexUpdatesMiddleware:
+    """
+    Defer the search index updates made while handling a request until the
+    response is ready, so that updates to the same objects are merged and made
+    in bulk
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with deferred_index_updates():
+            return self.get_response(request)
@@ -0,0 +1,24 @@
+"""Tests for learning_resources_search middleware"""
+
+from django.http import HttpResponse
+
+from learning_resources_search.middleware import DeferredIndexUpdatesMiddleware
+from learning_resources_search.plugins import get_deferred_index_updates
+
+
+def test_deferred_index_updates_middleware(mocker, rf):
+    """Index updates made while handling a request should be deferred until the response"""
+    flush_mock = mocker.patch(
+        "learning_resources_search.plugins.DeferredIndexUpdates.flush"
+    )
+    response = HttpResponse()
+
+    def get_response(request):
+        assert get_deferred_index_updates() is not None
+        flush_mock.assert_not_called()
+        return response
+
+    middleware = DeferredIndexUpdatesMiddleware(get_response)
+    assert middleware(rf.get("/")) is response
+    assert get_deferred_index_updates() is None
+    flush_mock.assert_called_once_with()
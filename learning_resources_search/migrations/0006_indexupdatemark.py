@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-18 02:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_resources_search", "0005_percolatequery_display_label"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IndexUpdateMark",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("object_type", models.CharField(max_length=128)),
+                ("etl_source", models.CharField(blank=True, default="", max_length=64)),
+                ("synced_on", models.DateTimeField()),
+            ],
+            options={
+                "unique_together": {("object_type", "etl_source")},
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.16 on 2026-10-18 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_resources_search", "0006_indexupdatemark"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentFingerprint",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                ("index_name", models.CharField(max_length=255)),
+                ("object_type", models.CharField(max_length=128)),
+                ("doc_id", models.CharField(max_length=255)),
+                ("fingerprint", models.CharField(max_length=32)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["object_type", "doc_id"],
+                        name="learning_re_object__867daa_idx",
+                    )
+                ],
+                "unique_together": {("index_name", "doc_id")},
+            },
+        ),
+    ]
@@ -72,3 +72,39 @@ class PercolateQuery(TimestampedModel):
 
     class Meta:
         unique_together = (("source_type", "original_query"),)
+
+
+class IndexUpdateMark(TimestampedModel):
+    """
+    The time up to which an object type was last successfully updated in the
+    search index, optionally for a single ETL source
+    """
+
+    object_type = models.CharField(max_length=128)
+    etl_source = models.CharField(max_length=64, blank=True, default="")
+    synced_on = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.object_type} ({self.etl_source or 'all'}): {self.synced_on}"
+
+    class Meta:
+        unique_together = (("object_type", "etl_source"),)
+
+
+class DocumentFingerprint(TimestampedModel):
+    """
+    A hash of the bulk action last written for a document to a backing index,
+    used to skip writes that would not change the document
+    """
+
+    index_name = models.CharField(max_length=255)
+    object_type = models.CharField(max_length=128)
+    doc_id = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f"{self.index_name} {self.doc_id}: {self.fingerprint}"
+
+    class Meta:
+        unique_together = (("index_name", "doc_id"),)
+        indexes = [models.Index(fields=["object_type", "doc_id"])]
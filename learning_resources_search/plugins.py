@@ -1,21 +1,27 @@
 """Pluggy plugins for learning_resources_search"""
 
 import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 
 from celery import chain
 from django.apps import apps
 
 from learning_resources_search import tasks
-from learning_resources_search.api import get_similar_topics
+from learning_resources_search.api import get_similar_topics, get_similar_topics_bulk
 from learning_resources_search.constants import (
     COURSE_TYPE,
     PERCOLATE_INDEX_TYPE,
+    IndexestoUpdate,
 )
 from main import settings
 from main.utils import chunks
 
 log = logging.getLogger()
 
+_deferred = threading.local()
+
 
 def try_with_retry_as_task(function, *args):
     """
@@ -27,6 +33,143 @@ def try_with_retry_as_task(function, *args):
         function.delay(*args)
 
 
+class DeferredIndexUpdates:
+    """
+    Search index updates waiting to be made together. Updates for the same
+    object are merged, the last one wins.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.upserted = defaultdict(dict)
+        self.unpublished = defaultdict(dict)
+        self.percolate_queries = {}
+
+    def __len__(self):
+        return (
+            sum(len(ids) for ids in self.upserted.values())
+            + sum(len(ids) for ids in self.unpublished.values())
+            + len(self.percolate_queries)
+        )
+
+    def resource_upserted(self, resource_id, resource_type, percolate):
+        """Queue a resource to be indexed, and percolated if it is new"""
+        self.unpublished[resource_type].pop(resource_id, None)
+        upserted = self.upserted[resource_type]
+        upserted[resource_id] = upserted.get(resource_id, False) or percolate
+        self._flush_if_full()
+
+    def resource_unpublished(self, resource_id, resource_type):
+        """Queue a resource to be removed from the index"""
+        self.upserted[resource_type].pop(resource_id, None)
+        self.unpublished[resource_type][resource_id] = None
+        self._flush_if_full()
+
+    def resource_deleted(self, resource_id, resource_type):
+        """Forget a resource that has been removed from the index already"""
+        self.upserted[resource_type].pop(resource_id, None)
+        self.unpublished[resource_type].pop(resource_id, None)
+
+    def percolate_query_upserted(self, percolate_query_id):
+        """Queue a percolate query to be indexed"""
+        self.percolate_queries[percolate_query_id] = None
+        self._flush_if_full()
+
+    def percolate_query_deleted(self, percolate_query_id):
+        """Forget a percolate query that has been removed from the index already"""
+        self.percolate_queries.pop(percolate_query_id, None)
+
+    def _flush_if_full(self):
+        """Flush the updates once there are enough of them for a bulk request"""
+        if len(self) >= settings.OPENSEARCH_INDEXING_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Make the queued updates, with one bulk request per type and chunk"""
+        upserted, self.upserted = self.upserted, defaultdict(dict)
+        unpublished, self.unpublished = self.unpublished, defaultdict(dict)
+        percolate_queries, self.percolate_queries = self.percolate_queries, {}
+
+        plugin = SearchIndexPlugin()
+        for resource_type, percolate_by_id in upserted.items():
+            if percolate_by_id:
+                plugin.bulk_resources_upserted(
+                    list(percolate_by_id),
+                    resource_type,
+                    [
+                        resource_id
+                        for resource_id, percolate in percolate_by_id.items()
+                        if percolate
+                    ],
+                )
+        for resource_type, resource_ids in unpublished.items():
+            if resource_ids:
+                plugin.bulk_resources_unpublished(list(resource_ids), resource_type)
+        for ids in chunks(
+            list(percolate_queries),
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            try_with_retry_as_task(
+                tasks.bulk_index_percolate_queries,
+                ids,
+                IndexestoUpdate.all_indexes.value,
+            )
+
+
+def get_deferred_index_updates():
+    """Get the index updates deferred by the current thread, if any"""
+    return getattr(_deferred, "updates", None)
+
+
+def start_deferred_index_updates():
+    """
+    Start deferring the search index updates of resource and percolate query
+    hooks made by the current thread. Nested calls share the updates.
+
+    Returns:
+        DeferredIndexUpdates: the updates deferred by the current thread
+    """
+    updates = get_deferred_index_updates()
+    if updates is None:
+        updates = _deferred.updates = DeferredIndexUpdates()
+    updates.depth += 1
+    return updates
+
+
+def finish_deferred_index_updates(*, discard=False):
+    """
+    Stop deferring search index updates. Once the outermost call finishes the
+    updates are made together, or dropped if discard is True.
+
+    Args:
+        discard(bool): Drop the updates instead of making them
+    """
+    updates = get_deferred_index_updates()
+    if updates is None:
+        return
+    updates.depth -= 1
+    if updates.depth == 0:
+        _deferred.updates = None
+        if not discard:
+            updates.flush()
+
+
+@contextmanager
+def deferred_index_updates():
+    """
+    Defer the search index updates of resource and percolate query hooks until
+    the block exits, then make them together. The updates are dropped if the
+    block raises an exception.
+    """
+    updates = start_deferred_index_updates()
+    try:
+        yield updates
+    except BaseException:
+        finish_deferred_index_updates(discard=True)
+        raise
+    finish_deferred_index_updates()
+
+
 class SearchIndexPlugin:
     """Perform search index updates on learning resources"""
 
@@ -34,6 +177,9 @@ class SearchIndexPlugin:
 
     @hookimpl
     def percolate_query_delete(self, percolate_query):
+        updates = get_deferred_index_updates()
+        if updates is not None:
+            updates.percolate_query_deleted(percolate_query.id)
         try_with_retry_as_task(
             tasks.deindex_document,
             percolate_query.id,
@@ -48,6 +194,10 @@ class SearchIndexPlugin:
         Args:
             percolate_query(PercolateQuery): The Learning Resource that was upserted
         """
+        updates = get_deferred_index_updates()
+        if updates is not None:
+            updates.percolate_query_upserted(percolate_query.id)
+            return
         try_with_retry_as_task(tasks.upsert_percolate_query, percolate_query.id)
 
     @hookimpl
@@ -68,6 +218,11 @@ class SearchIndexPlugin:
         Args:
             resource(LearningResource): The Learning Resource that was upserted
         """
+        updates = get_deferred_index_updates()
+        if updates is not None:
+            updates.resource_upserted(resource.id, resource.resource_type, percolate)
+            return
+
         upsert_task = tasks.upsert_learning_resource
         if percolate:
             upsert_task = chain(
@@ -85,6 +240,14 @@ class SearchIndexPlugin:
         Args:
             resource(LearningResource): The Learning Resource that was removed
         """
+        updates = get_deferred_index_updates()
+        if updates is not None:
+            updates.resource_unpublished(resource.id, resource.resource_type)
+            return
+        self._deindex_resource(resource)
+
+    def _deindex_resource(self, resource):
+        """Remove a resource and its runs' content files from the search index"""
         try_with_retry_as_task(
             tasks.deindex_document,
             resource.id,
@@ -120,6 +283,61 @@ class SearchIndexPlugin:
         )
         return [{"name": topic_name} for topic_name in topic_names]
 
+    @hookimpl
+    def bulk_resource_similar_topics(self, resources) -> list[list[dict]]:
+        """
+        Get similar topics for multiple resources
+
+        Args:
+            resources(list of LearningResource): The Learning Resources to get
+                similar topics for
+
+        Returns:
+            list: The similar topics of each resource
+        """
+        topic_names = get_similar_topics_bulk(
+            [
+                {
+                    "title": resource.title,
+                    "description": resource.description,
+                    "full_description": resource.full_description,
+                }
+                for resource in resources
+            ],
+            settings.OPEN_VIDEO_MAX_TOPICS,
+            settings.OPEN_VIDEO_MIN_TERM_FREQ,
+            settings.OPEN_VIDEO_MIN_DOC_FREQ,
+        )
+        return [[{"name": name} for name in names] for names in topic_names]
+
+    @hookimpl
+    def bulk_resources_upserted(self, resource_ids, resource_type, percolate_ids):
+        """
+        Upsert multiple created/modified resources to the search index
+
+        Args:
+            resource_ids(list): The Learning Resource ids that were upserted
+            resource_type(str): The Learning Resource type that was upserted
+            percolate_ids(list): The ids of the new resources to percolate
+        """
+        percolate_ids = set(percolate_ids)
+        for ids in chunks(
+            resource_ids,
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            index_args = (ids, resource_type, IndexestoUpdate.all_indexes.value)
+            percolate_tasks = [
+                tasks.percolate_learning_resource.si(resource_id)
+                for resource_id in ids
+                if resource_id in percolate_ids
+            ]
+            if percolate_tasks:
+                chain(
+                    tasks.index_learning_resources.si(*index_args), *percolate_tasks
+                ).delay()
+            else:
+                try_with_retry_as_task(tasks.index_learning_resources, *index_args)
+
     @hookimpl
     def bulk_resources_unpublished(self, resource_ids, resource_type):
         """
@@ -144,7 +362,11 @@ class SearchIndexPlugin:
         """
         Remove a resource from the search index and then delete the object
         """
-        self.resource_unpublished(resource)
+        # The resource is about to be deleted, so this can't wait
+        updates = get_deferred_index_updates()
+        if updates is not None:
+            updates.resource_deleted(resource.id, resource.resource_type)
+        self._deindex_resource(resource)
 
     @hookimpl
     def resource_run_unpublished(self, run):
@@ -156,6 +378,20 @@ class SearchIndexPlugin:
         """
         try_with_retry_as_task(tasks.deindex_run_content_files, run.id, False)  # noqa: FBT003
 
+    @hookimpl
+    def bulk_resource_runs_unpublished(self, run_ids):
+        """
+        Remove multiple learning resource runs' content files from the search index
+
+        Args:
+            run_ids(list): The Learning Resource run ids that were unpublished
+        """
+        for ids in chunks(
+            run_ids,
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            try_with_retry_as_task(tasks.bulk_deindex_run_content_files, ids, False)  # noqa: FBT003
+
     @hookimpl
     def resource_run_delete(self, run):
         """
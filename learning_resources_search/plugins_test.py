@@ -9,8 +9,16 @@ from learning_resources.factories import (
     LearningResourceRunFactory,
 )
 from learning_resources.models import LearningResourceRun
-from learning_resources_search.constants import COURSE_TYPE, PROGRAM_TYPE
-from learning_resources_search.plugins import SearchIndexPlugin
+from learning_resources_search.constants import (
+    COURSE_TYPE,
+    PROGRAM_TYPE,
+    IndexestoUpdate,
+)
+from learning_resources_search.plugins import (
+    SearchIndexPlugin,
+    deferred_index_updates,
+    get_deferred_index_updates,
+)
 
 
 @pytest.fixture
@@ -111,6 +119,32 @@ def test_search_index_plugin_resource_run_delete(mock_search_index_helpers):
     assert LearningResourceRun.objects.filter(id=run_id).exists() is False
 
 
+def test_bulk_resource_similar_topics(mocker, settings):
+    """The plugin function should return expected topics for each resource"""
+    mock_similar_topics = mocker.patch(
+        "learning_resources_search.plugins.get_similar_topics_bulk",
+        return_value=[["topic1", "topic2"], []],
+    )
+    resources = LearningResourceFactory.build_batch(2)
+    assert SearchIndexPlugin().bulk_resource_similar_topics(resources) == [
+        [{"name": "topic1"}, {"name": "topic2"}],
+        [],
+    ]
+    mock_similar_topics.assert_called_once_with(
+        [
+            {
+                "title": resource.title,
+                "description": resource.description,
+                "full_description": resource.full_description,
+            }
+            for resource in resources
+        ],
+        settings.OPEN_VIDEO_MAX_TOPICS,
+        settings.OPEN_VIDEO_MIN_TERM_FREQ,
+        settings.OPEN_VIDEO_MIN_DOC_FREQ,
+    )
+
+
 @pytest.mark.django_db
 def test_resource_similar_topics(mocker, settings):
     """The plugin function should return expected topics for a resource"""
@@ -132,3 +166,174 @@ def test_resource_similar_topics(mocker, settings):
         settings.OPEN_VIDEO_MIN_TERM_FREQ,
         settings.OPEN_VIDEO_MIN_DOC_FREQ,
     )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("resource_type", [COURSE_TYPE, PROGRAM_TYPE])
+def test_search_index_plugin_bulk_resources_unpublished(mocker, resource_type):
+    """
+    The plugin function should deindex resources in chunks. Deindexing courses
+    removes their content files too, so runs are not deindexed separately.
+    """
+    mocker.patch(
+        "learning_resources_search.plugins.settings.OPENSEARCH_INDEXING_CHUNK_SIZE", 2
+    )
+    mock_deindex = mocker.patch(
+        "learning_resources_search.plugins.tasks.bulk_deindex_learning_resources"
+    )
+    mock_deindex_runs = mocker.patch(
+        "learning_resources_search.plugins.tasks.bulk_deindex_run_content_files"
+    )
+    resources = LearningResourceFactory.create_batch(3, resource_type=resource_type)
+    resource_ids = [resource.id for resource in resources]
+    SearchIndexPlugin().bulk_resources_unpublished(resource_ids, resource_type)
+    assert mock_deindex.call_count == 2
+    mock_deindex.assert_any_call(resource_ids[:2], resource_type)
+    mock_deindex.assert_any_call(resource_ids[2:], resource_type)
+    mock_deindex_runs.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_search_index_plugin_bulk_resource_runs_unpublished(mocker):
+    """The plugin function should deindex the runs' content files in chunks"""
+    mocker.patch(
+        "learning_resources_search.plugins.settings.OPENSEARCH_INDEXING_CHUNK_SIZE", 2
+    )
+    mock_deindex_runs = mocker.patch(
+        "learning_resources_search.plugins.tasks.bulk_deindex_run_content_files"
+    )
+    SearchIndexPlugin().bulk_resource_runs_unpublished([1, 2, 3])
+    assert mock_deindex_runs.call_count == 2
+    mock_deindex_runs.assert_any_call([1, 2], False)  # noqa: FBT003
+    mock_deindex_runs.assert_any_call([3], False)  # noqa: FBT003
+
+
+@pytest.mark.parametrize("percolate", [True, False])
+def test_search_index_plugin_bulk_resources_upserted(mocker, percolate):
+    """The plugin function should index resources in chunks and percolate new ones"""
+    mocker.patch(
+        "learning_resources_search.plugins.settings.OPENSEARCH_INDEXING_CHUNK_SIZE", 2
+    )
+    mock_index = mocker.patch(
+        "learning_resources_search.plugins.tasks.index_learning_resources"
+    )
+    mock_percolate = mocker.patch(
+        "learning_resources_search.plugins.tasks.percolate_learning_resource"
+    )
+    mock_chain = mocker.patch("learning_resources_search.plugins.chain")
+    SearchIndexPlugin().bulk_resources_upserted(
+        [1, 2, 3], COURSE_TYPE, [3] if percolate else []
+    )
+    if percolate:
+        mock_index.assert_called_once_with(
+            [1, 2], COURSE_TYPE, IndexestoUpdate.all_indexes.value
+        )
+        mock_index.si.assert_called_once_with(
+            [3], COURSE_TYPE, IndexestoUpdate.all_indexes.value
+        )
+        mock_percolate.si.assert_called_once_with(3)
+        mock_chain.assert_called_once_with(
+            mock_index.si.return_value, mock_percolate.si.return_value
+        )
+        mock_chain.return_value.delay.assert_called_once_with()
+    else:
+        assert mock_index.call_count == 2
+        mock_index.assert_any_call([3], COURSE_TYPE, IndexestoUpdate.all_indexes.value)
+        mock_chain.assert_not_called()
+
+
+@pytest.fixture
+def mock_bulk_index_updates(mocker):
+    """Mock the bulk search index updates made when deferred updates are flushed"""
+    return SimpleNamespace(
+        upserted=mocker.patch.object(SearchIndexPlugin, "bulk_resources_upserted"),
+        unpublished=mocker.patch.object(
+            SearchIndexPlugin, "bulk_resources_unpublished"
+        ),
+        percolate_queries=mocker.patch(
+            "learning_resources_search.plugins.tasks.bulk_index_percolate_queries"
+        ),
+    )
+
+
+def test_deferred_index_updates(mock_bulk_index_updates, mock_search_index_helpers):
+    """Deferred updates should be merged and made in bulk when the block exits"""
+    plugin = SearchIndexPlugin()
+    courses = [SimpleNamespace(id=i, resource_type=COURSE_TYPE) for i in range(4)]
+    program = SimpleNamespace(id=10, resource_type=PROGRAM_TYPE)
+    with deferred_index_updates():
+        with deferred_index_updates() as updates:
+            assert get_deferred_index_updates() is updates
+            plugin.resource_upserted(courses[0], percolate=True)
+            plugin.resource_upserted(courses[0], percolate=False)
+            plugin.resource_upserted(courses[1], percolate=False)
+            plugin.resource_unpublished(courses[1])
+            plugin.resource_unpublished(courses[2])
+            plugin.resource_upserted(courses[2], percolate=False)
+            plugin.resource_upserted(courses[3], percolate=False)
+            plugin.resource_unpublished(program)
+            plugin.resource_unpublished(program)
+            plugin.percolate_query_upserted(SimpleNamespace(id=5))
+            plugin.percolate_query_upserted(SimpleNamespace(id=5))
+        mock_bulk_index_updates.upserted.assert_not_called()
+    assert get_deferred_index_updates() is None
+
+    mock_search_index_helpers.mock_upsert_learning_resource.assert_not_called()
+    mock_search_index_helpers.mock_remove_learning_resource.assert_not_called()
+    mock_bulk_index_updates.upserted.assert_called_once_with(
+        [0, 2, 3], COURSE_TYPE, [0]
+    )
+    assert mock_bulk_index_updates.unpublished.call_count == 2
+    mock_bulk_index_updates.unpublished.assert_any_call([1], COURSE_TYPE)
+    mock_bulk_index_updates.unpublished.assert_any_call([10], PROGRAM_TYPE)
+    mock_bulk_index_updates.percolate_queries.assert_called_once_with(
+        [5], IndexestoUpdate.all_indexes.value
+    )
+
+
+def test_deferred_index_updates_flush_when_full(mocker, mock_bulk_index_updates):
+    """Deferred updates should be flushed once there are a chunk's worth of them"""
+    mocker.patch(
+        "learning_resources_search.plugins.settings.OPENSEARCH_INDEXING_CHUNK_SIZE", 2
+    )
+    plugin = SearchIndexPlugin()
+    with deferred_index_updates():
+        for resource_id in range(3):
+            plugin.resource_upserted(
+                SimpleNamespace(id=resource_id, resource_type=COURSE_TYPE),
+                percolate=False,
+            )
+        mock_bulk_index_updates.upserted.assert_called_once_with(
+            [0, 1], COURSE_TYPE, []
+        )
+    mock_bulk_index_updates.upserted.assert_called_with([2], COURSE_TYPE, [])
+
+
+def test_deferred_index_updates_exception(mock_bulk_index_updates):
+    """Deferred updates should be dropped if the block raises an exception"""
+    plugin = SearchIndexPlugin()
+    msg = "task failed"
+    with pytest.raises(ValueError, match=msg), deferred_index_updates():  # noqa: PT012
+        plugin.resource_upserted(
+            SimpleNamespace(id=1, resource_type=COURSE_TYPE), percolate=False
+        )
+        raise ValueError(msg)
+    assert get_deferred_index_updates() is None
+    mock_bulk_index_updates.upserted.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_deferred_index_updates_before_delete(
+    mock_bulk_index_updates, mock_search_index_helpers
+):
+    """Resources about to be deleted should be removed from the index right away"""
+    resource = LearningResourceFactory.create(is_program=True)
+    plugin = SearchIndexPlugin()
+    with deferred_index_updates():
+        plugin.resource_upserted(resource, percolate=False)
+        plugin.resource_before_delete(resource)
+        mock_search_index_helpers.mock_remove_learning_resource.assert_called_once_with(
+            resource.id, PROGRAM_TYPE
+        )
+    mock_bulk_index_updates.upserted.assert_not_called()
+    mock_bulk_index_updates.unpublished.assert_not_called()
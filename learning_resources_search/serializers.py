@@ -3,16 +3,16 @@
 import logging
 from collections import OrderedDict, defaultdict
 from datetime import UTC, datetime
+from functools import cache
 from random import random
 from typing import TypedDict
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db.models import Q
 from drf_spectacular.plumbing import build_choice_description_list
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from rest_framework.utils.urls import replace_query_param
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from learning_resources.constants import (
     DEPARTMENTS,
@@ -35,11 +35,17 @@ from learning_resources.models import (
 from learning_resources.serializers import (
     ContentFileSerializer,
     CourseNumberSerializer,
+    LearningResourceImageSerializer,
     LearningResourceSerializer,
+    LearningResourceTopicSerializer,
     MicroLearningPathRelationshipSerializer,
     MicroUserListRelationshipSerializer,
 )
-from learning_resources_search.api import gen_content_file_id
+from learning_resources_search.api import (
+    CURSOR_PAGINATION,
+    decode_search_cursor,
+    gen_content_file_id,
+)
 from learning_resources_search.constants import (
     CONTENT_FILE_TYPE,
     LEARNING_RESOURCE_SEARCH_SORTBY_OPTIONS,
@@ -48,6 +54,7 @@ from learning_resources_search.models import PercolateQuery
 from learning_resources_search.utils import remove_child_queries
 from main.serializers import (
     COMMON_IGNORED_FIELDS,
+    compile_serializer,
 )
 
 log = logging.getLogger()
@@ -61,6 +68,8 @@ OCW_SEMESTER_TO_MONTH_MAPPING = {
     None: 1,
 }
 
+EARLIEST_DATE = datetime.min.replace(tzinfo=UTC)
+
 
 class SearchCourseNumberSerializer(CourseNumberSerializer):
     """Serializer for CourseNumber, including extra fields for search"""
@@ -85,10 +94,12 @@ def get_resource_age_date(learning_resource_obj, resource_category):
         learning_resource_obj.resource_type == LearningResourceType.course.name
         and not learning_resource_obj.next_start_date
     ):
-        last_run = (
-            learning_resource_obj.runs.filter(Q(published=True))
-            .order_by("start_date")
-            .last()
+        # Filter and sort the runs in python so prefetched runs are used. Like the
+        # database, sort runs without a start date after the others.
+        last_run = max(
+            (run for run in learning_resource_obj.runs.all() if run.published),
+            key=lambda run: (run.start_date is None, run.start_date or EARLIEST_DATE),
+            default=None,
         )
 
         if last_run:
@@ -111,6 +122,55 @@ def get_resource_age_date(learning_resource_obj, resource_category):
     return resource_age_date
 
 
+@cache
+def get_learning_resource_projections():
+    """
+    Get the compiled LearningResourceSerializer for each resource type.
+    Compiled lazily because the serializer fields are built from the models.
+    """
+    represent_topic = compile_serializer(LearningResourceTopicSerializer())
+    represent_image = compile_serializer(LearningResourceImageSerializer())
+
+    def compile_resource_serializer(serializer):
+        get_image = serializer.fields["image"].to_representation
+        # The same data as the topics and image method fields, without building
+        # a serializer for every topic and image
+        return compile_serializer(
+            serializer,
+            field_overrides={
+                "topics": lambda instance: [
+                    represent_topic(topic) for topic in instance.topics.all()
+                ],
+                "image": lambda instance: represent_image(instance.image)
+                if instance.image
+                else get_image(instance),
+            },
+        )
+
+    return {
+        resource_type: compile_resource_serializer(serializer_cls())
+        for resource_type, serializer_cls in (
+            LearningResourceSerializer.serializer_cls_mapping.items()
+        )
+    }
+
+
+def project_learning_resource(learning_resource_obj: LearningResource) -> dict:
+    """
+    Return the same data as LearningResourceSerializer, without the overhead of
+    building the serializer and its fields for every resource
+
+    Args:
+        learning_resource_obj(LearningResource): The learning resource object
+
+    Returns:
+        dict: The serialized resource data
+    """
+    return get_learning_resource_projections()[learning_resource_obj.resource_type](
+        learning_resource_obj
+    )
+
+
 def serialize_learning_resource_for_update(
     learning_resource_obj: LearningResource,
 ) -> dict:
@@ -119,7 +179,8 @@ def serialize_learning_resource_for_update(
 
     Args:
         learning_resource_obj(LearningResource): The learning resource object.
-        Must have a in_featured_lists annotated property
+        Must have the in_featured_lists, featured_position and
+        recent_views_count annotated properties from for_search_serialization
 
     Returns:
         dict: The serialized and transformed resource data
@@ -128,7 +189,7 @@ def serialize_learning_resource_for_update(
     STALENESS_CUTOFF = 2010
     COMPLETENESS_CUTOFF = 0.5
 
-    serialized_data = LearningResourceSerializer(instance=learning_resource_obj).data
+    serialized_data = project_learning_resource(learning_resource_obj)
 
     if learning_resource_obj.resource_type == LearningResourceType.course.name:
         serialized_data["course"]["course_numbers"] = [
@@ -137,15 +198,7 @@ def serialize_learning_resource_for_update(
         ]
 
     if learning_resource_obj.in_featured_lists > 0:
-        featured_rank = (
-            LearningResourceRelationship.objects.filter(
-                child_id=learning_resource_obj.id, parent__channel__isnull=False
-            )
-            .order_by("position")
-            .first()
-            .position
-            + random()  # noqa: S311
-        )
+        featured_rank = learning_resource_obj.featured_position + random()  # noqa: S311
     else:
         featured_rank = None
 
@@ -165,6 +218,7 @@ def serialize_learning_resource_for_update(
         "resource_age_date": resource_age_date,
         "featured_rank": featured_rank,
         "is_incomplete_or_stale": is_incomplete_or_stale,
+        "recent_views_count": learning_resource_obj.recent_views_count,
         **serialized_data,
     }
 
@@ -263,6 +317,19 @@ class SearchRequestSerializer(serializers.Serializer):
     limit = serializers.IntegerField(
         required=False, help_text="Number of results to return per page"
     )
+    pagination = serializers.ChoiceField(
+        required=False,
+        choices=["offset", CURSOR_PAGINATION],
+        help_text=(
+            "How to page through the results. Cursor pagination ignores offset and"
+            " returns the next page in the next url, which is cheaper for deep pages"
+        ),
+    )
+    cursor = serializers.CharField(
+        required=False,
+        help_text="The cursor of the page to return, from the next url of a search"
+        " using cursor pagination",
+    )
     offered_by_choices = [(e.name.lower(), e.value) for e in OfferedBy]
     offered_by = serializers.ListField(
         required=False,
@@ -305,6 +372,14 @@ class SearchRequestSerializer(serializers.Serializer):
             raise ValidationError(error_message)
         return attrs
 
+    def validate_cursor(self, value):
+        """Validate that the cursor is a token from a next url"""
+        try:
+            decode_search_cursor(value)
+        except ValueError as ex:
+            raise serializers.ValidationError(str(ex)) from ex
+        return value
+
 
 class LearningResourcesSearchRequestSerializer(SearchRequestSerializer):
     id = serializers.ListField(
@@ -594,6 +669,14 @@ class SearchResponseSerializer(serializers.Serializer):
     def construct_pagination_url(self, instance, request, link_type="next"):
         if request:
             url = request.build_absolute_uri()
+            if instance.get("pagination") == CURSOR_PAGINATION:
+                next_cursor = instance.get("next_cursor")
+                if link_type == "next" and next_cursor:
+                    return replace_query_param(url, "cursor", next_cursor)
+                return None
+            # Cursor searches fall back to offset pagination if no point in time
+            # could be opened
+            url = remove_query_param(url, "pagination")
             total_record_count = self.get_count(instance)
             offset = int(request.query_params.get("offset", 0))
             limit = int(
@@ -757,7 +840,9 @@ def serialize_content_file_for_update(content_file_obj):
 
 def serialize_bulk_learning_resources(ids):
     """
-    Serialize learning resource for bulk indexing
+    Serialize learning resource for bulk indexing. Everything the documents need
+    is prefetched or annotated, so the number of queries does not grow with the
+    number of ids.
 
     Args:
         ids(list of int): List of learning_resource id's
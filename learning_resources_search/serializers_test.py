@@ -38,7 +38,7 @@ from learning_resources.serializers import (
     MicroUserListRelationshipSerializer,
 )
 from learning_resources_search import serializers
-from learning_resources_search.api import gen_content_file_id
+from learning_resources_search.api import encode_search_cursor, gen_content_file_id
 from learning_resources_search.factories import PercolateQueryFactory
 from learning_resources_search.serializers import (
     ContentFileSearchRequestSerializer,
@@ -616,6 +616,7 @@ def test_serialize_bulk_learning_resources(mocker):
             "is_learning_material": mocker.ANY,
             "featured_rank": None,
             "is_incomplete_or_stale": mocker.ANY,
+            "recent_views_count": 0,
             **LearningResourceSerializer(instance=resource).data,
         }
 
@@ -630,6 +631,80 @@ def test_serialize_bulk_learning_resources(mocker):
         assert result == exp
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("resource_type", LearningResourceType.names())
+def test_project_learning_resource(resource_type):
+    """
+    project_learning_resource should return byte-identical data to
+    LearningResourceSerializer
+    """
+    factories.LearningResourceFactory.create_batch(3, **{f"is_{resource_type}": True})
+    factories.LearningResourceFactory.create(
+        **{f"is_{resource_type}": True},
+        image=None,
+        runs=[],
+        topics=[],
+        departments=[],
+        offered_by=None,
+        platform=None,
+        professional=False,
+    )
+    factories.CourseFactory.create(
+        course_numbers=[
+            {
+                "value": "6.0001",
+                "listing_type": CourseNumberType.primary.value,
+                "department": {"department_id": "6", "name": DEPARTMENTS["6"]},
+            }
+        ]
+    )
+    path = LearningPathFactory.create().learning_resource
+    path.image = None
+    path.save()
+
+    renderer = JSONRenderer()
+    for resource in LearningResource.objects.for_serialization():
+        assert renderer.render(
+            serializers.project_learning_resource(resource)
+        ) == renderer.render(LearningResourceSerializer(resource).data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("batch_size", [1, 5])
+def test_serialize_bulk_learning_resources_query_count(
+    django_assert_num_queries, batch_size
+):
+    """
+    serialize_bulk_learning_resources should make the same number of queries
+    however many resources are serialized
+    """
+    for resource_type in LearningResourceType.names():
+        factories.LearningResourceFactory.create_batch(
+            batch_size, **{f"is_{resource_type}": True}
+        )
+    featured_path = LearningPathFactory.create(resources=[]).learning_resource
+    featured_path.resources.add(
+        *LearningResource.objects.exclude(id=featured_path.id),
+        through_defaults={
+            "relation_type": LearningResourceRelationTypes.LEARNING_PATH_ITEMS,
+            "position": 1,
+        },
+    )
+    channel = ChannelUnitDetailFactory.create().channel
+    channel.featured_list = featured_path
+    channel.save()
+    ids = list(LearningResource.objects.values_list("id", flat=True))
+
+    # list() forces an eval here, which we need for django_assert_num_queries()
+    with django_assert_num_queries(15):
+        results = list(serializers.serialize_bulk_learning_resources(ids))
+
+    assert len(results) == len(ids)
+    assert {
+        result["id"] for result in results if result["featured_rank"] is not None
+    } == set(ids) - {featured_path.id}
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "resource_type",
@@ -713,11 +788,32 @@ def test_serialize_learning_resource_for_bulk(  # noqa: PLR0913
         "resource_age_date": resource_age_date,
         "featured_rank": 3.4 if has_featured_rank else None,
         "is_incomplete_or_stale": is_incomplete or is_stale,
+        "recent_views_count": 0,
         **free_dict,
         **LearningResourceSerializer(resource).data,
     }
 
 
+@pytest.mark.django_db
+def test_serialize_learning_resource_for_bulk_recent_views(settings):
+    """Search documents should count the views in the last SEARCH_RECENT_VIEWS_DAYS"""
+    settings.SEARCH_RECENT_VIEWS_DAYS = 7
+    resource = factories.LearningResourceFactory.create()
+    for days_ago in (0, 1, 10):
+        factories.LearningResourceViewEventFactory.create(
+            learning_resource=resource,
+            event_date=datetime.now(tz=UTC) - timedelta(days=days_ago),
+        )
+    resource = (
+        LearningResource.objects.for_serialization()
+        .for_search_serialization()
+        .get(pk=resource.pk)
+    )
+    serialized = serializers.serialize_learning_resource_for_bulk(resource)
+    assert serialized["recent_views_count"] == 2
+    assert serialized["views"] == 3
+
+
 @pytest.mark.django_db
 def test_get_resource_age_date():
     ocw_offeror = factories.LearningResourceOfferorFactory.create(is_ocw=True)
@@ -838,6 +934,7 @@ def test_serialize_course_numbers_for_bulk(
         "resource_age_date": datetime(2024, 1, 1, 1, 1, 1, 0, tzinfo=UTC),
         "featured_rank": None,
         "is_incomplete_or_stale": False,
+        "recent_views_count": 0,
         **LearningResourceSerializer(resource).data,
     }
     expected_data["course"]["course_numbers"][0] = {
@@ -1022,6 +1119,69 @@ def test_learning_resources_search_request_serializer_invalid(parameter, value):
     ]
 
 
+def test_search_request_serializer_cursor():
+    """The cursor parameter should be a token from a next url"""
+    cursor = encode_search_cursor("pit", [1.5, 3])
+    serialized = LearningResourcesSearchRequestSerializer(
+        data={"pagination": "cursor", "cursor": cursor}
+    )
+    assert serialized.is_valid() is True
+    assert serialized.data["pagination"] == "cursor"
+    assert serialized.data["cursor"] == cursor
+
+    serialized = ContentFileSearchRequestSerializer(data={"cursor": "spaceship"})
+    assert serialized.is_valid() is False
+    assert serialized.errors["cursor"] == ["Invalid search cursor"]
+
+
+@pytest.mark.parametrize("next_cursor", ["abc", None])
+def test_search_response_serializer_cursor_pagination(
+    learning_resources_search_view, next_cursor
+):
+    """Searches using cursor pagination should have a next url with the next cursor"""
+    request = Request(
+        APIRequestFactory().get(
+            learning_resources_search_view.url,
+            {"pagination": "cursor", "limit": 2, "offset": 4},
+        )
+    )
+    serialized = LearningResourcesSearchResponseSerializer(
+        {
+            "hits": {"hits": [], "total": {"value": 10}},
+            "pagination": "cursor",
+            **({"next_cursor": next_cursor} if next_cursor else {}),
+        },
+        context={"request": request},
+    ).data
+    assert serialized["previous"] is None
+    if next_cursor:
+        assert serialized["next"] == (
+            f"http://testserver{learning_resources_search_view.url}"
+            "?cursor=abc&limit=2&offset=4&pagination=cursor"
+        )
+    else:
+        assert serialized["next"] is None
+
+
+def test_search_response_serializer_cursor_pagination_fallback(
+    learning_resources_search_view,
+):
+    """Cursor searches that fell back to offset pagination should link to offsets"""
+    request = Request(
+        APIRequestFactory().get(
+            learning_resources_search_view.url, {"pagination": "cursor", "limit": 2}
+        )
+    )
+    serialized = LearningResourcesSearchResponseSerializer(
+        {"hits": {"hits": [], "total": {"value": 10}}},
+        context={"request": request},
+    ).data
+    assert serialized["previous"] is None
+    assert serialized["next"] == (
+        f"http://testserver{learning_resources_search_view.url}?limit=2&offset=2"
+    )
+
+
 @pytest.mark.parametrize(
     ("raw_data", "response"),
     [
@@ -4,10 +4,16 @@ Receivers for OpenSearch indexing
 
 import logging
 
+from celery import states
+from celery.signals import task_postrun, task_prerun
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from learning_resources_search.models import PercolateQuery
+from learning_resources_search.plugins import (
+    finish_deferred_index_updates,
+    start_deferred_index_updates,
+)
 from learning_resources_search.utils import (
     percolate_query_removed_actions,
     percolate_query_saved_actions,
@@ -31,3 +37,24 @@ def percolate_query_saved(sender, instance, created, **kwargs):  # noqa: ARG001
     """
     percolate_query = PercolateQuery.objects.get(id=instance.id)
     percolate_query_saved_actions(percolate_query)
+
+
+@task_prerun.connect
+def defer_task_index_updates(task_id, task, **kwargs):  # noqa: ARG001
+    """
+    Defer the search index updates made by a celery task until it finishes, so
+    that updates to the same objects are merged and made in bulk
+    """
+    start_deferred_index_updates()
+    task.request.deferred_index_updates = True
+
+
+@task_postrun.connect
+def flush_task_index_updates(task_id, task, state=None, **kwargs):  # noqa: ARG001
+    """
+    Make the search index updates deferred while a celery task ran, unless the
+    task failed or is being retried
+    """
+    if getattr(task.request, "deferred_index_updates", False):
+        task.request.deferred_index_updates = False
+        finish_deferred_index_updates(discard=state != states.SUCCESS)
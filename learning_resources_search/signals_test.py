@@ -0,0 +1,41 @@
+"""Tests for learning_resources_search signals"""
+
+from types import SimpleNamespace
+
+import pytest
+from celery import states
+
+from learning_resources_search.plugins import get_deferred_index_updates
+from learning_resources_search.signals import (
+    defer_task_index_updates,
+    flush_task_index_updates,
+)
+
+
+def test_task_index_updates(mocker):
+    """Index updates made by a celery task should be deferred until it finishes"""
+    flush_mock = mocker.patch(
+        "learning_resources_search.plugins.DeferredIndexUpdates.flush"
+    )
+    task = SimpleNamespace(request=SimpleNamespace())
+    defer_task_index_updates(task_id="1", task=task)
+    assert get_deferred_index_updates() is not None
+    flush_mock.assert_not_called()
+    flush_task_index_updates(task_id="1", task=task, state=states.SUCCESS)
+    assert get_deferred_index_updates() is None
+    flush_mock.assert_called_once_with()
+    flush_task_index_updates(task_id="1", task=task, state=states.SUCCESS)
+    flush_mock.assert_called_once_with()
+
+
+@pytest.mark.parametrize("state", [states.FAILURE, states.RETRY])
+def test_task_index_updates_failed(mocker, state):
+    """Index updates made by a celery task should be dropped if it fails"""
+    flush_mock = mocker.patch(
+        "learning_resources_search.plugins.DeferredIndexUpdates.flush"
+    )
+    task = SimpleNamespace(request=SimpleNamespace())
+    defer_task_index_updates(task_id="1", task=task)
+    flush_task_index_updates(task_id="1", task=task, state=state)
+    assert get_deferred_index_updates() is None
+    flush_mock.assert_not_called()
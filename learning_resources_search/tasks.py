@@ -6,6 +6,7 @@ import logging
 from collections import OrderedDict
 from contextlib import contextmanager
 from itertools import groupby
+from operator import itemgetter
 from random import random
 from urllib.parse import urlencode
 
@@ -13,7 +14,7 @@ import celery
 from celery.exceptions import Ignore
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.template.defaultfilters import pluralize
 from opensearchpy.exceptions import NotFoundError, RequestError
 from requests.models import PreparedRequest
@@ -22,10 +23,10 @@ from learning_resources.constants import LearningResourceType
 from learning_resources.etl.constants import RESOURCE_FILE_ETL_SOURCES
 from learning_resources.models import (
     ContentFile,
-    Course,
     LearningResource,
     LearningResourceDepartment,
     LearningResourceOfferor,
+    LearningResourceRun,
 )
 from learning_resources.utils import load_course_blocklist
 from learning_resources.views import FeaturedViewSet
@@ -33,6 +34,7 @@ from learning_resources_search import indexing_api as api
 from learning_resources_search.api import (
     gen_content_file_id,
     percolate_matches_for_document,
+    percolate_matches_for_documents,
 )
 from learning_resources_search.constants import (
     CONTENT_FILE_TYPE,
@@ -48,7 +50,7 @@ from learning_resources_search.constants import (
     IndexestoUpdate,
 )
 from learning_resources_search.exceptions import ReindexError, RetryError
-from learning_resources_search.models import PercolateQuery
+from learning_resources_search.models import IndexUpdateMark, PercolateQuery
 from learning_resources_search.serializers import (
     serialize_bulk_percolators,
     serialize_content_file_for_update,
@@ -211,44 +213,61 @@ def _get_percolated_rows(resources, subscription_type):
     """
     Get percolated rows for a list of learning resources and subscription type
     """
+    resources = list(resources)
+    # percolate the new learning resources in batches to get matching queries
+    matches = percolate_matches_for_documents(resources)
+    queries = PercolateQuery.objects.filter(
+        id__in={query_id for query_ids in matches.values() for query_id in query_ids},
+        source_type=subscription_type,
+    ).in_bulk()
+    query_users = {}
+    for query_id, user_id in PercolateQuery.users.through.objects.filter(
+        percolatequery_id__in=queries
+    ).values_list("percolatequery_id", "user_id"):
+        query_users.setdefault(query_id, set()).add(user_id)
+
+    query_fields = {}
     rows = []
-    all_users = set()
-    # percolate each new learning resource to get matching queries
     for resource in resources:
-        percolated = percolate_matches_for_document(resource.id).filter(
-            source_type=subscription_type
+        query_ids = sorted(
+            query_id for query_id in matches.get(resource.id, []) if query_id in queries
         )
-        if percolated.count() > 0:
-            percolated_users = set(percolated.values_list("users", flat=True))
-            all_users.update(percolated_users)
-            query = percolated.first()
-            search_url = _infer_percolate_group_url(query)
-            req = PreparedRequest()
-            req.prepare_url(search_url, {"resource": resource.id})
-            resource_url = req.url
+        if not query_ids:
+            continue
+        percolated_users = set().union(
+            *(query_users.get(query_id, set()) for query_id in query_ids)
+        )
+        query = queries[query_ids[0]]
+        if query.id not in query_fields:
             source_channel = query.source_channel()
-            rows.extend(
-                [
-                    {
-                        "resource_url": resource_url,
-                        "resource_title": resource.title,
-                        "resource_image_url": resource.image.url
-                        if resource.image
-                        else "",
-                        "resource_type": LearningResourceType[
-                            resource.resource_type
-                        ].value,
-                        "user_id": user,
-                        "source_label": query.source_label(),
-                        "source_channel_type": source_channel.channel_type
-                        if source_channel
-                        else "saved_search",
-                        "group": _infer_percolate_group(query),
-                        "search_url": search_url,
-                    }
-                    for user in percolated_users
-                ]
-            )
+            query_fields[query.id] = {
+                "search_url": _infer_percolate_group_url(query),
+                "source_label": query.source_label(),
+                "source_channel_type": source_channel.channel_type
+                if source_channel
+                else "saved_search",
+                "group": _infer_percolate_group(query),
+            }
+        fields = query_fields[query.id]
+        req = PreparedRequest()
+        req.prepare_url(fields["search_url"], {"resource": resource.id})
+        resource_url = req.url
+        rows.extend(
+            [
+                {
+                    "resource_url": resource_url,
+                    "resource_title": resource.title,
+                    "resource_image_url": resource.image.url if resource.image else "",
+                    "resource_type": LearningResourceType[resource.resource_type].value,
+                    "user_id": user,
+                    "source_label": fields["source_label"],
+                    "source_channel_type": fields["source_channel_type"],
+                    "group": fields["group"],
+                    "search_url": fields["search_url"],
+                }
+                for user in percolated_users
+            ]
+        )
 
     return rows
 
@@ -265,7 +284,7 @@ def send_subscription_emails(self, subscription_type, period="daily"):
     since = now_in_utc() - delta
     new_learning_resources = LearningResource.objects.filter(
         published=True, created_on__gt=since
-    )
+    ).select_related("image")
     rows = _get_percolated_rows(new_learning_resources, subscription_type)
     template_data = _group_percolated_rows(rows)
     email_tasks = celery.group(
@@ -520,6 +539,27 @@ def deindex_run_content_files(run_id, unpublished_only):
         return error
 
 
+@app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
+def bulk_deindex_run_content_files(run_ids, unpublished_only):
+    """
+    Deindex content files for multiple LearningResourceRuns
+
+    Args:
+        run_ids(list of int): LearningResourceRun ids
+        unpublished_only(bool): Whether to only deindex unpublished content files
+
+    """
+    try:
+        with wrap_retry_exception(*SEARCH_CONN_EXCEPTIONS):
+            api.deindex_runs_content_files(run_ids, unpublished_only=unpublished_only)
+    except (RetryError, Ignore):
+        raise
+    except:  # noqa: E722
+        error = "bulk_deindex_run_content_files threw an error"
+        log.exception(error)
+        return error
+
+
 @contextmanager
 def wrap_retry_exception(*exception_classes):
     """
@@ -539,6 +579,259 @@ def wrap_retry_exception(*exception_classes):
         raise
 
 
+def _keyset_id_chunks(query, chunk_size, after=None):
+    """
+    Walk the ids of a queryset in chunks using keyset pagination, so that only
+    one chunk of ids is ever held in memory
+
+    Args:
+        query(QuerySet): The queryset to walk
+        chunk_size(int): The number of ids per chunk
+        after(int): Only ids greater than this are returned
+
+    Yields:
+        tuple of (list of int, int): A chunk of ids and the cursor after it
+    """
+    query = query.order_by("id")
+    while True:
+        page = query if after is None else query.filter(id__gt=after)
+        ids = list(page.values_list("id", flat=True)[:chunk_size])
+        if not ids:
+            return
+        after = ids[-1]
+        yield ids, after
+
+
+def _keyset_content_file_chunks(query, chunk_size, after=None):
+    """
+    Walk the ids of a content file queryset for all courses at once, ordered by
+    learning resource and id, using keyset pagination. Chunks never span more
+    than one learning resource.
+
+    Args:
+        query(QuerySet): The ContentFile queryset to walk
+        chunk_size(int): The maximum number of ids per chunk
+        after(list of int): Only rows after this (learning_resource_id, id) pair
+            are returned
+
+    Yields:
+        tuple of (int, list of int, list of int): The learning resource id, a chunk
+            of content file ids and the cursor after it
+    """
+    query = query.order_by("run__learning_resource_id", "id")
+    while True:
+        page = query
+        if after is not None:
+            page = query.filter(
+                Q(run__learning_resource_id__gt=after[0])
+                | Q(run__learning_resource_id=after[0], id__gt=after[1])
+            )
+        rows = list(page.values_list("run__learning_resource_id", "id")[:chunk_size])
+        if not rows:
+            return
+        groups = [
+            (learning_resource_id, [content_file_id for _, content_file_id in group])
+            for learning_resource_id, group in groupby(rows, key=itemgetter(0))
+        ]
+        # The files of the last learning resource in a full page may continue on
+        # the next page, so leave them for the next query
+        if len(rows) == chunk_size and len(groups) > 1:
+            groups = groups[:-1]
+        for learning_resource_id, ids in groups:
+            after = [learning_resource_id, ids[-1]]
+            yield learning_resource_id, ids, after
+
+
+def _changed_since(step):
+    """
+    Get the time after which changes should be indexed for a plan step
+
+    Returns:
+        datetime.datetime or None: The time, or None if every row should be included
+    """
+    changed_since = step.get("changed_since")
+    return datetime.datetime.fromisoformat(changed_since) if changed_since else None
+
+
+def _learning_resources_query(step):
+    """
+    Get the learning resources to index or deindex for a plan step
+    """
+    blocklisted_ids = step.get("blocklisted_ids") or []
+    changed_since = _changed_since(step)
+    query = LearningResource.objects.filter(resource_type=step["resource_type"])
+    if step["kind"] == "index_learning_resources":
+        query = query.filter(published=True).exclude(readable_id__in=blocklisted_ids)
+        if changed_since:
+            query = query.filter(
+                Q(updated_on__gt=changed_since)
+                | Exists(
+                    LearningResourceRun.objects.filter(
+                        learning_resource=OuterRef("pk"),
+                        updated_on__gt=changed_since,
+                    )
+                )
+            )
+    else:
+        unpublished = Q(published=False)
+        if changed_since:
+            unpublished &= Q(updated_on__gt=changed_since)
+        query = query.filter(unpublished | Q(readable_id__in=blocklisted_ids))
+    if step.get("etl_source"):
+        query = query.filter(etl_source=step["etl_source"])
+    return query
+
+
+def _content_files_query(step):
+    """
+    Get the content files of published courses to index or deindex for a plan step
+    """
+    query = ContentFile.objects.filter(
+        run__learning_resource__resource_type=COURSE_TYPE,
+        run__learning_resource__published=True,
+        run__learning_resource__etl_source__in=step["etl_sources"],
+    ).exclude(run__learning_resource__readable_id__in=step.get("blocklisted_ids") or [])
+    changed_since = _changed_since(step)
+    if changed_since:
+        query = query.filter(
+            Q(updated_on__gt=changed_since) | Q(run__updated_on__gt=changed_since)
+        )
+    if step["kind"] == "index_content_files":
+        return query.filter(published=True, run__published=True)
+    return query.filter(Q(published=False) | Q(run__published=False))
+
+
+def _plan_learning_resources(step):
+    """Yield index or deindex tasks for learning resources, with their cursors"""
+    for ids, after in _keyset_id_chunks(
+        _learning_resources_query(step),
+        settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        step.get("after"),
+    ):
+        if step["kind"] == "index_learning_resources":
+            task = index_learning_resources.si(
+                ids, step["resource_type"], index_types=step["index_types"]
+            )
+        else:
+            task = bulk_deindex_learning_resources.si(ids, step["resource_type"])
+        yield task, after
+
+
+def _plan_content_files(step):
+    """Yield index or deindex tasks for content files, with their cursors"""
+    for learning_resource_id, ids, after in _keyset_content_file_chunks(
+        _content_files_query(step),
+        settings.OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE,
+        step.get("after"),
+    ):
+        if step["kind"] == "index_content_files":
+            task = index_content_files.si(
+                ids, learning_resource_id, index_types=step["index_types"]
+            )
+        else:
+            task = deindex_content_files.si(ids, learning_resource_id)
+        yield task, after
+
+
+def _plan_percolators(step):
+    """Yield index or deindex tasks for percolators, with their cursors"""
+    query = PercolateQuery.objects.all()
+    changed_since = _changed_since(step)
+    if changed_since:
+        query = query.filter(updated_on__gt=changed_since)
+    for ids, after in _keyset_id_chunks(
+        query,
+        settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        step.get("after"),
+    ):
+        if step["kind"] == "index_percolators":
+            task = bulk_index_percolate_queries.si(ids, step["index_types"])
+        else:
+            task = bulk_deindex_percolators.si(ids)
+        yield task, after
+
+
+INDEX_PLAN_STEPS = {
+    "index_learning_resources": _plan_learning_resources,
+    "deindex_learning_resources": _plan_learning_resources,
+    "index_content_files": _plan_content_files,
+    "deindex_content_files": _plan_content_files,
+    "index_percolators": _plan_percolators,
+    "deindex_percolators": _plan_percolators,
+}
+
+
+def plan_index_wave(plan):
+    """
+    Plan the next wave of indexing tasks. Each step of the plan is a JSON
+    serializable dict with a cursor, so planning can resume where the previous
+    wave stopped without keeping all ids in memory.
+
+    Args:
+        plan(list of dict): The remaining plan steps
+
+    Returns:
+        tuple of (list of Signature, list of dict): The tasks for this wave and
+            the plan steps that remain after it
+    """
+    wave_size = settings.OPENSEARCH_INDEXING_WAVE_SIZE
+    wave = []
+    plan = list(plan)
+    while plan and len(wave) < wave_size:
+        step = plan[0]
+        for task, after in INDEX_PLAN_STEPS[step["kind"]](step):
+            wave.append(task)
+            step = {**step, "after": after}
+            if len(wave) >= wave_size:
+                plan[0] = step
+                break
+        else:
+            plan.pop(0)
+    return wave, plan
+
+
+def _replace_with_index_wave(task, wave, plan, finish, errors):
+    """
+    Replace a task with a wave of indexing tasks, followed by either a task to
+    plan the next wave or, if nothing is left to plan, the finish task.
+
+    Args:
+        task(celery.Task): The bound task to replace
+        wave(list of Signature): The tasks to run in this wave
+        plan(list of dict): The plan steps that remain after this wave
+        finish(celery.Signature): The task to run after all waves
+        errors(list of str): Errors from previous waves
+    """
+    next_task = (
+        continue_index_waves.s(plan, finish, errors) if plan or errors else finish
+    )
+    return task.replace(celery.chain(celery.group(wave), next_task))
+
+
+@app.task(bind=True)
+def continue_index_waves(self, results, plan, finish, errors):
+    """
+    Plan and dispatch the next wave of indexing tasks. Once the plan is finished,
+    the finish task is run with the errors from all waves.
+
+    Args:
+        results(list): Results of the previous wave of tasks
+        plan(list of dict): The remaining plan steps
+        finish(celery.Signature): The task to run after all waves
+        errors(list of str): Errors from previous waves
+    """
+    errors = [*errors, *merge_strings(results)]
+    try:
+        wave, plan = plan_index_wave(plan)
+    except:  # noqa: E722
+        error = "continue_index_waves threw an error"
+        log.exception(error)
+        wave, errors = [], [*errors, error]
+    if not wave:
+        return self.replace(celery.signature(finish).clone(args=(errors,)))
+    return _replace_with_index_wave(self, wave, plan, finish, errors)
+
+
 @app.task(bind=True)
 def start_recreate_index(self, indexes, remove_existing_reindexing_tags):
     """
@@ -567,86 +860,51 @@ def start_recreate_index(self, indexes, remove_existing_reindexing_tags):
         # Do the indexing on the temp index
         log.info("starting to index %s objects...", ", ".join(indexes))
 
-        index_tasks = []
+        index_types = IndexestoUpdate.reindexing_index.value
+        plan = []
 
         if PERCOLATE_INDEX_TYPE in indexes:
-            index_tasks = index_tasks + [
-                bulk_index_percolate_queries.si(
-                    percolate_ids, IndexestoUpdate.reindexing_index.value
-                )
-                for percolate_ids in chunks(
-                    PercolateQuery.objects.order_by("id").values_list("id", flat=True),
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                )
-            ]
+            plan.append({"kind": "index_percolators", "index_types": index_types})
 
         if COURSE_TYPE in indexes:
             blocklisted_ids = load_course_blocklist()
-            index_tasks = index_tasks + [
-                index_learning_resources.si(
-                    ids,
-                    COURSE_TYPE,
-                    index_types=IndexestoUpdate.reindexing_index.value,
-                )
-                for ids in chunks(
-                    Course.objects.filter(learning_resource__published=True)
-                    .exclude(learning_resource__readable_id=blocklisted_ids)
-                    .order_by("learning_resource_id")
-                    .values_list("learning_resource_id", flat=True),
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                )
-            ]
-
-            for course in (
-                Course.objects.filter(learning_resource__published=True)
-                .filter(learning_resource__etl_source__in=RESOURCE_FILE_ETL_SOURCES)
-                .exclude(learning_resource__readable_id=blocklisted_ids)
-                .order_by("learning_resource_id")
-            ):
-                index_tasks = index_tasks + [
-                    index_content_files.si(
-                        ids,
-                        course.learning_resource_id,
-                        index_types=IndexestoUpdate.reindexing_index.value,
-                    )
-                    for ids in chunks(
-                        ContentFile.objects.filter(
-                            run__learning_resource_id=course.learning_resource_id,
-                            published=True,
-                            run__published=True,
-                        )
-                        .order_by("id")
-                        .values_list("id", flat=True),
-                        chunk_size=settings.OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE,
-                    )
+            plan.extend(
+                [
+                    {
+                        "kind": "index_learning_resources",
+                        "resource_type": COURSE_TYPE,
+                        "index_types": index_types,
+                        "blocklisted_ids": blocklisted_ids,
+                    },
+                    {
+                        "kind": "index_content_files",
+                        "etl_sources": RESOURCE_FILE_ETL_SOURCES,
+                        "index_types": index_types,
+                        "blocklisted_ids": blocklisted_ids,
+                    },
                 ]
+            )
 
-        for resource_type in [
-            PROGRAM_TYPE,
-            PODCAST_TYPE,
-            PODCAST_EPISODE_TYPE,
-            LEARNING_PATH_TYPE,
-            VIDEO_TYPE,
-            VIDEO_PLAYLIST_TYPE,
-        ]:
-            if resource_type in indexes:
-                index_tasks = index_tasks + [
-                    index_learning_resources.si(
-                        ids,
-                        resource_type,
-                        index_types=IndexestoUpdate.reindexing_index.value,
-                    )
-                    for ids in chunks(
-                        LearningResource.objects.filter(
-                            published=True, resource_type=resource_type
-                        )
-                        .order_by("id")
-                        .values_list("id", flat=True),
-                        chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                    )
-                ]
+        plan.extend(
+            {
+                "kind": "index_learning_resources",
+                "resource_type": resource_type,
+                "index_types": index_types,
+            }
+            for resource_type in [
+                PROGRAM_TYPE,
+                PODCAST_TYPE,
+                PODCAST_EPISODE_TYPE,
+                LEARNING_PATH_TYPE,
+                VIDEO_TYPE,
+                VIDEO_PLAYLIST_TYPE,
+            ]
+            if resource_type in indexes
+        )
 
-        index_tasks = celery.group(index_tasks)
+        # Only the first wave of tasks is planned here so that indexing starts
+        # right away. The following waves are planned as the earlier ones finish.
+        wave, plan = plan_index_wave(plan)
     except:  # noqa: E722
         error = "start_recreate_index threw an error"
         log.exception(error)
@@ -654,40 +912,112 @@ def start_recreate_index(self, indexes, remove_existing_reindexing_tags):
 
     # Use self.replace so that code waiting on this task will also wait on the indexing
     #  and finish tasks
-    return self.replace(
-        celery.chain(index_tasks, finish_recreate_index.s(new_backing_indices))
+    return _replace_with_index_wave(
+        self, wave, plan, finish_recreate_index.s(new_backing_indices), []
     )
 
 
+def _update_mark_etl_source(object_type, etl_source):
+    """Only courses and their files are filtered by etl source during updates"""
+    if object_type in (COURSE_TYPE, CONTENT_FILE_TYPE):
+        return etl_source or ""
+    return ""
+
+
+def get_index_update_marks(indexes, etl_source):
+    """
+    Get the times up to which each object type was last successfully updated
+
+    Args:
+        indexes(list of str): The object types
+        etl_source(str): The ETL source filter, or None for all sources
+
+    Returns:
+        dict: The last update time (or None) keyed by object type
+    """
+    marks = dict.fromkeys(indexes)
+    # A mark for all sources also covers any single source
+    for mark in IndexUpdateMark.objects.filter(
+        object_type__in=indexes, etl_source__in=["", etl_source or ""]
+    ):
+        if mark.etl_source and mark.etl_source != _update_mark_etl_source(
+            mark.object_type, etl_source
+        ):
+            continue
+        current = marks[mark.object_type]
+        if current is None or mark.synced_on > current:
+            marks[mark.object_type] = mark.synced_on
+    return marks
+
+
 @app.task(autoretry_for=(RetryError,), retry_backoff=True, rate_limit="600/m")
-def finish_update_index(results):  # noqa: ARG001
+def finish_update_index(results, update_marks=None):
+    """
+    Clear the search cache after an index update and, if there were no errors,
+    record the time the update started for each object type
+
+    Args:
+        results(list): Results of the indexing tasks
+        update_marks(dict): The object types, etl source and start time to record
+    """
     clear_search_cache()
+    if not update_marks:
+        return
+    errors = merge_strings(results)
+    if errors:
+        log.error("Not recording index update marks because of errors: %s", errors)
+        return
+    for object_type in update_marks["object_types"]:
+        IndexUpdateMark.objects.update_or_create(
+            object_type=object_type,
+            etl_source=_update_mark_etl_source(object_type, update_marks["etl_source"]),
+            defaults={
+                "synced_on": datetime.datetime.fromisoformat(update_marks["synced_on"])
+            },
+        )
 
 
 @app.task(bind=True)
-def start_update_index(self, indexes, etl_source):
+def start_update_index(self, indexes, etl_source, changed_only=False):  # noqa: FBT002
     """
-    Wipe and recreate index and mapping, and index all items.
+    Upsert published items and deindex unpublished items. If changed_only is set,
+    only items that changed since the last successful update of their object
+    type are included.
     """
     try:
         log.info("starting to UPDATE index %s objects...", ", ".join(indexes))
+        started_on = now_in_utc()
+        changed_since = {
+            object_type: synced_on.isoformat() if synced_on else None
+            for object_type, synced_on in (
+                get_index_update_marks(indexes, etl_source)
+                if changed_only
+                else dict.fromkeys(indexes)
+            ).items()
+        }
 
-        index_tasks = []
+        plan = []
 
         if COURSE_TYPE in indexes or CONTENT_FILE_TYPE in indexes:
             blocklisted_ids = load_course_blocklist()
 
         if COURSE_TYPE in indexes:
-            index_tasks = index_tasks + get_update_courses_tasks(
-                blocklisted_ids, etl_source
+            plan.extend(
+                get_update_courses_steps(
+                    blocklisted_ids, etl_source, changed_since[COURSE_TYPE]
+                )
             )
 
         if CONTENT_FILE_TYPE in indexes:
-            index_tasks = index_tasks + get_update_resource_files_tasks(
-                blocklisted_ids, etl_source
+            plan.extend(
+                get_update_resource_files_steps(
+                    blocklisted_ids, etl_source, changed_since[CONTENT_FILE_TYPE]
+                )
             )
         if PERCOLATE_INDEX_TYPE in indexes:
-            index_tasks = index_tasks + get_update_percolator_tasks()
+            plan.extend(
+                get_update_percolator_steps(changed_since[PERCOLATE_INDEX_TYPE])
+            )
 
         for resource_type in [
             PROGRAM_TYPE,
@@ -698,174 +1028,121 @@ def start_update_index(self, indexes, etl_source):
             VIDEO_PLAYLIST_TYPE,
         ]:
             if resource_type in indexes:
-                index_tasks = index_tasks + get_update_learning_resource_tasks(
-                    resource_type
+                plan.extend(
+                    get_update_learning_resource_steps(
+                        resource_type, changed_since[resource_type]
+                    )
                 )
 
-        index_tasks = celery.group(index_tasks)
+        wave, plan = plan_index_wave(plan)
     except:  # noqa: E722
         error = "start_update_index threw an error"
         log.exception(error)
         return [error]
-    return self.replace(celery.chain(index_tasks, finish_update_index.s()))
+    update_marks = {
+        "object_types": indexes,
+        "etl_source": etl_source,
+        "synced_on": started_on.isoformat(),
+    }
+    return _replace_with_index_wave(
+        self, wave, plan, finish_update_index.s(update_marks=update_marks), []
+    )
 
 
-def get_update_resource_files_tasks(blocklisted_ids, etl_source):
+def get_update_resource_files_steps(blocklisted_ids, etl_source, changed_since=None):
     """
-    Get list of tasks to update course files.
-    This task upserts content files for courses that are published and delists content
+    Get the plan steps to update course files.
+    This upserts content files for courses that are published and delists content
     files that are not published but are part of a published course.
 
     Args:
         blocklisted_ids(list of int): List of course id's to exclude
         etl_source(str): ETL source filter for the task
+        changed_since(str): If set, only include files changed after this ISO time
     """
 
     if etl_source is None or etl_source in RESOURCE_FILE_ETL_SOURCES:
-        course_update_query = (
-            LearningResource.objects.filter(published=True, resource_type=COURSE_TYPE)
-            .exclude(readable_id__in=blocklisted_ids)
-            .order_by("id")
-        )
-
-        if etl_source:
-            course_update_query = course_update_query.filter(etl_source=etl_source)
-        else:
-            course_update_query = course_update_query.filter(
-                etl_source__in=RESOURCE_FILE_ETL_SOURCES
-            )
-
-        index_tasks = []
-
-        for learning_resource in course_update_query.order_by("id"):
-            index_tasks = index_tasks + [
-                index_content_files.si(
-                    ids,
-                    learning_resource.id,
-                    index_types=IndexestoUpdate.current_index.value,
-                )
-                for ids in chunks(
-                    ContentFile.objects.filter(
-                        run__learning_resource_id=learning_resource.id,
-                        published=True,
-                        run__published=True,
-                    )
-                    .order_by("id")
-                    .values_list("id", flat=True),
-                    chunk_size=settings.OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE,
-                )
-            ]
-
-            index_tasks = index_tasks + [
-                deindex_content_files.si(ids, learning_resource.id)
-                for ids in chunks(
-                    ContentFile.objects.filter(
-                        run__learning_resource_id=learning_resource.id
-                    )
-                    .filter(Q(published=False) | Q(run__published=False))
-                    .order_by("id")
-                    .values_list("id", flat=True),
-                    chunk_size=settings.OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE,
-                )
-            ]
-
-        return index_tasks
+        etl_sources = [etl_source] if etl_source else RESOURCE_FILE_ETL_SOURCES
+        return [
+            {
+                "kind": "index_content_files",
+                "etl_sources": etl_sources,
+                "index_types": IndexestoUpdate.current_index.value,
+                "blocklisted_ids": blocklisted_ids,
+                "changed_since": changed_since,
+            },
+            {
+                "kind": "deindex_content_files",
+                "etl_sources": etl_sources,
+                "blocklisted_ids": blocklisted_ids,
+                "changed_since": changed_since,
+            },
+        ]
     else:
         return []
 
 
-def get_update_courses_tasks(blocklisted_ids, etl_source):
+def get_update_courses_steps(blocklisted_ids, etl_source, changed_since=None):
     """
-    Get list of tasks to update courses
+    Get the plan steps to update courses
     Args:
         blocklisted_ids(list of int): List of course id's to exclude
         etl_source(str): Etl source filter for the task
+        changed_since(str): If set, only include courses changed after this ISO time
     """
-
-    course_update_query = (
-        LearningResource.objects.filter(published=True, resource_type=COURSE_TYPE)
-        .exclude(readable_id__in=blocklisted_ids)
-        .order_by("id")
-    )
-
-    course_deletion_query = (
-        LearningResource.objects.filter(resource_type=COURSE_TYPE)
-        .filter(Q(published=False) | Q(readable_id__in=blocklisted_ids))
-        .order_by("id")
-    )
-
-    if etl_source:
-        course_update_query = course_update_query.filter(etl_source=etl_source)
-        course_deletion_query = course_deletion_query.filter(etl_source=etl_source)
-
-    index_tasks = [
-        index_learning_resources.si(
-            ids, COURSE_TYPE, index_types=IndexestoUpdate.current_index.value
-        )
-        for ids in chunks(
-            course_update_query.values_list("id", flat=True),
-            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-        )
-    ]
-
-    return index_tasks + [
-        bulk_deindex_learning_resources.si(ids, COURSE_TYPE)
-        for ids in chunks(
-            course_deletion_query.values_list("id", flat=True),
-            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-        )
+    return [
+        {
+            "kind": "index_learning_resources",
+            "resource_type": COURSE_TYPE,
+            "index_types": IndexestoUpdate.current_index.value,
+            "blocklisted_ids": blocklisted_ids,
+            "etl_source": etl_source,
+            "changed_since": changed_since,
+        },
+        {
+            "kind": "deindex_learning_resources",
+            "resource_type": COURSE_TYPE,
+            "blocklisted_ids": blocklisted_ids,
+            "etl_source": etl_source,
+            "changed_since": changed_since,
+        },
     ]
 
 
-def get_update_percolator_tasks():
+def get_update_percolator_steps(changed_since=None):
     """
-    Get list of tasks to update percolators
+    Get the plan steps to update percolators. Deleted percolators are deindexed
+    by the percolate_query_delete hook, so only changed percolators are indexed
+    when changed_since is set.
     """
-    index_tasks = [
-        bulk_index_percolate_queries.si(
-            percolate_ids, index_types=IndexestoUpdate.current_index.value
-        )
-        for percolate_ids in chunks(
-            PercolateQuery.objects.order_by("id").values_list("id", flat=True),
-            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-        )
-    ]
-
-    return index_tasks + [
-        bulk_deindex_percolators.si(ids)
-        for ids in chunks(
-            PercolateQuery.objects.all().order_by("id").values_list("id", flat=True),
-            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-        )
+    steps = [
+        {
+            "kind": "index_percolators",
+            "index_types": IndexestoUpdate.current_index.value,
+            "changed_since": changed_since,
+        },
     ]
+    if changed_since:
+        return steps
+    return [*steps, {"kind": "deindex_percolators"}]
 
 
-def get_update_learning_resource_tasks(resource_type):
+def get_update_learning_resource_steps(resource_type, changed_since=None):
     """
-    Get list of tasks to update non-course learning resources
+    Get the plan steps to update non-course learning resources
     """
-    index_tasks = [
-        index_learning_resources.si(
-            ids, resource_type, index_types=IndexestoUpdate.current_index.value
-        )
-        for ids in chunks(
-            LearningResource.objects.filter(published=True, resource_type=resource_type)
-            .order_by("id")
-            .values_list("id", flat=True),
-            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-        )
-    ]
-
-    return index_tasks + [
-        bulk_deindex_learning_resources.si(ids, resource_type)
-        for ids in chunks(
-            LearningResource.objects.filter(
-                published=False, resource_type=resource_type
-            )
-            .order_by("id")
-            .values_list("id", flat=True),
-            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-        )
+    return [
+        {
+            "kind": "index_learning_resources",
+            "resource_type": resource_type,
+            "index_types": IndexestoUpdate.current_index.value,
+            "changed_since": changed_since,
+        },
+        {
+            "kind": "deindex_learning_resources",
+            "resource_type": resource_type,
+            "changed_since": changed_since,
+        },
     ]
 
 
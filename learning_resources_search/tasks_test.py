@@ -1,6 +1,7 @@
 """Search task tests"""
 
 from collections import OrderedDict
+from datetime import timedelta
 
 import pytest
 from celery.exceptions import Ignore, Retry
@@ -18,7 +19,11 @@ from learning_resources.factories import (
     LearningResourceOfferorFactory,
     ProgramFactory,
 )
-from learning_resources.models import LearningResource
+from learning_resources.models import (
+    ContentFile,
+    LearningResource,
+    LearningResourceRun,
+)
 from learning_resources.views import FeaturedViewSet
 from learning_resources_search.api import gen_content_file_id
 from learning_resources_search.constants import (
@@ -29,8 +34,11 @@ from learning_resources_search.constants import (
     IndexestoUpdate,
 )
 from learning_resources_search.exceptions import ReindexError, RetryError
-from learning_resources_search.factories import PercolateQueryFactory
-from learning_resources_search.models import PercolateQuery
+from learning_resources_search.factories import (
+    IndexUpdateMarkFactory,
+    PercolateQueryFactory,
+)
+from learning_resources_search.models import IndexUpdateMark, PercolateQuery
 from learning_resources_search.serializers import (
     serialize_content_file_for_update,
     serialize_learning_resource_for_update,
@@ -40,13 +48,20 @@ from learning_resources_search.tasks import (
     _get_percolated_rows,
     _group_percolated_rows,
     _infer_percolate_group,
+    _infer_percolate_group_url,
+    _keyset_content_file_chunks,
     bulk_deindex_learning_resources,
+    bulk_deindex_run_content_files,
+    continue_index_waves,
     deindex_document,
     deindex_run_content_files,
     finish_recreate_index,
+    finish_update_index,
+    get_index_update_marks,
     index_course_content_files,
     index_learning_resources,
     index_run_content_files,
+    plan_index_wave,
     send_subscription_emails,
     start_recreate_index,
     start_update_index,
@@ -57,6 +72,7 @@ from learning_resources_search.tasks import (
 )
 from main.factories import UserFactory
 from main.test_utils import assert_not_raises
+from main.utils import chunks, now_in_utc
 
 pytestmark = pytest.mark.django_db
 User = get_user_model()
@@ -350,6 +366,84 @@ def test_start_recreate_index_existing_reindexing_index(
         assert mocked_celery.replace.call_count == 0
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_keyset_content_file_chunks(chunk_size):
+    """Content file ids should be walked in chunks that never span two courses"""
+    courses = sorted(
+        CourseFactory.create_batch(3), key=lambda course: course.learning_resource_id
+    )
+    expected = []
+    for course in courses:
+        ids = [
+            content_file.id
+            for content_file in ContentFileFactory.create_batch(
+                4, run=course.learning_resource.runs.first()
+            )
+        ]
+        expected.extend(
+            (course.learning_resource_id, ids_chunk)
+            for ids_chunk in chunks(ids, chunk_size=chunk_size)
+        )
+    results = list(
+        _keyset_content_file_chunks(ContentFile.objects.all(), chunk_size=chunk_size)
+    )
+    assert [(lr_id, ids) for lr_id, ids, _ in results] == expected
+    assert results[-1][2] == [expected[-1][0], expected[-1][1][-1]]
+
+
+def test_plan_index_wave(settings):
+    """plan_index_wave should plan a bounded wave and resume from its cursor"""
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 2
+    settings.OPENSEARCH_INDEXING_WAVE_SIZE = 2
+    programs = sorted(
+        ProgramFactory.create_batch(5),
+        key=lambda program: program.learning_resource_id,
+    )
+    ids = [program.learning_resource_id for program in programs]
+    plan = [
+        {
+            "kind": "index_learning_resources",
+            "resource_type": PROGRAM_TYPE,
+            "index_types": IndexestoUpdate.current_index.value,
+        }
+    ]
+    wave, plan = plan_index_wave(plan)
+    assert [task.args for task in wave] == [
+        ([ids[0], ids[1]], PROGRAM_TYPE),
+        ([ids[2], ids[3]], PROGRAM_TYPE),
+    ]
+    assert plan[0]["after"] == ids[3]
+    wave, plan = plan_index_wave(plan)
+    assert [task.args for task in wave] == [([ids[4]], PROGRAM_TYPE)]
+    assert plan == []
+
+
+@pytest.mark.parametrize("has_plan", [True, False])
+def test_continue_index_waves(mocker, mocked_celery, has_plan):
+    """continue_index_waves should dispatch the next wave or the finish task"""
+    wave = [mocker.Mock()] if has_plan else []
+    plan_mock = mocker.patch(
+        "learning_resources_search.tasks.plan_index_wave",
+        return_value=(wave, []),
+    )
+    finish = finish_update_index.s()
+    with pytest.raises(mocked_celery.replace_exception_class):
+        continue_index_waves.delay(["error"], [{"kind": "x"}], finish, [])
+    plan_mock.assert_called_once_with([{"kind": "x"}])
+    replaced_with = mocked_celery.replace.call_args[0][1]
+    if has_plan:
+        mocked_celery.group.assert_called_once_with(wave)
+        assert replaced_with == mocked_celery.chain.return_value
+        next_plan, next_finish, errors = mocked_celery.chain.call_args[0][1].args
+        assert next_plan == []
+        assert next_finish["task"] == finish.task
+        assert errors == ["error"]
+    else:
+        assert mocked_celery.group.call_count == 0
+        assert replaced_with.task == finish.task
+        assert replaced_with.args == (["error"],)
+
+
 @pytest.mark.parametrize("with_error", [True, False])
 def test_finish_recreate_index(mocker, with_error):
     """
@@ -456,6 +550,22 @@ def test_bulk_deindex_learning_resources(mocker, with_error):
     indexing_api_deindex_mock.assert_called_once_with([1], COURSE_TYPE)
 
 
+@pytest.mark.usefixtures("_wrap_retry_mock")
+@pytest.mark.parametrize("with_error", [True, False])
+def test_bulk_deindex_run_content_files(mocker, with_error):
+    """bulk_deindex_run_content_files should deindex the content files of all runs at once"""
+    deindex_mock = mocker.patch(
+        "learning_resources_search.indexing_api.deindex_runs_content_files"
+    )
+    if with_error:
+        deindex_mock.side_effect = TabError
+    result = bulk_deindex_run_content_files.delay([1, 2], False).get()  # noqa: FBT003
+    assert result == (
+        "bulk_deindex_run_content_files threw an error" if with_error else None
+    )
+    deindex_mock.assert_called_once_with([1, 2], unpublished_only=False)
+
+
 @pytest.mark.parametrize(
     ("indexes", "etl_source"),
     [
@@ -641,6 +751,90 @@ def test_start_update_index(mocker, mocked_celery, indexes, etl_source, settings
     assert mocked_celery.replace.call_args[0][1] == mocked_celery.chain.return_value
 
 
+def test_start_update_index_changed_only(mocker, mocked_celery):
+    """start_update_index with changed_only should only index programs changed since the last update"""
+    synced_on = now_in_utc() - timedelta(days=1)
+    IndexUpdateMarkFactory.create(object_type=PROGRAM_TYPE, synced_on=synced_on)
+    old_program, new_program = ProgramFactory.create_batch(2)
+    old_resource = LearningResource.objects.filter(id=old_program.learning_resource_id)
+    old_resource.update(updated_on=synced_on - timedelta(days=1))
+    LearningResourceRun.objects.filter(learning_resource__in=old_resource).update(
+        updated_on=synced_on - timedelta(days=1)
+    )
+    index_learning_resources_mock = mocker.patch(
+        "learning_resources_search.tasks.index_learning_resources", autospec=True
+    )
+
+    with pytest.raises(mocked_celery.replace_exception_class):
+        start_update_index.delay([PROGRAM_TYPE], None, changed_only=True)
+
+    list(mocked_celery.group.call_args[0][0])
+    index_learning_resources_mock.si.assert_called_once_with(
+        [new_program.learning_resource_id],
+        PROGRAM_TYPE,
+        index_types=IndexestoUpdate.current_index.value,
+    )
+
+
+@pytest.mark.parametrize("etl_source", [None, ETLSource.ocw.value])
+def test_get_index_update_marks(etl_source):
+    """get_index_update_marks should use the latest mark that covers each object type"""
+    now = now_in_utc()
+    IndexUpdateMarkFactory.create(
+        object_type=COURSE_TYPE, synced_on=now - timedelta(days=2)
+    )
+    IndexUpdateMarkFactory.create(
+        object_type=COURSE_TYPE,
+        etl_source=ETLSource.ocw.value,
+        synced_on=now - timedelta(days=1),
+    )
+    IndexUpdateMarkFactory.create(
+        object_type=PROGRAM_TYPE,
+        etl_source=ETLSource.ocw.value,
+        synced_on=now - timedelta(days=1),
+    )
+    assert get_index_update_marks(
+        [COURSE_TYPE, PROGRAM_TYPE, CONTENT_FILE_TYPE], etl_source
+    ) == {
+        COURSE_TYPE: now - timedelta(days=1 if etl_source else 2),
+        PROGRAM_TYPE: None,
+        CONTENT_FILE_TYPE: None,
+    }
+
+
+@pytest.mark.parametrize("errors", [[], ["error"]])
+def test_finish_update_index_marks(mocker, errors):
+    """finish_update_index should record update marks only if there were no errors"""
+    mocker.patch("learning_resources_search.tasks.clear_search_cache")
+    synced_on = now_in_utc()
+    IndexUpdateMarkFactory.create(
+        object_type=COURSE_TYPE,
+        etl_source=ETLSource.ocw.value,
+        synced_on=synced_on - timedelta(days=1),
+    )
+    finish_update_index(
+        errors,
+        update_marks={
+            "object_types": [COURSE_TYPE, PROGRAM_TYPE],
+            "etl_source": ETLSource.ocw.value,
+            "synced_on": synced_on.isoformat(),
+        },
+    )
+    marks = {
+        (mark.object_type, mark.etl_source): mark.synced_on
+        for mark in IndexUpdateMark.objects.all()
+    }
+    if errors:
+        assert marks == {
+            (COURSE_TYPE, ETLSource.ocw.value): synced_on - timedelta(days=1)
+        }
+    else:
+        assert marks == {
+            (COURSE_TYPE, ETLSource.ocw.value): synced_on,
+            (PROGRAM_TYPE, ""): synced_on,
+        }
+
+
 def test_upsert_content_file_task(mocked_api):
     """Test that upsert_content_file will serialize the content file data and upsert it to the OS index"""
     course = CourseFactory.create(etl_source=ETLSource.ocw.value)
@@ -723,6 +917,18 @@ def test_delete_run_content_files(mocker, with_error, unpublished_only):
     )
 
 
+def batch_percolator(get_percolator):
+    """Wrap a per-resource percolate mock for percolate_matches_for_documents"""
+
+    def percolate(resources):
+        return {
+            resource.id: list(get_percolator(resource.id).values_list("id", flat=True))
+            for resource in resources
+        }
+
+    return percolate
+
+
 @pytest.mark.django_db
 def test_send_subscription_emails(mocked_api, mocker, mocked_celery):
     """
@@ -752,8 +958,8 @@ def test_send_subscription_emails(mocked_api, mocker, mocked_celery):
         queries.append(query)
         query_ids.append(query.id)
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -764,7 +970,7 @@ def test_send_subscription_emails(mocked_api, mocker, mocked_celery):
         user_documents[ptopic].append(LearningResource.objects.get(id=res))
         return PercolateQuery.objects.filter(id=query_id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = batch_percolator(get_percolator)
     with pytest.raises(mocked_celery.replace_exception_class):
         send_subscription_emails(PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE)
 
@@ -804,8 +1010,8 @@ def test_send_multiple_subscription_emails(mocked_api, mocker, mocked_celery):
         queries.append(query)
         query_ids.append(query.id)
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -816,7 +1022,7 @@ def test_send_multiple_subscription_emails(mocked_api, mocker, mocked_celery):
         user_documents[ptopic].append(LearningResource.objects.get(id=res))
         return PercolateQuery.objects.filter(id=query_id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = batch_percolator(get_percolator)
     with pytest.raises(mocked_celery.replace_exception_class):
         send_subscription_emails.apply((PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE,))
 
@@ -832,6 +1038,44 @@ def test_send_multiple_subscription_emails(mocked_api, mocker, mocked_celery):
     assert len([topic for topic in topics if topic in template_data]) > 0
 
 
+def test_get_percolated_rows_batched(mocked_api, mocker, django_assert_max_num_queries):
+    """
+    _get_percolated_rows should percolate all resources at once, merge the users of
+    every matching query and not query per resource
+    """
+    resources = LearningResourceFactory.create_batch(5, is_course=True)
+    users = UserFactory.create_batch(2)
+    queries = PercolateQueryFactory.create_batch(
+        2, source_type=PercolateQuery.SEARCH_SUBSCRIPTION_TYPE
+    )
+    for query, user in zip(queries, users):
+        query.users.set([user])
+    other_query = PercolateQueryFactory.create(
+        source_type=PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE
+    )
+    other_query.users.set([UserFactory.create()])
+    percolate_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
+        return_value={
+            resource.id: [query.id for query in [*queries, other_query]]
+            for resource in resources[:4]
+        },
+    )
+    resources = list(
+        LearningResource.objects.filter(
+            id__in=[resource.id for resource in resources]
+        ).select_related("image")
+    )
+    with django_assert_max_num_queries(8):
+        rows = _get_percolated_rows(resources, PercolateQuery.SEARCH_SUBSCRIPTION_TYPE)
+    percolate_mock.assert_called_once_with(resources)
+    assert len(rows) == 8
+    assert {row["user_id"] for row in rows} == {user.id for user in users}
+    assert {row["search_url"] for row in rows} == {
+        _infer_percolate_group_url(queries[0])
+    }
+
+
 def test_infer_percolate_group(mocked_api):
     """
     Test that the the email template groups can be inferred from queries
@@ -884,8 +1128,8 @@ def test_email_grouping_function(mocked_api, mocker):
         queries.append(query)
         query_ids.append(query.id)
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -896,7 +1140,7 @@ def test_email_grouping_function(mocked_api, mocker):
         user_documents[ptopic].append(LearningResource.objects.get(id=res))
         return PercolateQuery.objects.filter(id=query_id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = batch_percolator(get_percolator)
     rows = _get_percolated_rows(new_resources, PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE)
     template_data = _group_percolated_rows(rows)
     assert len(template_data) == len(topics)
@@ -923,8 +1167,8 @@ def test_digest_email_template(mocked_api, mocker, mocked_celery):
 
     user = UserFactory.create()
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -937,7 +1181,7 @@ def test_digest_email_template(mocked_api, mocker, mocked_celery):
         query_ids.append(query.id)
         return PercolateQuery.objects.filter(id=query.id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = batch_percolator(get_percolator)
     with pytest.raises(mocked_celery.replace_exception_class):
         send_subscription_emails.apply([PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE])
     task_args = mocked_celery.group.call_args[0][0][0]["args"][0][0]
@@ -1068,7 +1312,7 @@ def test_cache_is_cleared_after_update_index(mocker, settings):
         "learning_resources_search.tasks.index_learning_resources", autospec=True
     )
     mocker.patch(
-        "learning_resources_search.tasks.get_update_courses_tasks", autospec=True
+        "learning_resources_search.tasks.get_update_courses_steps", autospec=True
     )
     mocked_clear_search_cache = mocker.patch(
         "learning_resources_search.tasks.clear_search_cache"
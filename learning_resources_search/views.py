@@ -5,6 +5,7 @@ from itertools import chain
 
 from django.conf import settings
 from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
 from django.utils.decorators import method_decorator
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from opensearchpy.exceptions import TransportError
@@ -17,6 +18,7 @@ from rest_framework.views import APIView
 
 from authentication.decorators import blocked_ip_exempt
 from learning_resources_search.api import (
+    CURSOR_PAGINATION,
     adjust_original_query_for_percolate,
     execute_learn_search,
     subscribe_user_to_search_query,
@@ -81,13 +83,20 @@ class LearningResourcesSearchView(ESView):
             )
 
             if request_data.data.get("dev_mode"):
-                return Response(response)
+                response = Response(response)
             else:
                 response = LearningResourcesSearchResponseSerializer(
                     response, context={"request": request}
                 ).data
                 response["results"] = list(response["results"])
-                return Response(response)
+                response = Response(response)
+            if request_data.data.get(
+                "pagination"
+            ) == CURSOR_PAGINATION or request_data.data.get("cursor"):
+                # Cursors stop working once their point in time expires, so don't
+                # cache pages that hold them
+                patch_cache_control(response, private=True)
+            return response
         else:
             errors = {}
             for key, errors_obj in request_data.errors.items():
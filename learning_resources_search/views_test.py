@@ -418,3 +418,37 @@ def test_user_subscribtion_check(client, user):
     assert len(response) == 1
     assert response[0]["id"] == initial_query_id
     assert response[0]["original_query"] == initial_query
+
+
+@pytest.mark.parametrize("next_cursor", ["abc", None])
+def test_learn_resources_search_cursor_pagination(
+    mocker, client, learning_resources_search_view, next_cursor
+):
+    """Searches using cursor pagination should link to the next cursor and not be cached"""
+    mock_response = {**FAKE_SEARCH_RESPONSE, "pagination": "cursor"}
+    if next_cursor:
+        mock_response["next_cursor"] = next_cursor
+    mock_execute = mocker.patch(
+        "learning_resources_search.views.execute_learn_search",
+        autospec=True,
+        return_value=mock_response,
+    )
+    params = {"pagination": "cursor", "limit": 3}
+
+    resp = client.get(learning_resources_search_view.url, params)
+    assert resp.json()["next"] == (
+        f"http://testserver{learning_resources_search_view.url}"
+        f"?cursor={next_cursor}&limit=3&pagination=cursor"
+        if next_cursor
+        else None
+    )
+    assert resp.json()["previous"] is None
+    assert "private" in resp["Cache-Control"]
+    assert mock_execute.call_args[0][0]["pagination"] == "cursor"
+
+
+def test_learn_resources_search_invalid_cursor(client, learning_resources_search_view):
+    """An invalid cursor should be rejected"""
+    resp = client.get(learning_resources_search_view.url, {"cursor": "spaceship"})
+    assert resp.status_code == 400
+    assert resp.json() == {"cursor": ["Invalid search cursor"]}
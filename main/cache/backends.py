@@ -1,5 +1,11 @@
+import contextlib
+import os
+
 from django.core.cache import caches
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+
+_MISSING = object()
 
 
 class FallbackCache(BaseCache):
@@ -74,3 +80,42 @@ class FallbackCache(BaseCache):
                 timeout=timeout,
                 version=version,
             )
+
+
+class LRUFileBasedCache(FileBasedCache):
+    """
+    File based cache backend that evicts the least recently used entries
+
+    Reading an entry updates the modification time of its file, and culling
+    deletes the files that were modified longest ago instead of random ones.
+    """
+
+    def get(self, key, default=None, version=None):
+        """Get the value and mark the entry as recently used"""
+        value = super().get(key, default=_MISSING, version=version)
+        if value is _MISSING:
+            return default
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(self._key_to_file(key, version))
+        return value
+
+    def _cull(self):
+        """Delete the least recently used entries if there are too many"""
+        filelist = self._list_cache_files()
+        num_entries = len(filelist)
+        if num_entries < self._max_entries:
+            return None
+        if self._cull_frequency == 0:
+            return self.clear()
+
+        def last_used(fname):
+            try:
+                return os.path.getmtime(fname)  # noqa: PTH204
+            except FileNotFoundError:
+                return 0
+
+        for fname in sorted(filelist, key=last_used)[
+            : int(num_entries / self._cull_frequency)
+        ]:
+            self._delete(fname)
+        return None
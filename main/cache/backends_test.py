@@ -1,9 +1,10 @@
+import os
 from dataclasses import dataclass
 
 import pytest
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 
-from main.cache.backends import FallbackCache
+from main.cache.backends import FallbackCache, LRUFileBasedCache
 
 
 @dataclass
@@ -85,3 +86,20 @@ def test_fallback_cache_set(mock_caches, settings, cache_timeout, kwargs):
         mock_cache.set.assert_called_once_with(
             "key", "value", timeout=expected_timeout, version=expected_version
         )
+
+
+def test_lru_file_based_cache(tmp_path):
+    """LRUFileBasedCache should evict the least recently used entries"""
+    cache = LRUFileBasedCache(
+        str(tmp_path), {"OPTIONS": {"MAX_ENTRIES": 3, "CULL_FREQUENCY": 3}}
+    )
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.set(key, key)
+        os.utime(cache._key_to_file(key), (index, index))  # noqa: SLF001
+
+    assert cache.get("a") == "a"
+    assert cache.get("missing", "default") == "default"
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ["a", "c", "d"]] == ["a", "c", "d"]
@@ -0,0 +1,195 @@
+"""Page caching that serves stale pages while a single request refreshes them"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.middleware.cache import CacheMiddleware
+from django.utils.cache import (
+    get_cache_key,
+    get_max_age,
+    has_vary_header,
+    learn_cache_key,
+    patch_response_headers,
+)
+from django.utils.decorators import decorator_from_middleware_with_args
+
+# How often a request waiting on another request to render a page checks for it
+LOCK_POLL_INTERVAL = 0.05
+
+# Prepended to key prefixes so entries never share keys with pages cached by
+# django's cache_page, which are plain responses rather than entry dicts
+ENTRY_KEY_PREFIX = "swr"
+
+
+def get_cache_generation_key(key_prefix):
+    """Get the cache key holding the current generation of a cache_page key prefix"""
+    return f"cache_generation.{key_prefix}"
+
+
+class StaleWhileRevalidateCacheMiddleware(CacheMiddleware):
+    """
+    Cache middleware that keeps pages for stale_timeout seconds past their timeout
+    and after their key prefix moves to a new generation. A stale page is served
+    while a single request, holding a short lock, renders a fresh one. Concurrent
+    misses for the same page wait for the request holding the lock.
+    """
+
+    def __init__(
+        self,
+        get_response,
+        cache_timeout=None,
+        page_timeout=None,
+        stale_timeout=None,
+        lock_timeout=None,
+        **kwargs,
+    ):
+        super().__init__(get_response, cache_timeout, page_timeout, **kwargs)
+        self.stale_timeout = (
+            settings.SEARCH_PAGE_CACHE_STALE_DURATION
+            if stale_timeout is None
+            else stale_timeout
+        )
+        self.lock_timeout = (
+            settings.SEARCH_PAGE_CACHE_LOCK_TIMEOUT
+            if lock_timeout is None
+            else lock_timeout
+        )
+        self.entry_key_prefix = f"{ENTRY_KEY_PREFIX}.{self.key_prefix}"
+
+    def _get_generation(self):
+        """Get the current generation of the key prefix"""
+        return self.cache.get(get_cache_generation_key(self.key_prefix), 0)
+
+    def _get_lock_key(self, request):
+        """Get the key of the lock held by the request rendering a page"""
+        url = hashlib.md5(  # noqa: S324
+            request.build_absolute_uri().encode("ascii")
+        ).hexdigest()
+        return f"cache_page_lock.{self.key_prefix}.{url}"
+
+    def _get_entry(self, request):
+        """Get the cached page and its freshness for a request"""
+        cache_key = get_cache_key(
+            request, self.entry_key_prefix, "GET", cache=self.cache
+        )
+        if cache_key is None:
+            return None
+        entry = self.cache.get(cache_key)
+        # Anything else was not written by this middleware, treat it as a miss
+        return entry if isinstance(entry, dict) else None
+
+    def _release_lock(self, request):
+        """Release the lock if this request holds it"""
+        lock_key = getattr(request, "_cache_lock_key", None)
+        if lock_key:
+            self.cache.delete(lock_key)
+            request._cache_lock_key = None  # noqa: SLF001
+
+    def _wait_for_entry(self, request, lock_key):
+        """Wait for the request holding the lock to cache the page"""
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            entry = self._get_entry(request)
+            if entry is not None:
+                return entry
+            if not self.cache.has_key(lock_key):
+                break
+        return None
+
+    def process_request(self, request):
+        """
+        Return the cached page if it is fresh. Otherwise take the lock and render
+        it, or serve the stale page or wait for it if another request has the lock.
+        """
+        if request.method not in ("GET", "HEAD"):
+            request._cache_update_cache = False  # noqa: SLF001
+            return None
+
+        generation = self._get_generation()
+        request._cache_generation = generation  # noqa: SLF001
+        entry = self._get_entry(request)
+        if (
+            entry is not None
+            and entry["generation"] == generation
+            and entry["fresh_until"] > time.time()
+        ):
+            request._cache_update_cache = False  # noqa: SLF001
+            return entry["response"]
+
+        lock_key = self._get_lock_key(request)
+        if self.cache.add(lock_key, 1, self.lock_timeout):
+            request._cache_lock_key = lock_key  # noqa: SLF001
+            request._cache_update_cache = True  # noqa: SLF001
+            return None
+
+        if entry is None:
+            entry = self._wait_for_entry(request, lock_key)
+        if entry is not None:
+            request._cache_update_cache = False  # noqa: SLF001
+            return entry["response"]
+
+        # The other request failed or is too slow, render the page here too
+        request._cache_update_cache = True  # noqa: SLF001
+        return None
+
+    def process_response(self, request, response):
+        """Cache the page along with the time it stays fresh until"""
+        if not self._should_update_cache(request, response):
+            return response
+
+        timeout = self.page_timeout
+        if timeout is None:
+            timeout = get_max_age(response)
+            if timeout is None:
+                timeout = self.cache_timeout
+        if (
+            not timeout
+            or response.streaming
+            or response.status_code != 200  # noqa: PLR2004
+            or (
+                not request.COOKIES
+                and response.cookies
+                and has_vary_header(response, "Cookie")
+            )
+            or "private" in response.get("Cache-Control", ())
+        ):
+            self._release_lock(request)
+            return response
+
+        patch_response_headers(response, timeout)
+        cache_timeout = timeout + self.stale_timeout
+        cache_key = learn_cache_key(
+            request, response, cache_timeout, self.entry_key_prefix, cache=self.cache
+        )
+        entry = {
+            "generation": request._cache_generation,  # noqa: SLF001
+            "fresh_until": time.time() + timeout,
+        }
+
+        def _store(rendered):
+            self.cache.set(cache_key, {**entry, "response": rendered}, cache_timeout)
+            self._release_lock(request)
+
+        if hasattr(response, "render") and callable(response.render):
+            response.add_post_render_callback(_store)
+        else:
+            _store(response)
+        return response
+
+    def process_exception(self, request, exception):  # noqa: ARG002
+        """Release the lock if the page could not be rendered"""
+        self._release_lock(request)
+
+
+def cache_page_stale_while_revalidate(timeout, *, cache=None, key_prefix=None):
+    """
+    Like django's cache_page, but serves stale pages while a single request
+    refreshes them
+    """
+    return decorator_from_middleware_with_args(StaleWhileRevalidateCacheMiddleware)(
+        page_timeout=timeout,
+        cache_alias=cache,
+        key_prefix=key_prefix,
+    )
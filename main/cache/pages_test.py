@@ -0,0 +1,110 @@
+"""Tests for stale-while-revalidate page caching"""
+
+import pytest
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import learn_cache_key
+
+from main.cache.pages import (
+    StaleWhileRevalidateCacheMiddleware,
+    cache_page_stale_while_revalidate,
+    get_cache_generation_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def _locmem_cache(settings):
+    """Use a local memory cache for pages"""
+    settings.CACHES = {
+        **settings.CACHES,
+        "pages": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-pages",
+        },
+    }
+    settings.SEARCH_PAGE_CACHE_LOCK_TIMEOUT = 1
+    yield
+    caches["pages"].clear()
+
+
+@pytest.fixture
+def page_view():
+    """Return a cached view that counts how many times it rendered"""
+    calls = []
+
+    def view(request):
+        calls.append(1)
+        return HttpResponse(str(len(calls)))
+
+    return cache_page_stale_while_revalidate(60, cache="pages", key_prefix="test")(view)
+
+
+def lock_page(request):
+    """Take the lock for a page, as if another request were rendering it"""
+    middleware = StaleWhileRevalidateCacheMiddleware(
+        lambda _request: None, cache_alias="pages", key_prefix="test"
+    )
+    assert caches["pages"].add(middleware._get_lock_key(request), 1)  # noqa: SLF001
+
+
+def test_cache_page_fresh(rf, page_view):
+    """A fresh page should be served from the cache"""
+    request = rf.get("/page/")
+    assert page_view(request).content == b"1"
+    assert page_view(request).content == b"1"
+    assert page_view(rf.get("/page/?q=1")).content == b"2"
+
+
+def test_cache_page_stale_while_locked(rf, page_view):
+    """A stale page should be served while another request refreshes it"""
+    request = rf.get("/page/")
+    assert page_view(request).content == b"1"
+    caches["pages"].set(get_cache_generation_key("test"), "new")
+
+    lock_page(request)
+    assert page_view(request).content == b"1"
+
+    caches["pages"].clear()
+    assert page_view(request).content == b"2"
+    caches["pages"].set(get_cache_generation_key("test"), "newer")
+    assert page_view(request).content == b"3"
+    assert page_view(request).content == b"3"
+
+
+def test_cache_page_miss_waits(rf, page_view, mocker):
+    """A miss should wait for the request holding the lock to cache the page"""
+    request = rf.get("/page/")
+    lock_page(request)
+
+    def finish_other_request(_seconds):
+        caches["pages"].clear()
+        assert page_view(request).content == b"1"
+
+    sleep_mock = mocker.patch(
+        "main.cache.pages.time.sleep", side_effect=finish_other_request
+    )
+    assert page_view(request).content == b"1"
+    sleep_mock.assert_called_once()
+    assert page_view(request).content == b"1"
+
+
+def test_cache_page_lock_timeout(rf, page_view, mocker):
+    """A miss should render the page itself if the lock is not released in time"""
+    mocker.patch("main.cache.pages.time.sleep")
+    mocker.patch("main.cache.pages.time.monotonic", side_effect=[0, 0.5, 2])
+    request = rf.get("/page/")
+    lock_page(request)
+    assert page_view(request).content == b"1"
+
+
+def test_cache_page_ignores_plain_responses(rf, page_view):
+    """Pages cached by django's cache_page under the same prefix should be ignored"""
+    request = rf.get("/page/")
+    legacy_response = HttpResponse("legacy")
+    for key_prefix in ("test", "swr.test"):
+        cache_key = learn_cache_key(
+            request, legacy_response, 60, key_prefix, cache=caches["pages"]
+        )
+        caches["pages"].set(cache_key, legacy_response, 60)
+    assert page_view(request).content == b"1"
+    assert page_view(request).content == b"1"
@@ -11,5 +11,5 @@ class Command(BaseCommand):
     help = "Command to clear the cache"
 
     def handle(self, *args, **options):  # noqa: ARG002
-        cache_items = clear_search_cache()
-        self.stdout.write(f"cleared {cache_items} items from cache")
+        generation = clear_search_cache()
+        self.stdout.write(f"cleared search cache, new generation is {generation}")
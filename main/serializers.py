@@ -1,6 +1,9 @@
 """Common DRF serializers"""
 
+from django.db import models
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 
 COMMON_IGNORED_FIELDS = ("created_on", "updated_on")
 
@@ -16,3 +19,68 @@ class WriteableSerializerMethodField(serializers.SerializerMethodField):
 
     def to_internal_value(self, data):
         return data
+
+
+def _compile_field(field):
+    """Return a function that returns the representation of a field's attribute"""
+    if isinstance(field, serializers.ListSerializer):
+        compiled_child = _compile_field(field.child)
+
+        def represent_list(data):
+            iterable = (
+                data.all() if isinstance(data, models.manager.BaseManager) else data
+            )
+            return [compiled_child(item) for item in iterable]
+
+        return represent_list
+    if (
+        isinstance(field, serializers.Serializer)
+        and type(field).to_representation is serializers.Serializer.to_representation
+    ):
+        return compile_serializer(field)
+    return field.to_representation
+
+
+def compile_serializer(serializer, field_overrides=None):
+    """
+    Compile a serializer into a function that returns the same data as its
+    to_representation, for serializing many instances quickly.
+
+    The fields of the serializer and its nested serializers are built once, so the
+    returned function does not instantiate serializers or fields per instance.
+    Nested serializers with a custom to_representation are called as they are.
+
+    Args:
+        serializer (Serializer): A serializer instance, without data
+        field_overrides (dict): Functions to use instead of the to_representation
+            of some fields, by field name. They must return the same data.
+
+    Returns:
+        function: A function of an instance that returns its representation
+    """
+    field_overrides = field_overrides or {}
+    compiled_fields = [
+        (
+            field.field_name,
+            field.get_attribute,
+            field_overrides.get(field.field_name) or _compile_field(field),
+        )
+        for field in serializer._readable_fields  # noqa: SLF001
+    ]
+
+    def represent(instance):
+        data = {}
+        for field_name, get_attribute, to_representation in compiled_fields:
+            try:
+                attribute = get_attribute(instance)
+            except SkipField:
+                continue
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            )
+            data[field_name] = (
+                None if check_for_none is None else to_representation(attribute)
+            )
+        return data
+
+    return represent
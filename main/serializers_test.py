@@ -0,0 +1,82 @@
+"""Tests for common serializers"""
+
+from rest_framework import serializers
+
+from main.serializers import compile_serializer
+
+
+class ChildSerializer(serializers.Serializer):
+    """Nested serializer for tests"""
+
+    name = serializers.CharField()
+    price = serializers.DecimalField(max_digits=5, decimal_places=2)
+
+
+class UpperSerializer(serializers.Serializer):
+    """Nested serializer with a custom to_representation"""
+
+    def to_representation(self, instance):
+        return instance.upper()
+
+
+class ParentSerializer(serializers.Serializer):
+    """Serializer with nested, many, method and optional fields for tests"""
+
+    id = serializers.IntegerField()
+    title = serializers.CharField(source="info.title", allow_null=True)
+    child = ChildSerializer(allow_null=True)
+    children = ChildSerializer(many=True)
+    tags = serializers.ListField(child=serializers.CharField())
+    label = UpperSerializer(source="title")
+    summary = serializers.SerializerMethodField()
+    optional = serializers.CharField(required=False)
+
+    def get_summary(self, instance):
+        """Return a summary of the instance"""
+        return f"{instance['id']}: {len(instance['children'])} children"
+
+
+def test_compile_serializer():
+    """The compiled serializer should return the same data as the serializer"""
+    instances = [
+        {
+            "id": 1,
+            "title": "first",
+            "info": {"title": "First"},
+            "child": {"name": "a", "price": "1.5"},
+            "children": [{"name": "b", "price": 2}, {"name": "c", "price": "3.25"}],
+            "tags": ["x", 1],
+        },
+        {
+            "id": 2,
+            "title": "second",
+            "info": {},
+            "child": None,
+            "children": [],
+            "tags": [],
+            "optional": "here",
+        },
+    ]
+    represent = compile_serializer(ParentSerializer())
+    for instance in instances:
+        assert represent(instance) == ParentSerializer(instance).data
+        assert list(represent(instance)) == list(ParentSerializer(instance).data)
+
+
+def test_compile_serializer_overrides():
+    """Field overrides should replace the representation of their fields"""
+    instance = {
+        "id": 1,
+        "title": "first",
+        "info": {"title": "First"},
+        "child": None,
+        "children": [],
+        "tags": [],
+    }
+    represent = compile_serializer(
+        ParentSerializer(), field_overrides={"summary": lambda _instance: "custom"}
+    )
+    assert represent(instance) == {
+        **ParentSerializer(instance).data,
+        "summary": "custom",
+    }
@@ -157,6 +157,7 @@ MIDDLEWARE = (
     "hijack.middleware.HijackUserMiddleware",
     "oauth2_provider.middleware.OAuth2TokenMiddleware",
     "django_scim.middleware.SCIMAuthCheckMiddleware",
+    "learning_resources_search.middleware.DeferredIndexUpdatesMiddleware",
 )
 
 # CORS
@@ -575,6 +576,13 @@ CACHES = {
         "LOCATION": "imagekit_cache",
         "TIMEOUT": None,
     },
+    # text extracted by tika, keyed by the checksum of the document
+    "extracted_text": {
+        "BACKEND": "main.cache.backends.LRUFileBasedCache",
+        "LOCATION": TIKA_CACHE_DIR,  # noqa: F405
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": TIKA_CACHE_MAX_ENTRIES},  # noqa: F405
+    },
 }
 
 # OpenSearch
@@ -592,12 +600,21 @@ if not OPENSEARCH_INDEX:
     raise ImproperlyConfigured(msg)
 OPENSEARCH_HTTP_AUTH = get_string("OPENSEARCH_HTTP_AUTH", None)
 OPENSEARCH_CONNECTIONS_PER_NODE = get_int("OPENSEARCH_CONNECTIONS_PER_NODE", 10)
+OPENSEARCH_ALIAS_WRITE_WORKERS = get_int("OPENSEARCH_ALIAS_WRITE_WORKERS", 4)
 OPENSEARCH_DEFAULT_TIMEOUT = get_int("OPENSEARCH_DEFAULT_TIMEOUT", 10)
 OPENSEARCH_INDEXING_CHUNK_SIZE = get_int("OPENSEARCH_INDEXING_CHUNK_SIZE", 100)
 OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE = get_int(
     "OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE",
     get_int("OPENSEARCH_INDEXING_CHUNK_SIZE", 100),
 )
+OPENSEARCH_INDEXING_WAVE_SIZE = get_int("OPENSEARCH_INDEXING_WAVE_SIZE", 1000)
+OPENSEARCH_PERCOLATE_BATCH_SIZE = get_int("OPENSEARCH_PERCOLATE_BATCH_SIZE", 100)
+OPENSEARCH_SEARCH_CURSOR_KEEP_ALIVE = get_string(
+    "OPENSEARCH_SEARCH_CURSOR_KEEP_ALIVE", "1m"
+)
+OPENSEARCH_QUERY_TEMPLATE_CACHE_SIZE = get_int(
+    "OPENSEARCH_QUERY_TEMPLATE_CACHE_SIZE", 1000
+)
 OPENSEARCH_MIN_QUERY_SIZE = get_int("OPENSEARCH_MIN_QUERY_SIZE", 2)
 OPENSEARCH_MAX_SUGGEST_HITS = get_int("OPENSEARCH_MAX_SUGGEST_HITS", 1)
 OPENSEARCH_MAX_SUGGEST_RESULTS = get_int("OPENSEARCH_MAX_SUGGEST_RESULTS", 1)
@@ -666,6 +683,12 @@ MIDDLEWARE_FEATURE_FLAG_COOKIE_MAX_AGE_SECONDS = get_int(
     "MIDDLEWARE_FEATURE_FLAG_COOKIE_MAX_AGE_SECONDS", 60 * 60
 )
 SEARCH_PAGE_CACHE_DURATION = get_int("SEARCH_PAGE_CACHE_DURATION", 60 * 60 * 24)
+SEARCH_PAGE_CACHE_STALE_DURATION = get_int(
+    "SEARCH_PAGE_CACHE_STALE_DURATION", 60 * 60 * 24
+)
+SEARCH_PAGE_CACHE_LOCK_TIMEOUT = get_int("SEARCH_PAGE_CACHE_LOCK_TIMEOUT", 10)
+SEARCH_AGGREGATION_CACHE_DURATION = get_int("SEARCH_AGGREGATION_CACHE_DURATION", 60 * 5)
+SEARCH_RECENT_VIEWS_DAYS = get_int("SEARCH_RECENT_VIEWS_DAYS", 30)
 if MIDDLEWARE_FEATURE_FLAG_QS_PREFIX:
     MIDDLEWARE = (
         *MIDDLEWARE,
@@ -763,6 +786,10 @@ POSTHOG_PROJECT_ID = get_int(
     name="POSTHOG_PROJECT_ID",
     default=None,
 )
+POSTHOG_EVENT_LOAD_BATCH_SIZE = get_int(
+    name="POSTHOG_EVENT_LOAD_BATCH_SIZE",
+    default=1000,
+)
 
 # Enable or disable search engine indexing
 MITOL_NOINDEX = get_bool("MITOL_NOINDEX", True)  # noqa: FBT003
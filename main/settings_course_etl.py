@@ -2,6 +2,9 @@
 Django settings specific to learning_resources ingestion
 """
 
+import os
+import tempfile
+
 from main.envs import get_bool, get_int, get_string
 
 # EDX API Credentials
@@ -24,6 +27,7 @@ OCW_ITERATOR_CHUNK_SIZE = get_int("OCW_ITERATOR_CHUNK_SIZE", 1000)
 OCW_SKIP_CONTENT_FILES = get_bool("OCW_SKIP_CONTENT_FILES", default=False)
 OCW_WEBHOOK_KEY = get_string("OCW_WEBHOOK_KEY", None)
 OCW_OFFLINE_DELIVERY = get_bool("OCW_OFFLINE_DELIVERY", default=False)
+OCW_S3_CONCURRENCY = get_int("OCW_S3_CONCURRENCY", 8)
 MAX_S3_GET_ITERATIONS = get_int("MAX_S3_GET_ITERATIONS", 3)
 
 
@@ -46,6 +50,9 @@ PROLEARN_CATALOG_API_URL = get_string("PROLEARN_CATALOG_API_URL", None)
 # Iterator chunk size for MITx and xPRO courses
 LEARNING_COURSE_ITERATOR_CHUNK_SIZE = get_int("LEARNING_COURSE_ITERATOR_CHUNK_SIZE", 20)
 
+# Number of records upserted together when an ETL loads in bulk
+ETL_BULK_LOAD_CHUNK_SIZE = get_int("ETL_BULK_LOAD_CHUNK_SIZE", 500)
+
 # xPRO settings for course/resource ingestion
 XPRO_LEARNING_COURSE_BUCKET_NAME = get_string("XPRO_LEARNING_COURSE_BUCKET_NAME", None)
 XPRO_CATALOG_API_URL = get_string("XPRO_CATALOG_API_URL", None)
@@ -84,6 +91,12 @@ OPEN_VIDEO_USER_LIST_OWNER = get_string("OPEN_VIDEO_USER_LIST_OWNER", None)
 OPEN_VIDEO_MAX_TOPICS = get_int("OPEN_VIDEO_MAX_TOPICS", 3)
 OPEN_VIDEO_MIN_TERM_FREQ = get_int("OPEN_VIDEO_MIN_TERM_FREQ", 1)
 OPEN_VIDEO_MIN_DOC_FREQ = get_int("OPEN_VIDEO_MIN_DOC_FREQ", 15)
+OPEN_VIDEO_SIMILAR_TOPICS_BATCH_SIZE = get_int(
+    "OPEN_VIDEO_SIMILAR_TOPICS_BATCH_SIZE", 50
+)
+OPEN_VIDEO_SIMILAR_TOPICS_CACHE_TIMEOUT = get_int(
+    "OPEN_VIDEO_SIMILAR_TOPICS_CACHE_TIMEOUT", 60 * 60 * 24 * 7
+)
 
 YOUTUBE_DEVELOPER_KEY = get_string("YOUTUBE_DEVELOPER_KEY", None)
 YOUTUBE_CONFIG_URL = get_string("YOUTUBE_CONFIG_URL", None)
@@ -94,5 +107,12 @@ OPEN_PODCAST_DATA_BRANCH = get_string("OPEN_PODCAST_DATA_BRANCH", "master")
 # Tika settings
 TIKA_ACCESS_TOKEN = get_string("TIKA_ACCESS_TOKEN", None)
 TIKA_TIMEOUT = get_int("TIKA_TIMEOUT", 60)
+TIKA_CONCURRENCY = get_int("TIKA_CONCURRENCY", 4)
+TIKA_MAX_RETRIES = get_int("TIKA_MAX_RETRIES", 2)
+TIKA_CACHE_DIR = get_string(
+    "TIKA_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "tika_cache"),  # noqa: PTH118
+)
+TIKA_CACHE_MAX_ENTRIES = get_int("TIKA_CACHE_MAX_ENTRIES", 20000)
 TIKA_OCR_STRATEGY = get_string("TIKA_OCR_STRATEGY", "no_ocr")
 SKIP_TIKA = get_bool("SKIP_TIKA", default=False)
@@ -7,14 +7,18 @@ from enum import Flag, auto
 from functools import wraps
 from itertools import islice
 from urllib.parse import urljoin
+from uuid import uuid4
 
 import markdown2
 from bs4 import BeautifulSoup
 from django.conf import settings
 from django.core.cache import caches
-from django.views.decorators.cache import cache_page
 from nh3 import nh3
 
+from main.cache.pages import (
+    cache_page_stale_while_revalidate,
+    get_cache_generation_key,
+)
 from main.constants import ALLOWED_HTML_ATTRIBUTES, ALLOWED_HTML_TAGS
 
 log = logging.getLogger(__name__)
@@ -23,14 +27,18 @@ log = logging.getLogger(__name__)
 IMAGE_PATH_MAX_LENGTH = 100
 
 
+# Cached search pages are stored under this key prefix
+SEARCH_CACHE_KEY_PREFIX = "search"
+
+
 def cache_page_for_anonymous_users(*cache_args, **cache_kwargs):
     def inner_decorator(func):
         @wraps(func)
         def inner_function(request, *args, **kwargs):
             if not request.user.is_authenticated:
-                return cache_page(*cache_args, **cache_kwargs)(func)(
-                    request, *args, **kwargs
-                )
+                return cache_page_stale_while_revalidate(*cache_args, **cache_kwargs)(
+                    func
+                )(request, *args, **kwargs)
             return func(request, *args, **kwargs)
 
         return inner_function
@@ -42,7 +50,7 @@ def cache_page_for_all_users(*cache_args, **cache_kwargs):
     def inner_decorator(func):
         @wraps(func)
         def inner_function(request, *args, **kwargs):
-            return cache_page(*cache_args, **cache_kwargs)(func)(
+            return cache_page_stale_while_revalidate(*cache_args, **cache_kwargs)(func)(
                 request, *args, **kwargs
             )
 
@@ -355,12 +363,24 @@ def clean_data(data: str) -> str:
     return ""
 
 
+def get_search_cache_generation():
+    """
+    Get the current generation of the search cache, which changes whenever
+    clear_search_cache is called
+    """
+    return caches["redis"].get(get_cache_generation_key(SEARCH_CACHE_KEY_PREFIX), 0)
+
+
 def clear_search_cache():
-    cache = caches["redis"]
-    cleared = 0
-    if hasattr(cache, "keys"):
-        search_keys = cache.keys("views.decorators.cache.cache_page.search.*")
-        cleared += cache.delete_many(search_keys) or 0
-        search_keys = cache.keys("views.decorators.cache.cache_header.search.*")
-        cleared += cache.delete_many(search_keys) or 0
-    return cleared
+    """
+    Invalidate all cached search pages by moving the search key prefix to a new
+    generation. Pages cached under older generations expire on their own.
+
+    Returns:
+        str: The new generation
+    """
+    generation = uuid4().hex
+    caches["redis"].set(
+        get_cache_generation_key(SEARCH_CACHE_KEY_PREFIX), generation, timeout=None
+    )
+    return generation
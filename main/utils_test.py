@@ -6,15 +6,22 @@ from tempfile import NamedTemporaryFile
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.http import HttpResponse
 
 from main.factories import UserFactory
 from main.utils import (
+    cache_page_for_all_users,
     chunks,
     clean_data,
+    clear_search_cache,
     extract_values,
     filter_dict_keys,
     filter_dict_with_renamed_keys,
     frontend_absolute_url,
+    get_cache_generation_key,
+    get_search_cache_generation,
     html_to_plain_text,
     is_near_now,
     markdown_to_plain_text,
@@ -241,3 +248,44 @@ def test_frontend_absolute_url(settings):
 def test_clean_data(input_text, output_text):
     """clean_data function should return expected output"""
     assert clean_data(input_text) == output_text
+
+
+@pytest.fixture
+def _locmem_redis_cache(settings):
+    """Use a local memory cache in place of redis"""
+    settings.CACHES = {
+        **settings.CACHES,
+        "redis": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-redis",
+        },
+    }
+    yield
+    caches["redis"].clear()
+
+
+@pytest.mark.usefixtures("_locmem_redis_cache")
+def test_clear_search_cache(rf):
+    """clear_search_cache should invalidate pages cached under the search prefix only"""
+    calls = []
+
+    def view(request):
+        calls.append(1)
+        return HttpResponse(str(len(calls)))
+
+    search_view = cache_page_for_all_users(60, cache="redis", key_prefix="search")(view)
+    other_view = cache_page_for_all_users(60, cache="redis", key_prefix="other")(view)
+    request = rf.get("/search/")
+    request.user = AnonymousUser()
+
+    assert search_view(request).content == b"1"
+    assert search_view(request).content == b"1"
+    assert other_view(request).content == b"2"
+
+    assert get_search_cache_generation() == 0
+    generation = clear_search_cache()
+    assert caches["redis"].get(get_cache_generation_key("search")) == generation
+    assert get_search_cache_generation() == generation
+    assert search_view(request).content == b"3"
+    assert search_view(request).content == b"3"
+    assert other_view(request).content == b"2"